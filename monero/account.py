@@ -1,5 +1,5 @@
 from . import const
-from .transaction import PaymentManager
+from .transaction import AsyncPaymentManager, PaymentManager
 
 
 class Account(object):
@@ -82,12 +82,7 @@ class Account(object):
         indices = None
         _addresses = self.addresses()
         if addresses is not None:
-            indices = []
-            for addr in addresses:
-                if isinstance(addr, int):
-                    indices.append(addr)
-                else:
-                    indices.append(_addresses.index(addr))
+            indices = _address_indices(addresses, _addresses)
         return self._backend.address_balance(account=self.index, indices=indices)
 
     def transfer(
@@ -196,3 +191,106 @@ class Account(object):
             account=self.index,
             relay=relay,
         )
+
+
+class AsyncAccount(Account):
+    """Monero account operated through an asynchronous backend.
+
+    Provides the same interface as :class:`Account`, but all methods are coroutines.
+    Accounts of an :class:`AsyncWallet <monero.wallet.AsyncWallet>` are of this class.
+
+    :param backend: an asynchronous wallet backend
+    :param index: the account's index within the wallet
+    :param label: optional account label as `str`
+    """
+
+    def __init__(self, backend, index, label=None):
+        super(AsyncAccount, self).__init__(backend, index, label=label)
+        self.incoming = AsyncPaymentManager(index, backend, "in")
+        self.outgoing = AsyncPaymentManager(index, backend, "out")
+
+    async def balances(self):
+        return await self._backend.balances(account=self.index)
+
+    async def balance(self, unlocked=False):
+        return (await self._backend.balances(account=self.index))[1 if unlocked else 0]
+
+    async def address(self):
+        return (await self._backend.addresses(account=self.index, addr_indices=[0]))[0]
+
+    async def addresses(self):
+        return await self._backend.addresses(account=self.index)
+
+    async def new_address(self, label=None):
+        return await self._backend.new_address(account=self.index, label=label)
+
+    async def address_balance(self, addresses=None):
+        indices = None
+        _addresses = await self.addresses()
+        if addresses is not None:
+            indices = _address_indices(addresses, _addresses)
+        return await self._backend.address_balance(account=self.index, indices=indices)
+
+    async def transfer(
+        self,
+        address,
+        amount,
+        priority=const.PRIO_NORMAL,
+        payment_id=None,
+        unlock_time=0,
+        relay=True,
+    ):
+        return await self._backend.transfer(
+            [(address, amount)],
+            priority,
+            payment_id,
+            unlock_time,
+            account=self.index,
+            relay=relay,
+        )
+
+    async def transfer_multiple(
+        self,
+        destinations,
+        priority=const.PRIO_NORMAL,
+        payment_id=None,
+        unlock_time=0,
+        relay=True,
+    ):
+        return await self._backend.transfer(
+            destinations,
+            priority,
+            payment_id,
+            unlock_time,
+            account=self.index,
+            relay=relay,
+        )
+
+    async def sweep_all(
+        self,
+        address,
+        priority=const.PRIO_NORMAL,
+        payment_id=None,
+        subaddr_indices=None,
+        unlock_time=0,
+        relay=True,
+    ):
+        return await self._backend.sweep_all(
+            address,
+            priority,
+            payment_id,
+            subaddr_indices,
+            unlock_time,
+            account=self.index,
+            relay=relay,
+        )
+
+
+def _address_indices(addresses, _addresses):
+    indices = []
+    for addr in addresses:
+        if isinstance(addr, int):
+            indices.append(addr)
+        else:
+            indices.append(_addresses.index(addr))
+    return indices
@@ -1,4 +1,5 @@
-from binascii import hexlify, unhexlify
+from binascii import hexlify
+import functools
 import re
 import struct
 
@@ -14,10 +15,19 @@ _ADDR_REGEX = re.compile(
 _IADDR_REGEX = re.compile(
     r"^[123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz]{106}$"
 )
+_ADDRESS_CACHE_SIZE = 4096
 
 
 class BaseAddress(object):
-    label = None
+    """Base class of Monero addresses.
+
+    Instances are immutable. They hold the raw decoded data (69 or 77 bytes), compare
+    to each other by it and are hashed by it. The base58 representation is computed only
+    when needed and kept for later use. An address compares equal to its string, but it
+    doesn't hash like it, so sets and dicts should not mix addresses with strings.
+    """
+
+    __slots__ = ("_decoded", "_str", "label")
 
     def __init__(self, addr, label=None):
         addr = addr.decode() if isinstance(addr, bytes) else str(addr)
@@ -27,7 +37,21 @@ class BaseAddress(object):
                 "is {addr} ({len} chars length)".format(addr=addr, len=len(addr))
             )
         self._decode(addr)
-        self.label = label or self.label
+        object.__setattr__(self, "label", label or None)
+
+    @classmethod
+    def _from_bytes(cls, data, label=None):
+        # builds the address from already validated raw data, skipping base58 encoding
+        if data[0] not in cls._valid_netbytes:
+            raise ValueError("Invalid address netbyte {nb}".format(nb=data[0]))
+        obj = cls.__new__(cls)
+        object.__setattr__(obj, "_decoded", bytes(data))
+        object.__setattr__(obj, "_str", None)
+        object.__setattr__(obj, "label", label or None)
+        return obj
+
+    def _with_label(self, label):
+        return self._from_bytes(self._decoded, label=label)
 
     def view_key(self):
         """Returns public view key.
@@ -48,28 +72,52 @@ class BaseAddress(object):
         return const.NETS[self._valid_netbytes.index(self._decoded[0])]
 
     def _decode(self, address):
-        self._decoded = bytearray(unhexlify(base58.decode(address)))
-        checksum = self._decoded[-4:]
-        if checksum != keccak_256(self._decoded[:-4]).digest()[:4]:
+        decoded = base58.decode_bytes(address)
+        checksum = decoded[-4:]
+        if checksum != keccak_256(decoded[:-4]).digest()[:4]:
             raise ValueError("Invalid checksum in address {}".format(address))
-        if self._decoded[0] not in self._valid_netbytes:
+        if decoded[0] not in self._valid_netbytes:
             raise ValueError(
                 "Invalid address netbyte {nb}. Allowed values are: {allowed}".format(
-                    nb=self._decoded[0],
+                    nb=decoded[0],
                     allowed=", ".join(map(lambda b: "%02x" % b, self._valid_netbytes)),
                 )
             )
+        object.__setattr__(self, "_decoded", decoded)
+        object.__setattr__(self, "_str", address)
+
+    def __setattr__(self, name, value):
+        raise AttributeError(
+            "{cls} objects are immutable".format(cls=type(self).__name__)
+        )
+
+    def __delattr__(self, name):
+        raise AttributeError(
+            "{cls} objects are immutable".format(cls=type(self).__name__)
+        )
+
+    def __getstate__(self):
+        return (self._decoded, self.label)
+
+    def __setstate__(self, state):
+        object.__setattr__(self, "_decoded", state[0])
+        object.__setattr__(self, "_str", None)
+        object.__setattr__(self, "label", state[1])
 
     def __repr__(self):
-        return base58.encode(hexlify(self._decoded))
+        if self._str is None:
+            object.__setattr__(self, "_str", base58.encode_bytes(self._decoded))
+        return self._str
 
     def __eq__(self, other):
-        if isinstance(other, (BaseAddress, str)):
-            return str(self) == str(other)
+        if isinstance(other, BaseAddress):
+            return self._decoded == other._decoded
+        if isinstance(other, str):
+            return str(self) == other
         return super(BaseAddress, self).__eq__(other)
 
     def __hash__(self):
-        return hash(str(self))
+        return hash(self._decoded)
 
     def __format__(self, spec):
         return format(str(self), spec)
@@ -84,6 +132,7 @@ class Address(BaseAddress):
     :param label: a label for the address (defaults to `None`)
     """
 
+    __slots__ = ()
     _valid_netbytes = const.MASTERADDR_NETBYTES
 
     def check_private_view_key(self, key):
@@ -128,8 +177,8 @@ class Address(BaseAddress):
             + self._decoded[1:65]
             + struct.pack(">Q", int(payment_id))
         )
-        checksum = bytearray(keccak_256(data).digest()[:4])
-        return IntegratedAddress(base58.encode(hexlify(data + checksum)))
+        checksum = keccak_256(data).digest()[:4]
+        return IntegratedAddress._from_bytes(data + checksum)
 
 
 class SubAddress(BaseAddress):
@@ -138,6 +187,7 @@ class SubAddress(BaseAddress):
     Any type of address which is not the master one for a wallet.
     """
 
+    __slots__ = ()
     _valid_netbytes = const.SUBADDR_NETBYTES
 
     def with_payment_id(self, _):
@@ -150,6 +200,7 @@ class IntegratedAddress(Address):
     A master address integrated with payment id (short one, max 64 bit).
     """
 
+    __slots__ = ()
     _valid_netbytes = const.INTADDRR_NETBYTES
 
     def __init__(self, address):
@@ -160,6 +211,7 @@ class IntegratedAddress(Address):
                 "is {addr} ({len} chars length)".format(addr=address, len=len(address))
             )
         self._decode(address)
+        object.__setattr__(self, "label", None)
 
     def payment_id(self):
         """Returns the integrated payment id.
@@ -175,24 +227,49 @@ class IntegratedAddress(Address):
         prefix = const.MASTERADDR_NETBYTES[const.NETS.index(self.net)]
         data = bytearray([prefix]) + self._decoded[1:65]
         checksum = keccak_256(data).digest()[:4]
-        return Address(base58.encode(hexlify(data + checksum)))
+        return Address._from_bytes(data + checksum)
 
 
 def address(addr, label=None):
     """Discover the proper class and return instance for a given Monero address.
 
+    Recently parsed addresses are kept in a bounded cache, so recognizing the same address
+    again skips the decoding and checksum validation. Unless a label is given, the returned
+    instance is shared with other callers.
+
     :param addr: the address as a string-like object
     :param label: a label for the address (defaults to `None`)
 
     :rtype: :class:`Address`, :class:`SubAddress` or :class:`IntegratedAddress`
     """
     addr = addr.decode() if isinstance(addr, bytes) else str(addr)
+    result = _address(addr)
+    if label and not isinstance(result, IntegratedAddress):
+        result = result._with_label(label)
+    return result
+
+
+def address_cache_info():
+    """Returns statistics of the cache used by :func:`address`.
+
+    :rtype: `namedtuple` with `hits`, `misses`, `maxsize` and `currsize` fields
+    """
+    return _address.cache_info()
+
+
+def address_cache_clear():
+    """Empties the cache used by :func:`address` and resets its statistics."""
+    _address.cache_clear()
+
+
+@functools.lru_cache(maxsize=_ADDRESS_CACHE_SIZE)
+def _address(addr):
     if _ADDR_REGEX.match(addr):
-        netbyte = bytearray(unhexlify(base58.decode(addr)))[0]
+        netbyte = base58.decode_bytes(addr)[0]
         if netbyte in Address._valid_netbytes:
-            return Address(addr, label=label)
+            return Address(addr)
         elif netbyte in SubAddress._valid_netbytes:
-            return SubAddress(addr, label=label)
+            return SubAddress(addr)
         raise ValueError(
             "Invalid address netbyte {nb:x}. Allowed values are: {allowed}".format(
                 nb=netbyte,
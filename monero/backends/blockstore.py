@@ -0,0 +1,332 @@
+import binascii
+from datetime import datetime
+import json
+import logging
+import sqlite3
+import threading
+
+from .. import exceptions
+from ..block import Block
+from ..keccak import keccak_256
+from ..numbers import from_atomic, to_atomic
+from ..transaction import Transaction
+from ..transaction.serialization import parse_transaction
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS blocks (
+    height INTEGER PRIMARY KEY,
+    hash TEXT NOT NULL UNIQUE,
+    prev_hash TEXT,
+    timestamp INTEGER,
+    major_version INTEGER,
+    minor_version INTEGER,
+    difficulty INTEGER,
+    nonce INTEGER,
+    reward INTEGER,
+    blob BLOB
+);
+CREATE TABLE IF NOT EXISTS transactions (
+    hash TEXT PRIMARY KEY,
+    height INTEGER,
+    position INTEGER,
+    timestamp INTEGER,
+    pruned_blob BLOB NOT NULL,
+    prunable_hash TEXT,
+    output_indices TEXT
+);
+CREATE INDEX IF NOT EXISTS transactions_height ON transactions (height, position);
+"""
+_MAX_VARIABLES = 999
+# the number of headers compared at once while looking for the fork point
+_FORK_SEARCH_STEP = 100
+
+_log = logging.getLogger(__name__)
+
+
+class BlockStore(object):
+    """
+    A local store of blocks and pruned transactions, kept in a SQLite database.
+
+    The transactions are stored as pruned blobs, which hold everything needed to find and
+    decode outputs: the output keys with view tags, the extra field with the public keys
+    and the encrypted amounts with the commitments. Signatures and range proofs are
+    dropped.
+
+    Once the blocks have been downloaded with :meth:`sync`, the store may replace the daemon
+    backend, so that new view keys can be scanned without connecting to a node:
+
+    .. code-block:: python
+
+        store = BlockStore("blocks.sqlite")
+        store.sync(Daemon(host="192.168.0.50"), start_height=2900000)
+        scanner = BlockScanner(Daemon(backend=store), view_key, spend_pubkeys,
+                               start_height=2900000)
+
+    :param path: the database file
+    """
+
+    def __init__(self, path):
+        self.path = path
+        # the scanner fetches blocks in a thread, the lock serializes the access
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.executescript(_SCHEMA)
+        self._lock = threading.Lock()
+
+    def close(self):
+        """Closes the database."""
+        with self._lock:
+            self._db.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def add_block(self, blk):
+        """
+        Stores the block with its transactions, replacing any block stored at the same
+        height before. All transactions of the block must have a blob.
+
+        :param blk: :class:`Block <monero.block.Block>`
+        """
+        txs = [self._tx_row(tx, blk, pos) for pos, tx in enumerate(blk.transactions)]
+        with self._lock, self._db:
+            self._db.execute("DELETE FROM transactions WHERE height = ?", (blk.height,))
+            self._db.execute(
+                "INSERT OR REPLACE INTO blocks VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    blk.height,
+                    blk.hash,
+                    blk.prev_hash,
+                    _timestamp(blk.timestamp),
+                    blk.version[0] if blk.version else None,
+                    blk.version[1] if blk.version else None,
+                    blk.difficulty,
+                    blk.nonce,
+                    to_atomic(blk.reward) if blk.reward is not None else None,
+                    binascii.unhexlify(blk.blob) if blk.blob else None,
+                ),
+            )
+            self._db.executemany(
+                "INSERT OR REPLACE INTO transactions VALUES (?, ?, ?, ?, ?, ?, ?)", txs
+            )
+
+    def add_transactions(self, txs):
+        """
+        Stores transactions which don't belong to a stored block, or replaces stored ones.
+
+        :param txs: a sequence of :class:`Transaction <monero.transaction.Transaction>`
+                    having a blob
+        """
+        rows = [self._tx_row(tx) for tx in txs]
+        with self._lock, self._db:
+            self._db.executemany(
+                "INSERT OR REPLACE INTO transactions VALUES (?, ?, ?, ?, ?, ?, ?)", rows
+            )
+
+    def sync(self, daemon, start_height=None, end_height=None, confirmations=10):
+        """
+        Downloads blocks with their transactions from the daemon. By default it continues
+        from the top of the store up to the last block having `confirmations`, so that
+        the stored blocks are not likely to be orphaned by a reorganization.
+
+        Should a downloaded block not follow the stored chain anyway, the store finds
+        the fork point, removes the orphaned blocks with their transactions and continues
+        the download from there.
+
+        :param daemon: :class:`Daemon <monero.daemon.Daemon>`
+        :param start_height: the height of the first block to download
+        :param end_height: the height of the last block to download
+        :param confirmations: the number of confirmations a block needs to be stored,
+                    unless `end_height` is given
+        :rtype: int, the number of blocks stored
+        """
+        if start_height is None:
+            start_height = self.info()["height"]
+        if end_height is None:
+            end_height = daemon.height() - confirmations
+        stored = 0
+        height = start_height
+        prev_hash = self._block_hash(height - 1)
+        while height <= end_height:
+            blk = daemon.block(height=height)
+            if prev_hash is not None and blk.prev_hash != prev_hash:
+                height = self._fork_height(daemon, height - 1)
+                _log.warning(
+                    "Chain reorganization detected, removing blocks from {:d} on".format(
+                        height
+                    )
+                )
+                self._remove(height)
+                prev_hash = self._block_hash(height - 1)
+                continue
+            self.add_block(blk)
+            stored += 1
+            prev_hash = blk.hash
+            height += 1
+        return stored
+
+    def _block_hash(self, height):
+        with self._lock:
+            row = self._db.execute(
+                "SELECT hash FROM blocks WHERE height = ?", (height,)
+            ).fetchone()
+        return row[0] if row else None
+
+    def _fork_height(self, daemon, height):
+        """
+        Returns the height of the first stored block which is not on the chain of the daemon,
+        looking back from `height`.
+        """
+        while height >= 0:
+            start = max(height - _FORK_SEARCH_STEP + 1, 0)
+            chain = {
+                hdr["height"]: hdr["hash"] for hdr in daemon.headers(start, height)
+            }
+            with self._lock:
+                stored = dict(
+                    self._db.execute(
+                        "SELECT height, hash FROM blocks WHERE height BETWEEN ? AND ?",
+                        (start, height),
+                    ).fetchall()
+                )
+            for h in range(height, start - 1, -1):
+                if h not in stored or stored[h] == chain.get(h):
+                    return h + 1
+            height = start - 1
+        return 0
+
+    def _remove(self, height):
+        """Removes the blocks from `height` on, together with their transactions."""
+        with self._lock, self._db:
+            self._db.execute("DELETE FROM transactions WHERE height >= ?", (height,))
+            self._db.execute("DELETE FROM blocks WHERE height >= ?", (height,))
+
+    # The methods below make the store usable as a daemon backend.
+
+    def info(self):
+        with self._lock:
+            top = self._db.execute("SELECT MAX(height) FROM blocks").fetchone()[0]
+        return {"height": 0 if top is None else top + 1, "status": "OK"}
+
+    def mempool(self):
+        return []
+
+    def headers(self, start_height, end_height=None):
+        end_height = end_height or start_height
+        top = self.info()["height"] - 1
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT height, hash, prev_hash, timestamp, major_version, "
+                "minor_version, difficulty, nonce, reward FROM blocks "
+                "WHERE height BETWEEN ? AND ? ORDER BY height",
+                (start_height, end_height),
+            ).fetchall()
+        return [
+            {
+                "height": row[0],
+                "hash": row[1],
+                "prev_hash": row[2],
+                "timestamp": row[3],
+                "major_version": row[4],
+                "minor_version": row[5],
+                "difficulty": row[6],
+                "nonce": row[7],
+                "reward": row[8],
+                "depth": top - row[0],
+                "orphan_status": False,
+            }
+            for row in rows
+        ]
+
+    def block(self, bhash=None, height=None):
+        with self._lock:
+            if bhash is not None:
+                row = self._db.execute(
+                    "SELECT * FROM blocks WHERE hash = ?", (bhash,)
+                ).fetchone()
+            else:
+                row = self._db.execute(
+                    "SELECT * FROM blocks WHERE height = ?", (height,)
+                ).fetchone()
+            if row is None:
+                raise exceptions.BackendException(
+                    "Block {} not found in the store".format(bhash or height)
+                )
+            txs = self._db.execute(
+                "SELECT * FROM transactions WHERE height = ? AND position IS NOT NULL "
+                "ORDER BY position",
+                (row[0],),
+            ).fetchall()
+        return Block(
+            height=row[0],
+            hash=row[1],
+            prev_hash=row[2],
+            timestamp=_datetime(row[3]),
+            version=(row[4], row[5]),
+            difficulty=row[6],
+            nonce=row[7],
+            reward=from_atomic(row[8]) if row[8] is not None else None,
+            blob=binascii.hexlify(row[9]).decode() if row[9] else None,
+            transactions=[_transaction(tx) for tx in txs],
+        )
+
+    def blocks(self, heights):
+        return [self.block(height=height) for height in heights]
+
+    def transactions(self, hashes):
+        hashes = list(hashes)
+        txs = {}
+        with self._lock:
+            # keep below the limit of SQL variables of older SQLite versions
+            for i in range(0, len(hashes), _MAX_VARIABLES):
+                chunk = hashes[i : i + _MAX_VARIABLES]
+                rows = self._db.execute(
+                    "SELECT * FROM transactions WHERE hash IN ({})".format(
+                        ", ".join("?" * len(chunk))
+                    ),
+                    chunk,
+                ).fetchall()
+                txs.update((row[0], _transaction(row)) for row in rows)
+        return [txs[txhash] for txhash in hashes if txhash in txs]
+
+    def _tx_row(self, tx, blk=None, position=None):
+        blob = tx.blob or tx.pruned_blob
+        if not blob:
+            raise exceptions.TransactionWithoutBlob(
+                "Tx {} has no blob, hence it cannot be stored".format(tx.hash)
+            )
+        data = parse_transaction(blob)
+        prunable_hash = tx.prunable_hash
+        if len(blob) > data.base_size:
+            prunable_hash = keccak_256(blob[data.base_size :]).hexdigest()
+        timestamp = tx.timestamp or (blk.timestamp if blk else None)
+        return (
+            tx.hash,
+            blk.height if blk else tx.height,
+            position,
+            _timestamp(timestamp),
+            blob[: data.base_size],
+            prunable_hash,
+            json.dumps(tx.output_indices) if tx.output_indices is not None else None,
+        )
+
+
+def _transaction(row):
+    return Transaction(
+        hash=row[0],
+        height=row[1],
+        timestamp=_datetime(row[3]),
+        pruned_blob=row[4],
+        prunable_hash=row[5],
+        output_indices=json.loads(row[6]) if row[6] is not None else None,
+    )
+
+
+def _timestamp(dt):
+    return int(dt.timestamp()) if dt is not None else None
+
+
+def _datetime(ts):
+    return datetime.fromtimestamp(ts) if ts is not None else None
@@ -1,3 +1,20 @@
+import importlib
+
 from .wallet import JSONRPCWallet
 from .daemon import JSONRPCDaemon
 from .exceptions import RPCError, Unauthorized, MethodNotFound
+from .batch import JSONRPCBatch, BatchResult
+
+_ASYNC_CLASSES = {
+    "AsyncJSONRPCDaemon": "asyncdaemon",
+    "AsyncJSONRPCWallet": "asyncwallet",
+}
+
+
+def __getattr__(name):
+    # asynchronous backends are imported on first access, as they depend on aiohttp
+    try:
+        module = _ASYNC_CLASSES[name]
+    except KeyError:
+        raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+    return getattr(importlib.import_module("." + module, __name__), name)
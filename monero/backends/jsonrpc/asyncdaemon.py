@@ -0,0 +1,355 @@
+import asyncio
+import binascii
+import logging
+
+from ... import portable_storage
+from ...block import Block
+from .daemon import (
+    JSONRPCDaemon,
+    RESTRICTED_MAX_TRANSACTIONS,
+    UNRESTRICTED_MAX_TRANSACTIONS,
+    _batch_data,
+    _block_hash_key,
+    _chunks,
+)
+from .cache import MemoryCache
+from .exceptions import MethodNotFound
+from .codec import default_codec
+from .payload import LogPayload
+
+
+_log = logging.getLogger(__name__)
+
+
+class AsyncJSONRPCDaemon(JSONRPCDaemon):
+    """
+    Asynchronous JSON RPC backend for Monero daemon, built on `aiohttp`.
+
+    The backend provides the same methods as
+    :class:`JSONRPCDaemon <monero.backends.jsonrpc.JSONRPCDaemon>`, but all of them
+    must be awaited. Concurrent requests share a pool of HTTP connections, which should be
+    released by awaiting :meth:`close` or by using the backend as an asynchronous
+    context manager.
+
+    :param protocol: `http` or `https`
+    :param host: host name or IP
+    :param port: port number
+    :param path: path for JSON RPC requests (should not be changed)
+    :param timeout: request timeout
+    :param verify_ssl_certs: verify SSL certificates when connecting
+    :param proxy_url: a HTTP proxy to use
+    :param prune_transactions: whether to prune transaction data
+    :param transactions_chunk_size: the number of transactions requested at once, `None`
+                            meaning it depends on whether the server is :meth:`restricted`
+    :param decode_as_json: whether to have the daemon decode transactions to JSON
+    :param cache: a :class:`ResponseCache <monero.backends.jsonrpc.cache.ResponseCache>`
+                            for data which doesn't change anymore, `True` meaning
+                            a new :class:`MemoryCache <monero.backends.jsonrpc.cache.MemoryCache>`.
+                            Off by default.
+    :param cache_confirmations: the number of confirmations data needs to be cached
+    :param log_payload_limit: the maximal length of payloads in the debug log
+    :param json_codec: a :class:`JSONCodec <monero.backends.jsonrpc.codec.JSONCodec>`,
+                            `None` meaning the fastest one installed
+    :param connections: the maximal number of simultaneous connections
+    """
+
+    def __init__(
+        self,
+        protocol="http",
+        host="127.0.0.1",
+        port=18081,
+        path="/json_rpc",
+        user="",
+        password="",
+        timeout=30,
+        verify_ssl_certs=True,
+        proxy_url=None,
+        prune_transactions=True,
+        transactions_chunk_size=RESTRICTED_MAX_TRANSACTIONS,
+        decode_as_json=True,
+        cache=None,
+        cache_confirmations=10,
+        log_payload_limit=None,
+        json_codec=None,
+        connections=100,
+    ):
+        _import_aiohttp()
+        self.url = "{protocol}://{host}:{port}".format(
+            protocol=protocol, host=host, port=port
+        )
+        _log.debug("Async JSONRPC daemon backend URL: {url}".format(url=self.url))
+        self.user = user
+        self.password = password
+        self.timeout = timeout
+        self.verify_ssl_certs = verify_ssl_certs
+        self.proxy_url = proxy_url
+        self.prune_transactions = prune_transactions
+        self.transactions_chunk_size = transactions_chunk_size
+        self.decode_as_json = decode_as_json
+        self.cache = MemoryCache() if cache is True else cache
+        self.cache_confirmations = cache_confirmations
+        self.log_payload_limit = log_payload_limit
+        self.codec = default_codec() if json_codec is None else json_codec
+        self.connections = connections
+        self.session = None
+
+    async def close(self):
+        """Closes the connections."""
+        if self.session is not None:
+            await self.session.close()
+            self.session = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    async def info(self):
+        info = await self.raw_jsonrpc_request("get_info")
+        self._set_net(info)
+        self._set_chain_height(info["height"])
+        return info
+
+    async def net(self):
+        if self._net:
+            return self._net
+        await self.info()
+        return self._net
+
+    async def restricted(self):
+        if self._restricted is None:
+            await self._set_restricted()
+        return self._restricted
+
+    async def send_transaction(self, blob, relay=True):
+        res = await self.raw_request(
+            "/sendrawtransaction",
+            {
+                "tx_as_hex": binascii.hexlify(blob).decode(),
+                "do_not_relay": not relay,
+            },
+        )
+        return self._sent_transaction(res)
+
+    async def mempool(self):
+        return self._mempool(await self.raw_request("/get_transaction_pool", {}))
+
+    async def headers(self, start_height, end_height=None):
+        end_height = end_height or start_height
+        headers = self._cached_headers(start_height, end_height)
+        if headers is not None:
+            return headers
+        res = await self.raw_jsonrpc_request(
+            "get_block_headers_range",
+            {"start_height": start_height, "end_height": end_height},
+        )
+        return self._headers(res)
+
+    async def block(self, bhash=None, height=None):
+        params = self._block_params(bhash, height)
+        res = self._cached_block(params)
+        if res is None:
+            res = self._cache_block(await self.raw_jsonrpc_request("get_block", params))
+        data, txhashes = self._block_data(res)
+        data["transactions"] = await self.transactions(txhashes)
+        return Block(**data)
+
+    async def blocks(self, heights):
+        heights = list(heights)
+        return self._bin_block_list(
+            heights, await self.get_blocks_by_height_bin(heights)
+        )
+
+    async def transactions(self, hashes):
+        """
+        Returns a list of transactions for given hashes. The request is split into chunks
+        acceptable by the RPC server, which are fetched concurrently.
+        """
+        hashes = self._validate_hashlist(hashes)
+        if not hashes:
+            return []
+        txs = self._cached_transactions(hashes)
+        missing = [txhash for txhash in hashes if txhash not in txs]
+        if not missing:
+            return [txs[txhash] for txhash in hashes]
+        chunks = await asyncio.gather(
+            *[
+                self._do_get_transactions(chunk, prune=self.prune_transactions)
+                for chunk in _chunks(missing, await self._transactions_chunk_size())
+            ]
+        )
+        return self._ordered_transactions(hashes, txs, chunks)
+
+    async def raw_request(self, path, data=None):
+        _log.debug(
+            "Request: %s\nData: %s", path, LogPayload(data, self.log_payload_limit)
+        )
+        status, content = await self._post(
+            path, self.codec.dumps(data) if data else None
+        )
+        return self._raw_result(path, status, content)
+
+    async def raw_bin_request(self, path, data=None):
+        _log.debug(
+            "Binary request: %s\nData: %s",
+            path,
+            LogPayload(data, self.log_payload_limit, repr),
+        )
+        status, content = await self._post(
+            path,
+            portable_storage.dumps(data or {}),
+            content_type="application/octet-stream",
+        )
+        return self._bin_result(path, status, content)
+
+    async def raw_jsonrpc_request(self, method, params=None):
+        data = {"jsonrpc": "2.0", "id": 0, "method": method, "params": params or {}}
+        _log.debug(
+            "Method: %s\nParams:\n%s",
+            method,
+            LogPayload(params, self.log_payload_limit),
+        )
+        status, content = await self._post("/json_rpc", self.codec.dumps(data))
+        return self._jsonrpc_result(method, status, content)
+
+    async def _send_batch(self, calls):
+        data = _batch_data(calls)
+        _log.debug("Batch:\n%s", LogPayload(data, self.log_payload_limit))
+        status, content = await self._post("/json_rpc", self.codec.dumps(data))
+        return self._jsonrpc_batch_result(calls, status, content)
+
+    # The raw RPC wrappers inherited from JSONRPCDaemon return the awaitable results of
+    # the methods above. Those which process the results have to be awaited here.
+
+    async def on_get_block_hash(self, height):
+        params = self._on_get_block_hash_params(height)
+        bhash = self._cache_get(_block_hash_key(params[0]))
+        if bhash is not None:
+            return bhash
+        return self._cache_block_hash(
+            params[0],
+            await self.raw_jsonrpc_request("on_get_block_hash", params=params),
+        )
+
+    async def get_bans(self):
+        return self._bans(await self.raw_jsonrpc_request("get_bans"))
+
+    async def flush_txpool(self, txids=None):
+        return self._flushed_txpool(
+            await self.raw_jsonrpc_request(
+                "flush_txpool", params=self._flush_txpool_params(txids)
+            )
+        )
+
+    async def get_blocks_by_height_bin(self, heights):
+        heights = list(heights)
+        if any(h < 0 for h in heights):
+            raise ValueError("heights contains a negative height")
+        return self._bin_blocks(
+            await self.raw_bin_request(
+                "/get_blocks_by_height.bin", {"heights": heights}
+            )
+        )
+
+    async def get_hashes_bin(self, block_ids, start_height=0):
+        block_ids = self._validate_hashlist(block_ids)
+        if start_height < 0:
+            raise ValueError("start_height < 0")
+        return self._bin_hashes(
+            await self.raw_bin_request(
+                "/get_hashes.bin",
+                {
+                    "block_ids": binascii.unhexlify("".join(block_ids)),
+                    "start_height": start_height,
+                },
+            )
+        )
+
+    async def get_o_indexes_bin(self, txid):
+        if not self._is_valid_256_hex(txid):
+            raise ValueError('txid "{}" is not a valid hash'.format(txid))
+        return self._bin_o_indexes(
+            await self.raw_bin_request(
+                "/get_o_indexes.bin", {"txid": binascii.unhexlify(txid)}
+            )
+        )
+
+    async def set_log_hash_rate(self, visible):
+        return self._log_hash_rate_set(
+            await self.raw_request(
+                "/set_log_hash_rate", data={"visible": bool(visible)}
+            )
+        )
+
+    # private methods
+    def _get_session(self):
+        if self.session is None:
+            self.session = _client_session(
+                self.user,
+                self.password,
+                self.timeout,
+                self.verify_ssl_certs,
+                self.connections,
+            )
+        return self.session
+
+    async def _post(self, path, data, content_type="application/json"):
+        async with self._get_session().post(
+            self.url + path,
+            data=data,
+            headers={"Content-Type": content_type},
+            proxy=self.proxy_url,
+        ) as rsp:
+            return rsp.status, await rsp.read()
+
+    async def _set_restricted(self):
+        try:
+            await self.sync_info()
+            self._restricted = False
+        except MethodNotFound:
+            self._restricted = True
+
+    async def _transactions_chunk_size(self):
+        if self.transactions_chunk_size:
+            return self.transactions_chunk_size
+        if await self.restricted():
+            return RESTRICTED_MAX_TRANSACTIONS
+        return UNRESTRICTED_MAX_TRANSACTIONS
+
+    async def _do_get_transactions(self, hashes, prune):
+        return self._transactions(
+            await self.raw_request(
+                "/get_transactions",
+                {
+                    "txs_hashes": hashes,
+                    "decode_as_json": self.decode_as_json,
+                    "prune": prune,
+                },
+            )
+        )
+
+
+def _import_aiohttp():
+    # aiohttp is imported on first use, so that it isn't loaded by synchronous users
+    try:
+        import aiohttp
+    except ImportError:
+        raise ImportError(
+            "Could not import 'aiohttp', which is required by the asynchronous backend. "
+            "Install it directly or as 'monero[async]'."
+        )
+    return aiohttp
+
+
+def _client_session(user, password, timeout, verify_ssl_certs, connections):
+    aiohttp = _import_aiohttp()
+    kwargs = {}
+    if user or password:
+        kwargs["middlewares"] = (aiohttp.DigestAuthMiddleware(user, password),)
+    connector_kwargs = {} if verify_ssl_certs else {"ssl": False}
+    return aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(limit=connections, **connector_kwargs),
+        timeout=aiohttp.ClientTimeout(total=timeout),
+        **kwargs
+    )
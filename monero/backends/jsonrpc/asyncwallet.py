@@ -0,0 +1,258 @@
+import logging
+
+from ... import exceptions
+from ...account import AsyncAccount
+from ...address import SubAddress
+from ...seed import Seed
+from .asyncdaemon import _client_session, _import_aiohttp
+from .codec import default_codec
+from .payload import LogPayload
+from .wallet import JSONRPCWallet
+
+
+_log = logging.getLogger(__name__)
+
+
+class AsyncJSONRPCWallet(JSONRPCWallet):
+    """
+    Asynchronous JSON RPC backend for Monero wallet (``monero-wallet-rpc``), built on
+    `aiohttp`.
+
+    The backend provides the same methods as
+    :class:`JSONRPCWallet <monero.backends.jsonrpc.JSONRPCWallet>`, but all of them
+    must be awaited. The connections should be released by awaiting :meth:`close` or by
+    using the backend as an asynchronous context manager.
+
+    :param protocol: `http` or `https`
+    :param host: host name or IP
+    :param port: port number
+    :param path: path for JSON RPC requests (should not be changed)
+    :param user: username to authenticate with over RPC
+    :param password: password to authenticate with over RPC
+    :param timeout: request timeout
+    :param verify_ssl_certs: verify ssl certs for request
+    :param proxy_url: a HTTP proxy to use
+    :param log_payload_limit: the maximal length of payloads in the debug log
+    :param json_codec: a :class:`JSONCodec <monero.backends.jsonrpc.codec.JSONCodec>`,
+                            `None` meaning the fastest one installed
+    :param connections: the maximal number of simultaneous connections
+    """
+
+    _account_class = AsyncAccount
+
+    def __init__(
+        self,
+        protocol="http",
+        host="127.0.0.1",
+        port=18088,
+        path="/json_rpc",
+        user="",
+        password="",
+        timeout=30,
+        verify_ssl_certs=True,
+        proxy_url=None,
+        log_payload_limit=None,
+        json_codec=None,
+        connections=10,
+    ):
+        _import_aiohttp()
+        self.url = "{protocol}://{host}:{port}/json_rpc".format(
+            protocol=protocol, host=host, port=port
+        )
+        _log.debug("Async JSONRPC wallet backend URL: {url}".format(url=self.url))
+        self.user = user
+        self.password = password
+        self.timeout = timeout
+        self.verify_ssl_certs = verify_ssl_certs
+        self.log_payload_limit = log_payload_limit
+        self.codec = default_codec() if json_codec is None else json_codec
+        self.proxy_url = proxy_url
+        self.connections = connections
+        self.session = None
+
+    async def close(self):
+        """Closes the connections."""
+        if self.session is not None:
+            await self.session.close()
+            self.session = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    async def height(self):
+        return (await self.raw_request("getheight"))["height"]
+
+    async def spend_key(self):
+        return (await self.raw_request("query_key", {"key_type": "spend_key"}))["key"]
+
+    async def view_key(self):
+        return (await self.raw_request("query_key", {"key_type": "view_key"}))["key"]
+
+    async def seed(self):
+        res = await self.raw_request("query_key", {"key_type": "mnemonic"})
+        return Seed(res["key"])
+
+    async def accounts(self):
+        return self._accounts(await self.raw_request("get_accounts"))
+
+    async def new_account(self, label=None):
+        return self._new_account(
+            await self.raw_request("create_account", {"label": label}), label
+        )
+
+    async def addresses(self, account=0, addr_indices=None):
+        return self._addresses(
+            await self.raw_request(
+                "getaddress", self._addresses_params(account, addr_indices)
+            )
+        )
+
+    async def new_address(self, account=0, label=None):
+        _address = await self.raw_request(
+            "create_address", {"account_index": account, "label": label}
+        )
+        return SubAddress(_address["address"]), _address["address_index"]
+
+    async def balances(self, account=0):
+        return self._balances(
+            await self.raw_request("getbalance", {"account_index": account})
+        )
+
+    async def address_balance(self, account=0, indices=None):
+        indices = [] if indices is None else indices
+        _balances = await self.raw_request(
+            "getbalance",
+            {
+                "account_index": account,
+                "address_indices": indices,
+            },
+        )
+        return self._address_balance(_balances)
+
+    async def transfers_in(self, account, pmtfilter):
+        method, params = self._transfers_in_params(account, pmtfilter)
+        if method == "get_transfer_by_txid":
+            responses = await self._transfers_by_txid(params, pmtfilter.tx_ids)
+        else:
+            responses = [await self.raw_request(method, params)]
+        return self._transfers_in(method, pmtfilter, responses)
+
+    async def transfers_out(self, account, pmtfilter):
+        if pmtfilter.tx_ids:
+            responses = await self._transfers_by_txid(
+                {"account_index": account}, pmtfilter.tx_ids
+            )
+        else:
+            responses = [
+                await self.raw_request(
+                    "get_transfers", self._transfers_out_params(account, pmtfilter)
+                )
+            ]
+        return self._transfers_out(pmtfilter, responses)
+
+    async def export_outputs(self):
+        return (await self.raw_request("export_outputs"))["outputs_data_hex"]
+
+    async def import_outputs(self, outputs_hex):
+        res = await self.raw_request(
+            "import_outputs", {"outputs_data_hex": outputs_hex}
+        )
+        return res["num_imported"]
+
+    async def export_key_images(self):
+        return (await self.raw_request("export_key_images"))["signed_key_images"]
+
+    async def import_key_images(self, key_images):
+        return self._imported_key_images(
+            await self.raw_request(
+                "import_key_images", {"signed_key_images": key_images}
+            )
+        )
+
+    async def transfer(
+        self,
+        destinations,
+        priority,
+        payment_id=None,
+        unlock_time=0,
+        account=0,
+        relay=True,
+    ):
+        data = self._transfer_params(
+            destinations, priority, payment_id, unlock_time, account, relay
+        )
+        return self._transferred(
+            await self.raw_request("transfer_split", data), payment_id
+        )
+
+    async def sweep_all(
+        self,
+        destination,
+        priority,
+        payment_id=None,
+        subaddr_indices=None,
+        unlock_time=0,
+        account=0,
+        relay=True,
+    ):
+        if not subaddr_indices:
+            subaddr_indices = self._unlocked_subaddr_indices(
+                await self.raw_request("get_balance", {"account_index": account})
+            )
+        data = self._sweep_all_params(
+            destination,
+            priority,
+            payment_id,
+            subaddr_indices,
+            unlock_time,
+            account,
+            relay,
+        )
+        return self._swept(await self.raw_request("sweep_all", data), payment_id)
+
+    async def raw_request(self, method, params=None, squelch_error_logging=False):
+        data = {"jsonrpc": "2.0", "id": 0, "method": method, "params": params or {}}
+        _log.debug(
+            "Method: %s\nParams:\n%s",
+            method,
+            LogPayload(params, self.log_payload_limit),
+        )
+        async with self._get_session().post(
+            self.url,
+            data=self.codec.dumps(data),
+            headers={"Content-Type": "application/json"},
+            proxy=self.proxy_url,
+        ) as rsp:
+            self._check_status(method, rsp.status)
+            result = self.codec.loads(await rsp.read())
+        return self._check_result(method, result, squelch_error_logging)
+
+    # private methods
+    async def _transfers_by_txid(self, params, tx_ids):
+        responses = []
+        for txid in tx_ids:
+            try:
+                responses.append(
+                    await self.raw_request(
+                        "get_transfer_by_txid",
+                        dict(params, txid=txid),
+                        squelch_error_logging=True,
+                    )
+                )
+            except exceptions.TransactionNotFound:
+                continue
+        return responses
+
+    def _get_session(self):
+        if self.session is None:
+            self.session = _client_session(
+                self.user,
+                self.password,
+                self.timeout,
+                self.verify_ssl_certs,
+                self.connections,
+            )
+        return self.session
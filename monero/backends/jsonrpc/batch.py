@@ -0,0 +1,215 @@
+import functools
+
+from .daemon import JSONRPCDaemon
+
+
+class BatchResult(object):
+    """
+    The result of a call collected by :class:`JSONRPCBatch`. It becomes available
+    once the batch has been sent.
+
+    This class is not intended to be turned into objects by the user,
+    it is returned by the batch methods.
+    """
+
+    __slots__ = ("method", "_result", "_error", "_done")
+
+    def __init__(self, method):
+        self.method = method
+        self._result = None
+        self._error = None
+        self._done = False
+
+    def __repr__(self):
+        return "<BatchResult of '{}'>".format(self.method)
+
+    @property
+    def done(self):
+        """`True` if the response has been received."""
+        return self._done
+
+    @property
+    def error(self):
+        """The exception raised by the call or `None` if it succeeded."""
+        self._check_done()
+        return self._error
+
+    @property
+    def result(self):
+        """The result of the call. Raises the call's exception if it failed."""
+        self._check_done()
+        if self._error is not None:
+            raise self._error
+        return self._result
+
+    def _check_done(self):
+        if not self._done:
+            raise RuntimeError(
+                "The result of '{}' is not available until the batch is sent".format(
+                    self.method
+                )
+            )
+
+    def _set(self, result, error):
+        self._result = result
+        self._error = error
+        self._done = True
+
+
+# The daemon methods which can be batched, each making a single JSON RPC call. They map to
+# the name of the JSON RPC method, the backend method which validates the arguments and
+# returns the parameters (`None` for methods without arguments) and the one which processes
+# the result (`None` if it's returned unchanged).
+_BATCHABLE = {
+    "get_block_count": ("get_block_count", None, None),
+    "on_get_block_hash": (
+        "on_get_block_hash",
+        JSONRPCDaemon._on_get_block_hash_params,
+        None,
+    ),
+    "get_block_template": (
+        "get_block_template",
+        JSONRPCDaemon._get_block_template_params,
+        None,
+    ),
+    "submit_block": ("submit_block", JSONRPCDaemon._submit_block_params, None),
+    "get_last_block_header": ("get_last_block_header", None, None),
+    "get_block_header_by_hash": (
+        "get_block_header_by_hash",
+        JSONRPCDaemon._get_block_header_by_hash_params,
+        None,
+    ),
+    "get_block_header_by_height": (
+        "get_block_header_by_height",
+        JSONRPCDaemon._get_block_header_by_height_params,
+        None,
+    ),
+    "get_block_headers_range": (
+        "get_block_headers_range",
+        JSONRPCDaemon._get_block_headers_range_params,
+        None,
+    ),
+    "get_block": ("get_block", JSONRPCDaemon._get_block_params, None),
+    "get_connections": ("get_connections", None, None),
+    "get_info": ("get_info", None, None),
+    "hard_fork_info": ("hard_fork_info", None, None),
+    "set_bans": ("set_bans", JSONRPCDaemon._set_bans_params, None),
+    "get_bans": ("get_bans", None, JSONRPCDaemon._bans),
+    "flush_txpool": (
+        "flush_txpool",
+        JSONRPCDaemon._flush_txpool_params,
+        JSONRPCDaemon._flushed_txpool,
+    ),
+    "get_output_histogram": (
+        "get_output_histogram",
+        JSONRPCDaemon._get_output_histogram_params,
+        None,
+    ),
+    "get_coinbase_tx_sum": (
+        "get_coinbase_tx_sum",
+        JSONRPCDaemon._get_coinbase_tx_sum_params,
+        None,
+    ),
+    "get_version": ("get_version", None, None),
+    "get_fee_estimate": (
+        "get_fee_estimate",
+        JSONRPCDaemon._get_fee_estimate_params,
+        None,
+    ),
+    "get_alternate_chains": ("get_alternate_chains", None, None),
+    "relay_tx": ("relay_tx", JSONRPCDaemon._relay_tx_params, None),
+    "sync_info": ("sync_info", None, None),
+}
+
+
+class JSONRPCBatch(object):
+    """
+    Collects JSON RPC calls to a daemon and sends them as a single JSON-RPC 2.0 batch
+    request. The responses are matched to the calls by their ids.
+
+    The batch offers those methods of
+    :class:`JSONRPCDaemon <monero.backends.jsonrpc.JSONRPCDaemon>` which make exactly one
+    JSON RPC call, like ``get_block_header_by_height()`` or ``get_bans()``. Each of them
+    validates the arguments as usual, but returns a :class:`BatchResult` instead of
+    the result. The calls are sent when the ``with`` block exits, or ``async with`` for
+    an asynchronous backend. Other methods of the backend raise `ValueError`.
+
+    :param backend: a :class:`JSONRPCDaemon <monero.backends.jsonrpc.JSONRPCDaemon>`
+                or :class:`AsyncJSONRPCDaemon <monero.backends.jsonrpc.AsyncJSONRPCDaemon>`
+    """
+
+    def __init__(self, backend):
+        self._backend = backend
+        self._calls = []
+        self._results = []
+        self._posts = []
+        self._sent = False
+
+    def __len__(self):
+        return len(self._calls)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None and self._calls and not self._sent:
+            self._resolve(self._backend._send_batch(self._calls))
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        if exc_type is None and self._calls and not self._sent:
+            self._resolve(await self._backend._send_batch(self._calls))
+
+    def call(self, method, params=None):
+        """
+        Adds a call of any JSON RPC method to the batch.
+
+        :param method: the method name
+        :param params: the parameters as `dict` or `list`
+        :rtype: :class:`BatchResult`
+        """
+        return self._add(method, params, None)
+
+    def __getattr__(self, name):
+        try:
+            method, params, post = _BATCHABLE[name]
+        except KeyError:
+            if name.startswith("_") or not callable(getattr(JSONRPCDaemon, name, None)):
+                raise AttributeError(
+                    "'{}' object has no attribute '{}'".format(
+                        type(self).__name__, name
+                    )
+                )
+
+            def unbatchable(*args, **kwargs):
+                raise ValueError("Method '{}' cannot be batched".format(name))
+
+            return unbatchable
+
+        @functools.wraps(getattr(JSONRPCDaemon, name))
+        def batched(*args, **kwargs):
+            if params is not None:
+                return self._add(method, params(self._backend, *args, **kwargs), post)
+            elif args or kwargs:
+                raise TypeError("{}() takes no arguments".format(name))
+            return self._add(method, None, post)
+
+        return batched
+
+    def _add(self, method, params, post):
+        if self._sent:
+            raise RuntimeError("The batch has been sent already")
+        result = BatchResult(method)
+        self._calls.append((method, params))
+        self._results.append(result)
+        self._posts.append(post)
+        return result
+
+    def _resolve(self, outcomes):
+        self._sent = True
+        for result, post, (res, error) in zip(self._results, self._posts, outcomes):
+            if post is not None and error is None:
+                res = post(self._backend, res)
+            result._set(res, error)
@@ -0,0 +1,139 @@
+"""
+Stores for the responses of the daemon which never change, used by
+:class:`JSONRPCDaemon <monero.backends.jsonrpc.JSONRPCDaemon>`.
+
+The values are the JSON-compatible structures decoded from the responses. They're keyed
+by strings. A store keeps count of hits and misses, which :meth:`ResponseCache.stats`
+reports. The values returned are never shared with the store, so the callers may modify
+them.
+"""
+import abc
+import collections
+import copy
+import json
+import sqlite3
+import threading
+
+
+class ResponseCache(abc.ABC):
+    """
+    The base class of response stores. Subclasses implement :meth:`_get`, :meth:`_set`
+    and :meth:`_len`, which are called with the lock held.
+    """
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        """
+        Returns the value stored under `key` or `None`.
+        """
+        with self._lock:
+            value = self._get(key)
+            if value is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+            return value
+
+    def set(self, key, value):
+        """
+        Stores the `value` under `key`.
+        """
+        with self._lock:
+            self._set(key, value)
+
+    def stats(self):
+        """
+        Returns a `dict` with the number of `hits`, `misses` and stored `entries`.
+        """
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "entries": self._len()}
+
+    def __len__(self):
+        with self._lock:
+            return self._len()
+
+    @abc.abstractmethod
+    def _len(self):
+        pass
+
+    @abc.abstractmethod
+    def _get(self, key):
+        pass
+
+    @abc.abstractmethod
+    def _set(self, key, value):
+        pass
+
+
+class MemoryCache(ResponseCache):
+    """
+    Keeps the responses in memory, discarding the least recently used ones once there's
+    more than `maxsize` of them. The values are copied when stored and when returned.
+
+    :param maxsize: the maximal number of entries
+    """
+
+    def __init__(self, maxsize=10000):
+        super(MemoryCache, self).__init__()
+        self.maxsize = maxsize
+        self._entries = collections.OrderedDict()
+
+    def _len(self):
+        return len(self._entries)
+
+    def _get(self, key):
+        try:
+            self._entries.move_to_end(key)
+        except KeyError:
+            return None
+        return copy.deepcopy(self._entries[key])
+
+    def _set(self, key, value):
+        self._entries[key] = copy.deepcopy(value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+
+class SQLiteCache(ResponseCache):
+    """
+    Keeps the responses in a SQLite database, which survives the process. The entries
+    are never removed.
+
+    :param path: the database file
+    """
+
+    def __init__(self, path):
+        super(SQLiteCache, self).__init__()
+        self.path = path
+        # the backend may use it from several threads, the lock serializes the access
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, value TEXT)"
+        )
+        self._db.commit()
+
+    def close(self):
+        """Closes the database."""
+        with self._lock:
+            self._db.close()
+
+    def _len(self):
+        return self._db.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+
+    def _get(self, key):
+        row = self._db.execute(
+            "SELECT value FROM responses WHERE key = ?", (key,)
+        ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def _set(self, key, value):
+        self._db.execute(
+            "INSERT OR REPLACE INTO responses (key, value) VALUES (?, ?)",
+            (key, json.dumps(value)),
+        )
+        self._db.commit()
@@ -0,0 +1,139 @@
+"""
+JSON encoders and decoders used by the JSON RPC backends for the requests, the responses
+and the transactions which the daemon decodes to JSON.
+
+The backends use :func:`default_codec` unless given another one. It picks `orjson`
+or `ujson` if installed, and the standard `json` module otherwise. The faster parsers
+differ from the standard module on integers not fitting into 64 bits: `orjson` decodes
+them as floats, `ujson` rejects them, and such documents are parsed again with the standard
+module. The daemon sends the wide values, like the cumulative difficulty, as hex strings.
+Invalid documents are not parsed again.
+"""
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ujson
+except ImportError:
+    ujson = None
+
+
+class JSONCodec(object):
+    """
+    Encodes and decodes JSON with the standard `json` module. Subclasses wrap other
+    implementations.
+    """
+
+    name = "json"
+
+    def dumps(self, obj):
+        """
+        Encodes the `obj` into JSON.
+
+        :rtype: `str` or `bytes`
+        """
+        return json.dumps(obj)
+
+    def loads(self, data):
+        """
+        Decodes JSON given as `str` or `bytes`. Raises `ValueError` on invalid input.
+        """
+        return json.loads(data)
+
+    def __repr__(self):
+        return "<{}>".format(self.__class__.__name__)
+
+
+class OrjsonCodec(JSONCodec):
+    """
+    Encodes and decodes JSON with `orjson`.
+    """
+
+    name = "orjson"
+
+    def __init__(self):
+        if orjson is None:
+            raise ImportError("Could not import 'orjson'.")
+
+    def dumps(self, obj):
+        try:
+            return orjson.dumps(obj)
+        except TypeError:
+            return json.dumps(obj)
+
+    def loads(self, data):
+        return orjson.loads(data)
+
+
+class UjsonCodec(JSONCodec):
+    """
+    Encodes and decodes JSON with `ujson`.
+    """
+
+    name = "ujson"
+
+    def __init__(self):
+        if ujson is None:
+            raise ImportError("Could not import 'ujson'.")
+
+    def dumps(self, obj):
+        try:
+            return ujson.dumps(obj)
+        except (TypeError, OverflowError):
+            return json.dumps(obj)
+
+    def loads(self, data):
+        try:
+            return ujson.loads(data)
+        except ValueError as e:
+            if not _out_of_range(e):
+                raise
+            return json.loads(data)
+
+
+def _out_of_range(exc):
+    # ujson reports integers beyond 64 bits as "Value is too big!" or "Value is too small"
+    return str(exc).startswith(("Value is too big", "Value is too small"))
+
+
+CODECS = {"orjson": OrjsonCodec, "ujson": UjsonCodec, "json": JSONCodec}
+
+_default = None
+
+
+def get_codec(name):
+    """
+    Returns the codec of given name: `orjson`, `ujson` or `json`. Raises `ImportError`
+    if the library is not installed.
+
+    :rtype: :class:`JSONCodec`
+    """
+    try:
+        return CODECS[name]()
+    except KeyError:
+        raise ValueError(
+            "Unknown JSON codec '{}', expected one of: {}".format(
+                name, ", ".join(CODECS)
+            )
+        )
+
+
+def default_codec():
+    """
+    Returns the fastest codec available, one instance shared by all backends.
+
+    :rtype: :class:`JSONCodec`
+    """
+    global _default
+    if _default is None:
+        for cls in CODECS.values():
+            try:
+                _default = cls()
+                break
+            except ImportError:
+                pass
+    return _default
@@ -1,17 +1,23 @@
 import binascii
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from decimal import Decimal
+import functools
 import ipaddress
-import json
 import logging
 import requests
 
 from ... import address
 from ... import exceptions
-from ...block import Block
+from ... import portable_storage
+from ...block import Block, TransactionList
 from ...const import NET_MAIN, NET_TEST, NET_STAGE
 from ...numbers import from_atomic, to_atomic
 from ...transaction import Transaction
+from ...transaction.serialization import block_hash, parse_block, transaction_hash
+from .cache import MemoryCache
+from .codec import default_codec
+from .payload import LogPayload
 from .exceptions import RPCError, MethodNotFound, Unauthorized
 
 
@@ -19,6 +25,7 @@ _log = logging.getLogger(__name__)
 
 
 RESTRICTED_MAX_TRANSACTIONS = 100
+UNRESTRICTED_MAX_TRANSACTIONS = 1000
 
 
 class JSONRPCDaemon(object):
@@ -37,6 +44,25 @@ class JSONRPCDaemon(object):
     :param proxy_url: a proxy to use
     :param prune_transactions: whether to prune transaction data. Saves bandwidth but you may want
                             to enable it when you need to retrieve transaction binary blobs.
+    :param decode_as_json: whether to have the daemon decode transactions to JSON. If `False`,
+                            transactions are parsed from their blobs, which halves
+                            the amount of data transferred.
+    :param transactions_chunk_size: the number of transactions requested at once. If `None`,
+                            the size depends on whether the server is :meth:`restricted`,
+                            which costs an extra request on the first use.
+    :param transactions_workers: the number of chunks of transactions requested in parallel
+    :param cache: a :class:`ResponseCache <monero.backends.jsonrpc.cache.ResponseCache>`
+                            for blocks, headers, block hashes and transactions which are
+                            buried deep enough not to change anymore. `True` means a new
+                            :class:`MemoryCache <monero.backends.jsonrpc.cache.MemoryCache>`,
+                            `None` (the default) disables caching.
+    :param cache_confirmations: the number of confirmations data needs to be cached
+    :param log_payload_limit: the maximal length of request and response payloads
+                            in the debug log, `None` meaning they're logged whole
+    :param json_codec: a :class:`JSONCodec <monero.backends.jsonrpc.codec.JSONCodec>`
+                            encoding the requests and decoding the responses. `None`
+                            means :func:`default_codec() <monero.backends.jsonrpc.codec.default_codec>`,
+                            which uses `orjson` or `ujson` if installed.
     """
 
     _METHOD_NOT_FOUND_CODE = -32601
@@ -86,6 +112,7 @@ class JSONRPCDaemon(object):
 
     _net = None
     _restricted = None
+    _chain_height = None
 
     def __init__(
         self,
@@ -99,21 +126,43 @@ class JSONRPCDaemon(object):
         verify_ssl_certs=True,
         proxy_url=None,
         prune_transactions=True,
+        transactions_chunk_size=RESTRICTED_MAX_TRANSACTIONS,
+        transactions_workers=1,
+        decode_as_json=True,
+        cache=None,
+        cache_confirmations=10,
+        log_payload_limit=None,
+        json_codec=None,
     ):
+        if transactions_workers < 1:
+            raise ValueError("transactions_workers must be a positive number")
         self.url = "{protocol}://{host}:{port}".format(
             protocol=protocol, host=host, port=port
         )
         _log.debug("JSONRPC daemon backend URL: {url}".format(url=self.url))
         self.auth = requests.auth.HTTPDigestAuth(user, password)
         self.session = requests.Session()
+        if transactions_workers > requests.adapters.DEFAULT_POOLSIZE:
+            # keep a connection for each worker
+            adapter = requests.adapters.HTTPAdapter(pool_maxsize=transactions_workers)
+            self.session.mount("http://", adapter)
+            self.session.mount("https://", adapter)
         self.timeout = timeout
         self.verify_ssl_certs = verify_ssl_certs
         self.proxies = {protocol: proxy_url}
         self.prune_transactions = prune_transactions
+        self.transactions_chunk_size = transactions_chunk_size
+        self.transactions_workers = transactions_workers
+        self.decode_as_json = decode_as_json
+        self.cache = MemoryCache() if cache is True else cache
+        self.cache_confirmations = cache_confirmations
+        self.log_payload_limit = log_payload_limit
+        self.codec = default_codec() if json_codec is None else json_codec
 
     def info(self):
         info = self.raw_jsonrpc_request("get_info")
         self._set_net(info)
+        self._set_chain_height(info["height"])
         return info
 
     def net(self):
@@ -136,152 +185,260 @@ class JSONRPCDaemon(object):
                 "do_not_relay": not relay,
             },
         )
-        if res["status"] == "OK":
-            return res
-        raise exceptions.TransactionBroadcastError(
-            "{status}: {reason}".format(**res), details=res
-        )
+        return self._sent_transaction(res)
 
     def mempool(self):
-        res = self.raw_request("/get_transaction_pool", {})
-        txs = []
-        for tx in res.get("transactions", []):
-            txs.append(
-                Transaction(
-                    hash=tx["id_hash"],
-                    fee=from_atomic(tx["fee"]),
-                    timestamp=datetime.fromtimestamp(tx["receive_time"]),
-                    blob=binascii.unhexlify(tx["tx_blob"]),
-                    json=json.loads(tx["tx_json"]),
-                    confirmations=0,
-                )
-            )
-        return txs
+        return self._mempool(self.raw_request("/get_transaction_pool", {}))
 
     def headers(self, start_height, end_height=None):
         end_height = end_height or start_height
+        headers = self._cached_headers(start_height, end_height)
+        if headers is not None:
+            return headers
         res = self.raw_jsonrpc_request(
             "get_block_headers_range",
             {"start_height": start_height, "end_height": end_height},
         )
-        if res["status"] == "OK":
-            return res["headers"]
-        raise exceptions.BackendException(res["status"])
+        return self._headers(res)
 
     def block(self, bhash=None, height=None):
-        data = {}
-        if bhash:
-            data["hash"] = bhash
-        if height:
-            data["height"] = height
-        res = self.raw_jsonrpc_request("get_block", data)
-        if res["status"] == "OK":
-            bhdr = res["block_header"]
-            sub_json = json.loads(res["json"])
-            data = {
-                "blob": res["blob"],
-                "hash": bhdr["hash"],
-                "height": bhdr["height"],
-                "timestamp": datetime.fromtimestamp(bhdr["timestamp"]),
-                "version": (bhdr["major_version"], bhdr["minor_version"]),
-                "difficulty": bhdr["difficulty"],
-                "nonce": bhdr["nonce"],
-                "orphan": bhdr["orphan_status"],
-                "prev_hash": bhdr["prev_hash"],
-                "reward": from_atomic(bhdr["reward"]),
-                "transactions": self.transactions(
-                    [bhdr["miner_tx_hash"]] + sub_json["tx_hashes"]
-                ),
-            }
-            return Block(**data)
-        raise exceptions.BackendException(res["status"])
+        """
+        Returns the block of given hash or height. Its transactions are fetched when
+        first accessed. See
+        :class:`TransactionList <monero.block.TransactionList>`.
+        """
+        params = self._block_params(bhash, height)
+        res = self._cached_block(params)
+        if res is None:
+            res = self._cache_block(self.raw_jsonrpc_request("get_block", params))
+        data, txhashes = self._block_data(res)
+        data["transactions"] = TransactionList(
+            txhashes,
+            self.transactions,
+            chunk_size=self._block_chunk_size,
+        )
+        return Block(**data)
+
+    def blocks(self, heights):
+        """
+        Returns the blocks of given heights along with all their transactions. The blocks
+        are fetched in the binary form by :meth:`get_blocks_by_height_bin` and decoded
+        locally. That endpoint provides neither the global indices of outputs nor
+        the difficulty and orphan status of blocks, so these are `None`.
+        """
+        heights = list(heights)
+        return self._bin_block_list(heights, self.get_blocks_by_height_bin(heights))
 
     def transactions(self, hashes):
         """
         Returns a list of transactions for given hashes. Automatically chunks the request
-        into amounts acceptable by a restricted RPC server.
+        into amounts acceptable by the RPC server. If the backend has more than one
+        `transactions_workers`, the chunks are requested in parallel. The order of
+        transactions follows the order of hashes in both cases.
         """
 
         hashes = self._validate_hashlist(hashes)
-        result = []
-        while len(hashes):
-            result.extend(
-                self._do_get_transactions(
-                    hashes[:RESTRICTED_MAX_TRANSACTIONS], prune=self.prune_transactions
-                )
-            )
-            hashes = hashes[RESTRICTED_MAX_TRANSACTIONS:]
-        return result
+        if not hashes:
+            return []
+        txs = self._cached_transactions(hashes)
+        missing = [txhash for txhash in hashes if txhash not in txs]
+        if not missing:
+            return [txs[txhash] for txhash in hashes]
+        chunks = _chunks(missing, self._transactions_chunk_size())
+        fetch = functools.partial(
+            self._do_get_transactions, prune=self.prune_transactions
+        )
+        workers = min(self.transactions_workers, len(chunks))
+        if workers == 1:
+            results = map(fetch, chunks)
+        else:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                results = list(executor.map(fetch, chunks))
+        return self._ordered_transactions(hashes, txs, results)
 
     def raw_request(self, path, data=None):
         hdr = {"Content-Type": "application/json"}
         _log.debug(
-            "Request: {path}\nData: {data}".format(
-                path=path, data=json.dumps(data, indent=2, sort_keys=True)
-            )
+            "Request: %s\nData: %s", path, LogPayload(data, self.log_payload_limit)
         )
         rsp = self.session.post(
             self.url + path,
             headers=hdr,
-            data=json.dumps(data) if data else None,
+            data=self.codec.dumps(data) if data else None,
             auth=self.auth,
             timeout=self.timeout,
             verify=self.verify_ssl_certs,
             proxies=self.proxies,
         )
-        if rsp.status_code != 200:
-            raise RPCError(
-                "Invalid HTTP status {code} for path {path}.".format(
-                    code=rsp.status_code, path=path
-                )
-            )
-        result = rsp.json()
-        _ppresult = json.dumps(result, indent=2, sort_keys=True)
-        _log.debug("Result:\n{result}".format(result=_ppresult))
-        return result
+        return self._raw_result(path, rsp.status_code, rsp.content)
+
+    def raw_bin_request(self, path, data=None):
+        """
+        Makes a request to a binary (``.bin``) endpoint. Both the request and the response
+        are encoded in the Epee :mod:`portable storage <monero.portable_storage>` format.
+        """
+        _log.debug(
+            "Binary request: %s\nData: %s",
+            path,
+            LogPayload(data, self.log_payload_limit, repr),
+        )
+        rsp = self.session.post(
+            self.url + path,
+            headers={"Content-Type": "application/octet-stream"},
+            data=portable_storage.dumps(data or {}),
+            auth=self.auth,
+            timeout=self.timeout,
+            verify=self.verify_ssl_certs,
+            proxies=self.proxies,
+        )
+        return self._bin_result(path, rsp.status_code, rsp.content)
 
     def raw_jsonrpc_request(self, method, params=None):
         hdr = {"Content-Type": "application/json"}
         data = {"jsonrpc": "2.0", "id": 0, "method": method, "params": params or {}}
         _log.debug(
-            "Method: {method}\nParams:\n{params}".format(
-                method=method, params=json.dumps(params, indent=2, sort_keys=True)
-            )
+            "Method: %s\nParams:\n%s",
+            method,
+            LogPayload(params, self.log_payload_limit),
+        )
+        rsp = self.session.post(
+            self.url + "/json_rpc",
+            headers=hdr,
+            data=self.codec.dumps(data),
+            auth=self.auth,
+            timeout=self.timeout,
+            verify=self.verify_ssl_certs,
+            proxies=self.proxies,
         )
+        return self._jsonrpc_result(method, rsp.status_code, rsp.content)
+
+    def batch(self):
+        """
+        Returns a :class:`JSONRPCBatch <monero.backends.jsonrpc.JSONRPCBatch>`, which
+        collects JSON RPC calls and sends them all in a single request when the ``with``
+        block exits.
+
+        .. code-block:: python
+
+            with daemon.batch() as b:
+                hashes = [b.on_get_block_hash(h) for h in range(1000, 2000)]
+            hashes = [h.result for h in hashes]
+
+        :rtype: :class:`JSONRPCBatch <monero.backends.jsonrpc.JSONRPCBatch>`
+        """
+        from .batch import JSONRPCBatch
+
+        return JSONRPCBatch(self)
+
+    def _send_batch(self, calls):
+        hdr = {"Content-Type": "application/json"}
+        data = _batch_data(calls)
+        _log.debug("Batch:\n%s", LogPayload(data, self.log_payload_limit))
         rsp = self.session.post(
             self.url + "/json_rpc",
             headers=hdr,
-            data=json.dumps(data),
+            data=self.codec.dumps(data),
             auth=self.auth,
             timeout=self.timeout,
             verify=self.verify_ssl_certs,
             proxies=self.proxies,
         )
+        return self._jsonrpc_batch_result(calls, rsp.status_code, rsp.content)
+
+    def _raw_result(self, path, status_code, content):
+        if status_code != 200:
+            raise RPCError(
+                "Invalid HTTP status {code} for path {path}.".format(
+                    code=status_code, path=path
+                )
+            )
+        result = self.codec.loads(content)
+        _log.debug("Result:\n%s", LogPayload(result, self.log_payload_limit))
+        return result
+
+    def _bin_result(self, path, status_code, content):
+        if status_code != 200:
+            raise RPCError(
+                "Invalid HTTP status {code} for path {path}.".format(
+                    code=status_code, path=path
+                )
+            )
+        try:
+            result = portable_storage.loads(content)
+        except ValueError as e:
+            raise RPCError(
+                "Daemon returned unreadable binary data for path {path}: {err}".format(
+                    path=path, err=e
+                )
+            )
+        # the only text fields in the responses
+        for key in ("status", "top_hash"):
+            if key in result:
+                result[key] = result[key].decode()
+        _log.debug("Result: {status}".format(status=result.get("status")))
+        return result
+
+    def _jsonrpc_result(self, method, status_code, content):
+        result = self._jsonrpc_content(method, status_code, content)
+        return self._check_jsonrpc_response(method, result)
+
+    def _jsonrpc_batch_result(self, calls, status_code, content):
+        """
+        Matches the responses to a batch of calls by their ids. Returns a list of
+        `(result, error)` pairs in the order of calls.
+        """
+        description = "batch of {:d} calls".format(len(calls))
+        responses = self._jsonrpc_content(description, status_code, content)
+        if not isinstance(responses, list):
+            raise RPCError(
+                "Daemon didn't accept the {description}: {error}".format(
+                    description=description, error=responses.get("error")
+                )
+            )
+        byid = {rsp.get("id"): rsp for rsp in responses}
+        results = []
+        for idx, (method, params) in enumerate(calls):
+            try:
+                rsp = byid[idx]
+            except KeyError:
+                results.append(
+                    (None, RPCError("No response to method '{}'".format(method)))
+                )
+                continue
+            try:
+                results.append((self._check_jsonrpc_response(method, rsp), None))
+            except (RPCError, exceptions.DaemonIsBusy) as e:
+                results.append((None, e))
+        return results
 
-        if rsp.status_code == 401:
+    def _jsonrpc_content(self, method, status_code, content):
+        if status_code == 401:
             raise Unauthorized("401 Unauthorized. Invalid RPC user name or password.")
-        elif rsp.status_code != 200:
+        elif status_code != 200:
             raise RPCError(
                 "Invalid HTTP status {code} for method {method}.".format(
-                    code=rsp.status_code, method=method
+                    code=status_code, method=method
                 )
             )
 
         try:
-            result = rsp.json()
+            result = self.codec.loads(content)
         except ValueError as e:
             _log.error(
                 "Could not parse JSON response from '{url}' during method '{method}'. Response:\n{resp}".format(
-                    url=self.url, method=method, resp=rsp.text
+                    url=self.url,
+                    method=method,
+                    resp=content.decode("utf-8", errors="replace"),
                 )
             )
             raise RPCError(
                 "Daemon returned an unreadable JSON response. It may contain unparseable binary characters."
             )
 
-        _ppresult = json.dumps(result, indent=2, sort_keys=True)
-        _log.debug("Result:\n{result}".format(result=_ppresult))
+        _log.debug("Result:\n%s", LogPayload(result, self.log_payload_limit))
+        return result
 
+    def _check_jsonrpc_response(self, method, result):
         if "error" in result:
             err = result["error"]
             code = err["code"]
@@ -290,12 +447,10 @@ class JSONRPCDaemon(object):
             if code == self._METHOD_NOT_FOUND_CODE:
                 raise MethodNotFound('Daemon method "{}" not found'.format(method))
 
-            _log.error("JSON RPC error:\n{result}".format(result=_ppresult))
+            _log.error("JSON RPC error:\n%s", LogPayload(result))
             raise RPCError(
                 "Method '{method}' failed with RPC Error of unknown code {code}, "
-                "message: {msg}".format(
-                    method=method, data=data, result=result, code=code, msg=msg
-                )
+                "message: {msg}".format(method=method, code=code, msg=msg)
             )
         elif "status" in result["result"] and result["result"]["status"] == "BUSY":
             raise exceptions.DaemonIsBusy(
@@ -329,12 +484,13 @@ class JSONRPCDaemon(object):
         Output: str; block hash
         """
 
-        height = int(height)
-
-        if height < 0:
-            raise ValueError("height < 0")
-
-        return self.raw_jsonrpc_request("on_get_block_hash", params=[height])
+        params = self._on_get_block_hash_params(height)
+        bhash = self._cache_get(_block_hash_key(params[0]))
+        if bhash is not None:
+            return bhash
+        return self._cache_block_hash(
+            params[0], self.raw_jsonrpc_request("on_get_block_hash", params=params)
+        )
 
     def get_block_template(self, wallet_address, reserve_size):
         """
@@ -361,17 +517,9 @@ class JSONRPCDaemon(object):
         }
         """
 
-        try:
-            address.address(wallet_address)
-        except ValueError:
-            raise ValueError("wallet_address is not in a recognized address form")
-
-        if reserve_size not in range(128):
-            raise ValueError("reserve_size {} is out of bounds".format(reserve_size))
-
         return self.raw_jsonrpc_request(
             "get_block_template",
-            params={"wallet_address": wallet_address, "reserve_size": reserve_size},
+            params=self._get_block_template_params(wallet_address, reserve_size),
         )
 
     def submit_block(self, blobs):
@@ -386,14 +534,9 @@ class JSONRPCDaemon(object):
         }
         """
 
-        if isinstance(blobs, (bytes, str)):
-            blobs = [blobs]
-
-        blobs = [
-            binascii.hexlify(b).decode() if isinstance(b, bytes) else b for b in blobs
-        ]
-
-        return self.raw_jsonrpc_request("submit_block", params=blobs)
+        return self.raw_jsonrpc_request(
+            "submit_block", params=self._submit_block_params(blobs)
+        )
 
     def get_last_block_header(self):
         """
@@ -451,11 +594,9 @@ class JSONRPCDaemon(object):
         }
         """
 
-        if not self._is_valid_256_hex(blk_hash):
-            raise ValueError('blk_hash "{}" is not a valid hash'.format(blk_hash))
-
         return self.raw_jsonrpc_request(
-            "get_block_header_by_hash", params={"hash": blk_hash}
+            "get_block_header_by_hash",
+            params=self._get_block_header_by_hash_params(blk_hash),
         )
 
     def get_block_header_by_height(self, height):
@@ -486,11 +627,9 @@ class JSONRPCDaemon(object):
         }
         """
 
-        if height < 0:
-            raise ValueError("height < 0")
-
         return self.raw_jsonrpc_request(
-            "get_block_header_by_height", params={"height": height}
+            "get_block_header_by_height",
+            params=self._get_block_header_by_height_params(height),
         )
 
     def get_block_headers_range(self, start_height, end_height):
@@ -509,17 +648,9 @@ class JSONRPCDaemon(object):
         }
         """
 
-        start_height = int(start_height)
-        end_height = int(end_height)
-
-        if start_height < 0:
-            raise ValueError("start_height < 0")
-        if end_height < start_height:
-            raise ValueError("end_height < start_height")
-
         return self.raw_jsonrpc_request(
             "get_block_headers_range",
-            params={"start_height": start_height, "end_height": end_height},
+            params=self._get_block_headers_range_params(start_height, end_height),
         )
 
     def get_block(self, height=None, hash=None):
@@ -565,23 +696,9 @@ class JSONRPCDaemon(object):
         }
         """
 
-        if height is None and hash is None:
-            raise ValueError("height or hash must be provided")
-        elif height is not None and hash is not None:
-            raise ValueError("height and hash can not both be provided")
-
-        if height is not None:
-            if height < 0:
-                raise ValueError("{} is not a valid height".format(height))
-
-            params = {"height": int(height)}
-        else:
-            if not self._is_valid_256_hex(hash):
-                raise ValueError('blk_hash "{}" is not a valid hash'.format(hash))
-
-            params = {"hash": hash}
-
-        return self.raw_jsonrpc_request("get_block", params=params)
+        return self.raw_jsonrpc_request(
+            "get_block", params=self._get_block_params(height, hash)
+        )
 
     def get_connections(self):
         """
@@ -702,44 +819,9 @@ class JSONRPCDaemon(object):
         }
         """
 
-        if isinstance(ip, (str, int)):  # If single element paramters
-            user_bans = [{"ip": ip, "ban": ban, "seconds": seconds}]
-        else:  # If params are iterables, contrust the list of ban entries
-            if not (len(ip) == len(ban) == len(seconds)):
-                raise ValueError('"ip", "ban", and "seconds" are not the same length')
-
-            user_bans = [
-                {"ip": ip[i], "ban": ban[i], "seconds": seconds[i]}
-                for i in range(len(ip))
-            ]
-
-        # Construct the bans parameter to be passed to the RPC command
-        bans = []
-        for ban_entry in user_bans:
-            curr_ip = ban_entry["ip"]
-            curr_ban = bool(ban_entry["ban"])
-            curr_seconds = ban_entry["seconds"]
-
-            # validate IP
-            ipaddress.IPv4Address(curr_ip)
-
-            if curr_ban and curr_seconds is None:
-                raise ValueError('Whenever "ban" is True, "seconds" must not be None')
-            elif curr_seconds is not None and curr_seconds < 0:
-                raise ValueError('"seconds" can not be less than zero')
-
-            ban = {}
-            if isinstance(curr_ip, int):
-                ban["ip"] = curr_ip
-            else:
-                ban["host"] = curr_ip
-            if curr_seconds is not None:
-                ban["seconds"] = curr_seconds
-            ban["ban"] = curr_ban
-
-            bans.append(ban)
-
-        return self.raw_jsonrpc_request("set_bans", params={"bans": bans})
+        return self.raw_jsonrpc_request(
+            "set_bans", params=self._set_bans_params(ip, ban, seconds)
+        )
 
     def get_bans(self):
         """
@@ -757,14 +839,7 @@ class JSONRPCDaemon(object):
         }
         """
 
-        resp = self.raw_jsonrpc_request("get_bans")
-
-        # When there are no ban entries, the node returns a responses with no "bans" field.
-        # This is counterintuitive for the user, so I add an empty field if it's not provided.
-        if "bans" not in resp:
-            resp["bans"] = []
-
-        return resp
+        return self._bans(self.raw_jsonrpc_request("get_bans"))
 
     def flush_txpool(self, txids=None):
         """
@@ -778,14 +853,11 @@ class JSONRPCDaemon(object):
         }
         """
 
-        txids = self._validate_hashlist(txids)
-
-        resp = self.raw_jsonrpc_request("flush_txpool", params={"txids": txids})
-
-        if "transactions" not in resp:
-            resp["transactions"] = []
-
-        return resp
+        return self._flushed_txpool(
+            self.raw_jsonrpc_request(
+                "flush_txpool", params=self._flush_txpool_params(txids)
+            )
+        )
 
     def get_output_histogram(
         self, amounts, min_count=None, max_count=None, unlocked=None, recent_cutoff=None
@@ -815,24 +887,12 @@ class JSONRPCDaemon(object):
         }
         """
 
-        # Coerce amounts paramter
-        if isinstance(amounts, (Decimal, int)):
-            amounts = [to_atomic(amounts) if isinstance(amounts, Decimal) else amounts]
-        elif amounts is None:
-            raise ValueError("amounts is None")
-
-        # Construct RPC parameters
-        params = {"amounts": amounts}
-        if min_count is not None:
-            params["min_count"] = int(min_count)
-        if max_count is not None:
-            params["max_count"] = int(max_count)
-        if unlocked is not None:
-            params["unlocked"] = bool(unlocked)
-        if recent_cutoff is not None:
-            params["recent_cutoff"] = int(recent_cutoff)
-
-        return self.raw_jsonrpc_request("get_output_histogram", params=params)
+        return self.raw_jsonrpc_request(
+            "get_output_histogram",
+            params=self._get_output_histogram_params(
+                amounts, min_count, max_count, unlocked, recent_cutoff
+            ),
+        )
 
     def get_coinbase_tx_sum(self, height, count):
         """
@@ -849,13 +909,9 @@ class JSONRPCDaemon(object):
         }
         """
 
-        if height < 0:
-            raise ValueError("height < 0")
-        elif count < 0:
-            raise ValueError("count < 0")
-
         return self.raw_jsonrpc_request(
-            "get_coinbase_tx_sum", params={"height": height, "count": count}
+            "get_coinbase_tx_sum",
+            params=self._get_coinbase_tx_sum_params(height, count),
         )
 
     def get_version(self):
@@ -886,13 +942,9 @@ class JSONRPCDaemon(object):
         }
         """
 
-        if not isinstance(grace_blocks, (type(None), int)):
-            raise TypeError("grace_blocks is not an int")
-        elif grace_blocks is not None and grace_blocks < 0:
-            raise ValueError("grace_blocks < 0")
-
-        params = {"grace_blocks": grace_blocks} if grace_blocks else None
-        return self.raw_jsonrpc_request("get_fee_estimate", params=params)
+        return self.raw_jsonrpc_request(
+            "get_fee_estimate", params=self._get_fee_estimate_params(grace_blocks)
+        )
 
     def get_alternate_chains(self):
         """
@@ -927,9 +979,7 @@ class JSONRPCDaemon(object):
         }
         """
 
-        txids = self._validate_hashlist(txids)
-
-        return self.raw_jsonrpc_request("relay_tx", params={"txids": txids})
+        return self.raw_jsonrpc_request("relay_tx", params=self._relay_tx_params(txids))
 
     def sync_info(self):
         """
@@ -1229,16 +1279,9 @@ class JSONRPCDaemon(object):
         }
         """
 
-        resp = self.raw_request("/set_log_hash_rate", data={"visible": bool(visible)})
-
-        if resp["status"] == "NOT MINING":
-            raise RPCError(
-                'The node at "{url}" is not currently mining and therefore cannot set its hash rate log visibility.'.format(
-                    url=self.url
-                )
-            )
-
-        return resp
+        return self._log_hash_rate_set(
+            self.raw_request("/set_log_hash_rate", data={"visible": bool(visible)})
+        )
 
     def set_log_level(self, level):
         """
@@ -1533,14 +1576,97 @@ class JSONRPCDaemon(object):
 
         return self.raw_request("/update", data=data)
 
-    # Supporting class methods
+    # Binary RPC Methods. The responses keep binary blobs as `bytes`.
 
-    @classmethod
-    def known_log_categories(cls):
-        return cls._KNOWN_LOG_CATEGORIES
+    def get_blocks_by_height_bin(self, heights):
+        """
+        Get blocks of given heights, in binary form. Much less data is transferred than
+        with the JSON methods.
 
-    @classmethod
-    def known_log_levels(cls):
+        :param list heights: block heights
+
+        Output:
+        {
+        "blocks": list of dicts:
+            {
+            "block": bytes; the block blob
+            "txs": list of bytes; blobs of the block's transactions, excluding the miner transaction
+            }
+        "status": str; General RPC error code. "OK" means everything looks good.
+        "untrusted": bool; True for bootstrap mode, False for full sync mode.
+        }
+        """
+        heights = list(heights)
+        if any(h < 0 for h in heights):
+            raise ValueError("heights contains a negative height")
+
+        return self._bin_blocks(
+            self.raw_bin_request("/get_blocks_by_height.bin", {"heights": heights})
+        )
+
+    def get_hashes_bin(self, block_ids, start_height=0):
+        """
+        Get hashes of blocks following the last known block. The daemon finds the first block
+        of `block_ids` which is in the main chain and returns hashes of the blocks after it.
+
+        :param list block_ids: known block hashes, starting with the most recent ones and
+                    ending with the genesis block
+        :param int start_height: the height to start from, if greater than that of
+                    the block found
+
+        Output:
+        {
+        "m_block_ids": list of str; block hashes, starting with the block found
+        "start_height": unsigned int; the height of the first block
+        "current_height": unsigned int; the height of the chain
+        "status": str; General RPC error code. "OK" means everything looks good.
+        "untrusted": bool; True for bootstrap mode, False for full sync mode.
+        }
+        """
+        block_ids = self._validate_hashlist(block_ids)
+        if start_height < 0:
+            raise ValueError("start_height < 0")
+
+        return self._bin_hashes(
+            self.raw_bin_request(
+                "/get_hashes.bin",
+                {
+                    "block_ids": binascii.unhexlify("".join(block_ids)),
+                    "start_height": start_height,
+                },
+            )
+        )
+
+    def get_o_indexes_bin(self, txid):
+        """
+        Get global output indexes of a transaction.
+
+        :param str txid: transaction hash
+
+        Output:
+        {
+        "o_indexes": list of unsigned int; global indexes of the outputs
+        "status": str; General RPC error code. "OK" means everything looks good.
+        "untrusted": bool; True for bootstrap mode, False for full sync mode.
+        }
+        """
+        if not self._is_valid_256_hex(txid):
+            raise ValueError('txid "{}" is not a valid hash'.format(txid))
+
+        return self._bin_o_indexes(
+            self.raw_bin_request(
+                "/get_o_indexes.bin", {"txid": binascii.unhexlify(txid)}
+            )
+        )
+
+    # Supporting class methods
+
+    @classmethod
+    def known_log_categories(cls):
+        return cls._KNOWN_LOG_CATEGORIES
+
+    @classmethod
+    def known_log_levels(cls):
         return cls._KNOWN_LOG_LEVELS
 
     # private methods
@@ -1553,6 +1679,96 @@ class JSONRPCDaemon(object):
         if info["stagenet"]:
             self._net = NET_STAGE
 
+    def _set_chain_height(self, height):
+        if self._chain_height is None or height > self._chain_height:
+            self._chain_height = height
+
+    def _is_final(self, height):
+        """
+        Tells whether the block of given height has enough confirmations to be cached.
+        The height of the chain is learned from the responses seen so far.
+        """
+        return (
+            self._chain_height is not None
+            and self._chain_height - height >= self.cache_confirmations
+        )
+
+    def _cache_get(self, key):
+        if self.cache is None:
+            return None
+        return self.cache.get(key)
+
+    def _cache_header(self, hdr):
+        self._set_chain_height(hdr["height"] + hdr["depth"] + 1)
+        if (
+            self.cache is None
+            or hdr["orphan_status"]
+            or not self._is_final(hdr["height"])
+        ):
+            return False
+        self.cache.set(_header_key(hdr["height"]), hdr)
+        self.cache.set(_block_hash_key(hdr["height"]), hdr["hash"])
+        return True
+
+    def _cache_block_hash(self, height, bhash):
+        if self.cache is not None and self._is_final(height):
+            self.cache.set(_block_hash_key(height), bhash)
+        return bhash
+
+    def _cache_block(self, res):
+        if self.cache is None or res.get("status") != "OK":
+            return res
+        if self._cache_header(res["block_header"]):
+            self.cache.set(_block_key(res["block_header"]["hash"]), res)
+        return res
+
+    def _cached_headers(self, start_height, end_height):
+        """
+        Returns the list of headers if all of them are in the cache, otherwise `None`.
+        """
+        if self.cache is None:
+            return None
+        headers = []
+        for height in range(start_height, end_height + 1):
+            hdr = self.cache.get(_header_key(height))
+            if hdr is None:
+                return None
+            headers.append(hdr)
+        return headers
+
+    def _cached_block(self, params):
+        if self.cache is None:
+            return None
+        bhash = params.get("hash")
+        if bhash is None and "height" in params:
+            bhash = self.cache.get(_block_hash_key(params["height"]))
+        if bhash is None:
+            return None
+        return self.cache.get(_block_key(bhash))
+
+    def _cached_transactions(self, hashes):
+        """
+        Returns a `dict` of transactions found in the cache, keyed by hash.
+        """
+        txs = {}
+        if self.cache is None:
+            return txs
+        for txhash in hashes:
+            tx = self.cache.get(self._transaction_key(txhash))
+            if tx is not None:
+                txs[txhash] = self._transaction(tx)
+        return txs
+
+    def _ordered_transactions(self, hashes, txs, chunks):
+        for chunk in chunks:
+            txs.update((tx.hash, tx) for tx in chunk)
+        return [txs[txhash] for txhash in hashes if txhash in txs]
+
+    def _transaction_key(self, txhash):
+        return "tx/{:d}{:d}/{}".format(
+            bool(self.prune_transactions), bool(self.decode_as_json), txhash
+        )
+
     def _set_restricted(self):
         try:
             self.sync_info()
@@ -1561,35 +1777,365 @@ class JSONRPCDaemon(object):
         except MethodNotFound:
             self._restricted = True
 
+    def _block_chunk_size(self):
+        # the transactions of a block are fetched by all workers at once
+        return self._transactions_chunk_size() * self.transactions_workers
+
+    def _transactions_chunk_size(self):
+        if self.transactions_chunk_size:
+            return self.transactions_chunk_size
+        if self.restricted():
+            return RESTRICTED_MAX_TRANSACTIONS
+        return UNRESTRICTED_MAX_TRANSACTIONS
+
     def _do_get_transactions(self, hashes, prune):
-        res = self.raw_request(
-            "/get_transactions",
-            {"txs_hashes": hashes, "decode_as_json": True, "prune": prune},
+        return self._transactions(
+            self.raw_request(
+                "/get_transactions",
+                {
+                    "txs_hashes": hashes,
+                    "decode_as_json": self.decode_as_json,
+                    "prune": prune,
+                },
+            )
         )
+
+    # The methods below turn raw RPC results into objects. They are shared with
+    # the asynchronous backend, which only differs in the way requests are made.
+
+    def _sent_transaction(self, res):
+        if res["status"] == "OK":
+            return res
+        raise exceptions.TransactionBroadcastError(
+            "{status}: {reason}".format(**res), details=res
+        )
+
+    def _mempool(self, res):
+        txs = []
+        for tx in res.get("transactions", []):
+            txs.append(
+                Transaction(
+                    hash=tx["id_hash"],
+                    fee=from_atomic(tx["fee"]),
+                    timestamp=datetime.fromtimestamp(tx["receive_time"]),
+                    blob=tx["tx_blob"],
+                    json=tx["tx_json"],
+                    codec=self.codec,
+                    confirmations=0,
+                )
+            )
+        return txs
+
+    def _headers(self, res):
+        if res["status"] == "OK":
+            for hdr in res["headers"]:
+                self._cache_header(hdr)
+            return res["headers"]
+        raise exceptions.BackendException(res["status"])
+
+    # Parameters of the JSON RPC methods, validated
+
+    def _on_get_block_hash_params(self, height):
+        height = int(height)
+        if height < 0:
+            raise ValueError("height < 0")
+        return [height]
+
+    def _get_block_template_params(self, wallet_address, reserve_size):
+        try:
+            address.address(wallet_address)
+        except ValueError:
+            raise ValueError("wallet_address is not in a recognized address form")
+
+        if reserve_size not in range(128):
+            raise ValueError("reserve_size {} is out of bounds".format(reserve_size))
+
+        return {"wallet_address": wallet_address, "reserve_size": reserve_size}
+
+    def _submit_block_params(self, blobs):
+        if isinstance(blobs, (bytes, str)):
+            blobs = [blobs]
+
+        return [
+            binascii.hexlify(b).decode() if isinstance(b, bytes) else b for b in blobs
+        ]
+
+    def _get_block_header_by_hash_params(self, blk_hash):
+        if not self._is_valid_256_hex(blk_hash):
+            raise ValueError('blk_hash "{}" is not a valid hash'.format(blk_hash))
+        return {"hash": blk_hash}
+
+    def _get_block_header_by_height_params(self, height):
+        if height < 0:
+            raise ValueError("height < 0")
+        return {"height": height}
+
+    def _get_block_headers_range_params(self, start_height, end_height):
+        start_height = int(start_height)
+        end_height = int(end_height)
+
+        if start_height < 0:
+            raise ValueError("start_height < 0")
+        if end_height < start_height:
+            raise ValueError("end_height < start_height")
+
+        return {"start_height": start_height, "end_height": end_height}
+
+    def _get_block_params(self, height=None, hash=None):
+        if height is None and hash is None:
+            raise ValueError("height or hash must be provided")
+        elif height is not None and hash is not None:
+            raise ValueError("height and hash can not both be provided")
+
+        if height is not None:
+            if height < 0:
+                raise ValueError("{} is not a valid height".format(height))
+
+            return {"height": int(height)}
+
+        if not self._is_valid_256_hex(hash):
+            raise ValueError('blk_hash "{}" is not a valid hash'.format(hash))
+
+        return {"hash": hash}
+
+    def _set_bans_params(self, ip, ban, seconds=None):
+        if isinstance(ip, (str, int)):  # If single element paramters
+            user_bans = [{"ip": ip, "ban": ban, "seconds": seconds}]
+        else:  # If params are iterables, contrust the list of ban entries
+            if not (len(ip) == len(ban) == len(seconds)):
+                raise ValueError('"ip", "ban", and "seconds" are not the same length')
+
+            user_bans = [
+                {"ip": ip[i], "ban": ban[i], "seconds": seconds[i]}
+                for i in range(len(ip))
+            ]
+
+        # Construct the bans parameter to be passed to the RPC command
+        bans = []
+        for ban_entry in user_bans:
+            curr_ip = ban_entry["ip"]
+            curr_ban = bool(ban_entry["ban"])
+            curr_seconds = ban_entry["seconds"]
+
+            # validate IP
+            ipaddress.IPv4Address(curr_ip)
+
+            if curr_ban and curr_seconds is None:
+                raise ValueError('Whenever "ban" is True, "seconds" must not be None')
+            elif curr_seconds is not None and curr_seconds < 0:
+                raise ValueError('"seconds" can not be less than zero')
+
+            ban = {}
+            if isinstance(curr_ip, int):
+                ban["ip"] = curr_ip
+            else:
+                ban["host"] = curr_ip
+            if curr_seconds is not None:
+                ban["seconds"] = curr_seconds
+            ban["ban"] = curr_ban
+
+            bans.append(ban)
+
+        return {"bans": bans}
+
+    def _flush_txpool_params(self, txids=None):
+        return {"txids": self._validate_hashlist(txids)}
+
+    def _get_output_histogram_params(
+        self,
+        amounts,
+        min_count=None,
+        max_count=None,
+        unlocked=None,
+        recent_cutoff=None,
+    ):
+        # Coerce amounts paramter
+        if isinstance(amounts, (Decimal, int)):
+            amounts = [to_atomic(amounts) if isinstance(amounts, Decimal) else amounts]
+        elif amounts is None:
+            raise ValueError("amounts is None")
+
+        # Construct RPC parameters
+        params = {"amounts": amounts}
+        if min_count is not None:
+            params["min_count"] = int(min_count)
+        if max_count is not None:
+            params["max_count"] = int(max_count)
+        if unlocked is not None:
+            params["unlocked"] = bool(unlocked)
+        if recent_cutoff is not None:
+            params["recent_cutoff"] = int(recent_cutoff)
+        return params
+
+    def _get_coinbase_tx_sum_params(self, height, count):
+        if height < 0:
+            raise ValueError("height < 0")
+        elif count < 0:
+            raise ValueError("count < 0")
+        return {"height": height, "count": count}
+
+    def _get_fee_estimate_params(self, grace_blocks=None):
+        if not isinstance(grace_blocks, (type(None), int)):
+            raise TypeError("grace_blocks is not an int")
+        elif grace_blocks is not None and grace_blocks < 0:
+            raise ValueError("grace_blocks < 0")
+        return {"grace_blocks": grace_blocks} if grace_blocks else None
+
+    def _relay_tx_params(self, txids):
+        return {"txids": self._validate_hashlist(txids)}
+
+    def _block_params(self, bhash, height):
+        data = {}
+        if bhash:
+            data["hash"] = bhash
+        if height is not None:
+            data["height"] = height
+        return data
+
+    def _block_data(self, res):
+        """
+        Returns keyword arguments for :class:`Block <monero.block.Block>`, except for
+        `transactions`, and the list of hashes of the transactions to fetch, starting
+        with the miner one. The hashes are taken from the block blob.
+        """
         if res["status"] != "OK":
             raise exceptions.BackendException(res["status"])
-        txs = []
-        for tx in res.get("txs", []):
-            as_json = json.loads(tx["as_json"])
-            fee = as_json.get("rct_signatures", {}).get("txnFee")
+        bhdr = res["block_header"]
+        parsed = parse_block(binascii.unhexlify(res["blob"]))
+        data = {
+            "blob": res["blob"],
+            "hash": bhdr["hash"],
+            "height": bhdr["height"],
+            "timestamp": datetime.fromtimestamp(bhdr["timestamp"]),
+            "version": (bhdr["major_version"], bhdr["minor_version"]),
+            "difficulty": bhdr["difficulty"],
+            "nonce": bhdr["nonce"],
+            "orphan": bhdr["orphan_status"],
+            "prev_hash": bhdr["prev_hash"],
+            "reward": from_atomic(bhdr["reward"]),
+        }
+        txhashes = [binascii.hexlify(txhash).decode() for txhash in parsed.tx_hashes]
+        return data, [bhdr["miner_tx_hash"]] + txhashes
+
+    def _bans(self, resp):
+        # When there are no ban entries, the node returns a responses with no "bans" field.
+        # This is counterintuitive for the user, so I add an empty field if it's not provided.
+        if "bans" not in resp:
+            resp["bans"] = []
+        return resp
+
+    def _flushed_txpool(self, resp):
+        if "transactions" not in resp:
+            resp["transactions"] = []
+        return resp
+
+    def _log_hash_rate_set(self, resp):
+        if resp["status"] == "NOT MINING":
+            raise RPCError(
+                'The node at "{url}" is not currently mining and therefore cannot set its hash rate log visibility.'.format(
+                    url=self.url
+                )
+            )
+        return resp
+
+    def _bin_blocks(self, res):
+        # Epee omits empty arrays
+        res.setdefault("blocks", [])
+        for blk in res["blocks"]:
+            blk.setdefault("txs", [])
+        return res
+
+    def _bin_block_list(self, heights, res):
+        if res["status"] != "OK":
+            raise exceptions.BackendException(res["status"])
+        if len(res["blocks"]) != len(heights):
+            raise exceptions.BackendException(
+                "{:d} blocks requested, {:d} returned".format(
+                    len(heights), len(res["blocks"])
+                )
+            )
+        return [
+            self._bin_block(height, blk) for height, blk in zip(heights, res["blocks"])
+        ]
+
+    def _bin_block(self, height, blk):
+        parsed = parse_block(blk["block"])
+        if len(blk["txs"]) != len(parsed.tx_hashes):
+            raise exceptions.BackendException(
+                "Block {:d} has {:d} transactions, {:d} returned".format(
+                    height, len(parsed.tx_hashes), len(blk["txs"])
+                )
+            )
+        timestamp = datetime.fromtimestamp(parsed.timestamp)
+        txs = [
+            Transaction(
+                hash=binascii.hexlify(
+                    transaction_hash(parsed.miner_tx_blob, data=parsed.miner_tx)
+                ).decode(),
+                height=height,
+                timestamp=timestamp,
+                blob=parsed.miner_tx_blob,
+            )
+        ]
+        for txhash, txblob in zip(parsed.tx_hashes, blk["txs"]):
             txs.append(
                 Transaction(
-                    hash=tx["tx_hash"],
-                    fee=from_atomic(fee) if fee else None,
-                    height=None if tx["in_pool"] else tx["block_height"],
-                    timestamp=datetime.fromtimestamp(tx["block_timestamp"])
-                    if "block_timestamp" in tx
-                    else None,
-                    output_indices=tx["output_indices"]
-                    if "output_indices" in tx
-                    else None,
-                    blob=binascii.unhexlify(tx["as_hex"]) or None,
-                    json=as_json,
+                    hash=binascii.hexlify(txhash).decode(),
+                    height=height,
+                    timestamp=timestamp,
+                    blob=txblob,
                 )
             )
+        return Block(
+            blob=binascii.hexlify(blk["block"]).decode(),
+            hash=binascii.hexlify(block_hash(blk["block"], data=parsed)).decode(),
+            height=height,
+            timestamp=timestamp,
+            version=(parsed.major_version, parsed.minor_version),
+            nonce=parsed.nonce,
+            prev_hash=binascii.hexlify(parsed.prev_hash).decode(),
+            reward=from_atomic(sum(out.amount for out in parsed.miner_tx.outputs)),
+            transactions=txs,
+        )
+
+    def _bin_hashes(self, res):
+        blob = binascii.hexlify(res.get("m_block_ids", b"")).decode()
+        res["m_block_ids"] = [blob[i : i + 64] for i in range(0, len(blob), 64)]
+        return res
 
+    def _bin_o_indexes(self, res):
+        res.setdefault("o_indexes", [])
+        return res
+
+    def _transactions(self, res):
+        if res["status"] != "OK":
+            raise exceptions.BackendException(res["status"])
+        txs = []
+        for tx in res.get("txs", []):
+            if (
+                self.cache is not None
+                and not tx["in_pool"]
+                and self._is_final(tx["block_height"])
+            ):
+                self.cache.set(self._transaction_key(tx["tx_hash"]), tx)
+            txs.append(self._transaction(tx))
         return txs
 
+    def _transaction(self, tx):
+        return Transaction(
+            hash=tx["tx_hash"],
+            height=None if tx["in_pool"] else tx["block_height"],
+            timestamp=datetime.fromtimestamp(tx["block_timestamp"])
+            if "block_timestamp" in tx
+            else None,
+            output_indices=tx["output_indices"] if "output_indices" in tx else None,
+            blob=tx["as_hex"] or None,
+            pruned_blob=tx.get("pruned_as_hex") or None,
+            prunable_hash=tx.get("prunable_hash"),
+            json=tx.get("as_json") or None,
+            codec=self.codec,
+        )
+
     def _is_valid_256_hex(self, hexhash):
         try:
             bytearray.fromhex(hexhash)
@@ -1616,3 +2162,26 @@ class JSONRPCDaemon(object):
                 raise ValueError("hashes contains an invalid hash")
 
             return hashes
+
+
+def _chunks(items, size):
+    return [items[i : i + size] for i in range(0, len(items), size)]
+
+
+def _block_key(bhash):
+    return "block/{}".format(bhash)
+
+
+def _block_hash_key(height):
+    return "hash@{:d}".format(height)
+
+
+def _header_key(height):
+    return "header@{:d}".format(height)
+
+
+def _batch_data(calls):
+    return [
+        {"jsonrpc": "2.0", "id": idx, "method": method, "params": params or {}}
+        for idx, (method, params) in enumerate(calls)
+    ]
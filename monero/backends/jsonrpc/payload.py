@@ -0,0 +1,41 @@
+"""
+Formatting of request and response payloads for the debug log.
+
+The backends pass a :class:`LogPayload` as an argument of the log call instead of
+a formatted string. The payload is formatted only when a handler emits the record, so
+large responses cost nothing while debug logging is disabled.
+"""
+import json
+
+
+def pretty_json(data):
+    """
+    Formats a JSON-compatible structure with indentation and sorted keys.
+    """
+    return json.dumps(data, indent=2, sort_keys=True)
+
+
+class LogPayload(object):
+    """
+    A payload which is formatted on conversion to `str`.
+
+    :param data: the payload
+    :param limit: the maximal number of characters of the formatted payload, `None`
+                    meaning no limit. The rest is replaced by a note of how much was cut.
+    :param formatter: the function turning the payload into a string
+    """
+
+    __slots__ = ("data", "limit", "formatter")
+
+    def __init__(self, data, limit=None, formatter=pretty_json):
+        self.data = data
+        self.limit = limit
+        self.formatter = formatter
+
+    def __str__(self):
+        text = self.formatter(self.data)
+        if self.limit is None or len(text) <= self.limit:
+            return text
+        return "{text}... [{cut:d} more characters]".format(
+            text=text[: self.limit], cut=len(text) - self.limit
+        )
@@ -1,6 +1,4 @@
-import binascii
 from datetime import datetime
-import json
 import logging
 import operator
 import requests
@@ -12,6 +10,8 @@ from ...numbers import from_atomic, to_atomic, PaymentID
 from ...seed import Seed
 from ...transaction import Transaction, IncomingPayment, OutgoingPayment
 from .exceptions import RPCError, Unauthorized, MethodNotFound
+from .codec import default_codec
+from .payload import LogPayload
 
 _log = logging.getLogger(__name__)
 
@@ -29,9 +29,16 @@ class JSONRPCWallet(object):
     :param timeout: request timeout
     :param verify_ssl_certs: verify ssl certs for request
     :param proxy_url: a proxy to use
+    :param log_payload_limit: the maximal length of request and response payloads
+                            in the debug log, `None` meaning they're logged whole
+    :param json_codec: a :class:`JSONCodec <monero.backends.jsonrpc.codec.JSONCodec>`
+                            encoding the requests and decoding the responses. `None`
+                            means :func:`default_codec() <monero.backends.jsonrpc.codec.default_codec>`,
+                            which uses `orjson` or `ujson` if installed.
     """
 
     _master_address = None
+    _account_class = Account
 
     def __init__(
         self,
@@ -44,6 +51,8 @@ class JSONRPCWallet(object):
         timeout=30,
         verify_ssl_certs=True,
         proxy_url=None,
+        log_payload_limit=None,
+        json_codec=None,
     ):
         self.url = "{protocol}://{host}:{port}/json_rpc".format(
             protocol=protocol, host=host, port=port
@@ -53,6 +62,8 @@ class JSONRPCWallet(object):
         self.session = requests.Session()
         self.timeout = timeout
         self.verify_ssl_certs = verify_ssl_certs
+        self.log_payload_limit = log_payload_limit
+        self.codec = default_codec() if json_codec is None else json_codec
         self.proxies = {protocol: proxy_url}
         _log.debug(
             "JSONRPC wallet backend auth: '{user}'/'{stars}'".format(
@@ -73,8 +84,80 @@ class JSONRPCWallet(object):
         return Seed(self.raw_request("query_key", {"key_type": "mnemonic"})["key"])
 
     def accounts(self):
+        return self._accounts(self.raw_request("get_accounts"))
+
+    def new_account(self, label=None):
+        return self._new_account(
+            self.raw_request("create_account", {"label": label}), label
+        )
+
+    def addresses(self, account=0, addr_indices=None):
+        return self._addresses(
+            self.raw_request(
+                "getaddress", self._addresses_params(account, addr_indices)
+            )
+        )
+
+    def new_address(self, account=0, label=None):
+        _address = self.raw_request(
+            "create_address", {"account_index": account, "label": label}
+        )
+        return SubAddress(_address["address"]), _address["address_index"]
+
+    def balances(self, account=0):
+        return self._balances(
+            self.raw_request("getbalance", {"account_index": account})
+        )
+
+    def address_balance(self, account=0, indices=None):
+        indices = [] if indices is None else indices
+        _balances = self.raw_request(
+            "getbalance",
+            {
+                "account_index": account,
+                "address_indices": indices,
+            },
+        )
+        return self._address_balance(_balances)
+
+    def transfers_in(self, account, pmtfilter):
+        method, params = self._transfers_in_params(account, pmtfilter)
+        if method == "get_transfer_by_txid":
+            responses = self._transfers_by_txid(params, pmtfilter.tx_ids)
+        else:
+            responses = [self.raw_request(method, params)]
+        return self._transfers_in(method, pmtfilter, responses)
+
+    def transfers_out(self, account, pmtfilter):
+        if pmtfilter.tx_ids:
+            responses = self._transfers_by_txid(
+                {"account_index": account}, pmtfilter.tx_ids
+            )
+        else:
+            responses = [
+                self.raw_request(
+                    "get_transfers", self._transfers_out_params(account, pmtfilter)
+                )
+            ]
+        return self._transfers_out(pmtfilter, responses)
+
+    def _transfers_by_txid(self, params, tx_ids):
+        responses = []
+        for txid in tx_ids:
+            try:
+                responses.append(
+                    self.raw_request(
+                        "get_transfer_by_txid",
+                        dict(params, txid=txid),
+                        squelch_error_logging=True,
+                    )
+                )
+            except exceptions.TransactionNotFound:
+                continue
+        return responses
+
+    def _accounts(self, _accounts):
         accounts = []
-        _accounts = self.raw_request("get_accounts")
         idx = 0
         self._master_address = Address(
             _accounts["subaddress_accounts"][0]["base_address"]
@@ -82,24 +165,27 @@ class JSONRPCWallet(object):
         for _acc in _accounts["subaddress_accounts"]:
             assert idx == _acc["account_index"]
             accounts.append(
-                Account(self, _acc["account_index"], label=_acc.get("label"))
+                self._account_class(
+                    self, _acc["account_index"], label=_acc.get("label")
+                )
             )
             idx += 1
         return accounts
 
-    def new_account(self, label=None):
-        _account = self.raw_request("create_account", {"label": label})
+    def _new_account(self, _account, label):
         # NOTE: the following should re-read label by _account.get('label') but the RPC
         # doesn't return that detail here
-        return Account(self, _account["account_index"], label=label), SubAddress(
-            _account["address"]
-        )
+        return self._account_class(
+            self, _account["account_index"], label=label
+        ), SubAddress(_account["address"])
 
-    def addresses(self, account=0, addr_indices=None):
+    def _addresses_params(self, account, addr_indices):
         qdata = {"account_index": account}
         if addr_indices:
             qdata["address_index"] = addr_indices
-        _addresses = self.raw_request("getaddress", qdata)
+        return qdata
+
+    def _addresses(self, _addresses):
         addresses = [None] * (
             max(map(operator.itemgetter("address_index"), _addresses["addresses"])) + 1
         )
@@ -109,28 +195,13 @@ class JSONRPCWallet(object):
             )
         return addresses
 
-    def new_address(self, account=0, label=None):
-        _address = self.raw_request(
-            "create_address", {"account_index": account, "label": label}
-        )
-        return SubAddress(_address["address"]), _address["address_index"]
-
-    def balances(self, account=0):
-        _balance = self.raw_request("getbalance", {"account_index": account})
+    def _balances(self, _balance):
         return (
             from_atomic(_balance["balance"]),
             from_atomic(_balance["unlocked_balance"]),
         )
 
-    def address_balance(self, account=0, indices=None):
-        indices = [] if indices is None else indices
-        _balances = self.raw_request(
-            "getbalance",
-            {
-                "account_index": account,
-                "address_indices": indices,
-            },
-        )
+    def _address_balance(self, _balances):
         return [
             (
                 bal["address_index"],
@@ -141,10 +212,9 @@ class JSONRPCWallet(object):
             for bal in _balances["per_subaddress"]
         ]
 
-    def transfers_in(self, account, pmtfilter):
+    def _transfers_in_params(self, account, pmtfilter):
         params = {"account_index": account, "pending": False}
         method = "get_transfers"
-        _pmts = {}
 
         if pmtfilter.tx_ids:
             method = "get_transfer_by_txid"
@@ -168,56 +238,44 @@ class JSONRPCWallet(object):
             if pmtfilter.max_height:
                 params["max_height"] = pmtfilter.max_height
                 params["filter_by_height"] = True
-            _pmts = self.raw_request(method, params)
+        elif method == "get_bulk_payments":
+            # NOTE: the API uses (min, max] range which is confusing
+            params["min_block_height"] = (pmtfilter.min_height or 1) - 1
+        return method, params
+
+    def _transfers_in(self, method, pmtfilter, responses):
+        _pmts = responses[-1] if responses else {}
+        if method == "get_transfers":
             pmts = _pmts.get("in", [])
         elif method == "get_transfer_by_txid":
             pmts = []
-            for txid in pmtfilter.tx_ids:
-                params["txid"] = txid
-                try:
-                    _pmts = self.raw_request(method, params, squelch_error_logging=True)
-                except exceptions.TransactionNotFound:
-                    continue
-                pmts.extend(_pmts["transfers"])
-                # Issue #71: incoming payments to self will have excess 'destinations' key. Remove.
-                for pmt in pmts:
-                    try:
-                        del pmt["destinations"]
-                    except KeyError:
-                        pass
+            for _txpmts in responses:
+                pmts.extend(_txpmts["transfers"])
+            # Issue #71: incoming payments to self will have excess 'destinations' key. Remove.
+            for pmt in pmts:
+                pmt.pop("destinations", None)
         else:
-            # NOTE: the API uses (min, max] range which is confusing
-            params["min_block_height"] = (pmtfilter.min_height or 1) - 1
-            _pmts = self.raw_request(method, params)
             pmts = _pmts.get("payments", [])
         if pmtfilter.unconfirmed:
             pmts.extend(_pmts.get("pool", []))
         return list(pmtfilter.filter(map(self._inpayment, pmts)))
 
-    def transfers_out(self, account, pmtfilter):
+    def _transfers_out_params(self, account, pmtfilter):
+        return {
+            "account_index": account,
+            "in": False,
+            "out": pmtfilter.confirmed,
+            "pool": False,
+            "pending": pmtfilter.unconfirmed,
+        }
+
+    def _transfers_out(self, pmtfilter, responses):
         if pmtfilter.tx_ids:
             pmts = []
-            for txid in pmtfilter.tx_ids:
-                try:
-                    _pmts = self.raw_request(
-                        "get_transfer_by_txid",
-                        {"account_index": account, "txid": txid},
-                        squelch_error_logging=True,
-                    )
-                except exceptions.TransactionNotFound:
-                    continue
+            for _pmts in responses:
                 pmts.extend(_pmts["transfers"])
         else:
-            _pmts = self.raw_request(
-                "get_transfers",
-                {
-                    "account_index": account,
-                    "in": False,
-                    "out": pmtfilter.confirmed,
-                    "pool": False,
-                    "pending": pmtfilter.unconfirmed,
-                },
-            )
+            _pmts = responses[0]
             pmts = _pmts.get("out", [])
             if pmtfilter.unconfirmed:
                 pmts.extend(_pmts.get("pending", []))
@@ -261,7 +319,7 @@ class JSONRPCWallet(object):
                 "timestamp": datetime.fromtimestamp(data["timestamp"])
                 if "timestamp" in data
                 else None,
-                "blob": binascii.unhexlify(data.get("blob", "")),
+                "blob": data.get("blob") or None,
                 "confirmations": data.get("confirmations", None),
             }
         )
@@ -278,11 +336,8 @@ class JSONRPCWallet(object):
         return self.raw_request("export_key_images")["signed_key_images"]
 
     def import_key_images(self, key_images):
-        _data = self.raw_request("import_key_images", {"signed_key_images": key_images})
-        return (
-            _data["height"],
-            from_atomic(_data["spent"]),
-            from_atomic(_data["unspent"]),
+        return self._imported_key_images(
+            self.raw_request("import_key_images", {"signed_key_images": key_images})
         )
 
     def transfer(
@@ -293,6 +348,46 @@ class JSONRPCWallet(object):
         unlock_time=0,
         account=0,
         relay=True,
+    ):
+        data = self._transfer_params(
+            destinations, priority, payment_id, unlock_time, account, relay
+        )
+        return self._transferred(self.raw_request("transfer_split", data), payment_id)
+
+    def sweep_all(
+        self,
+        destination,
+        priority,
+        payment_id=None,
+        subaddr_indices=None,
+        unlock_time=0,
+        account=0,
+        relay=True,
+    ):
+        if not subaddr_indices:
+            subaddr_indices = self._unlocked_subaddr_indices(
+                self.raw_request("get_balance", {"account_index": account})
+            )
+        data = self._sweep_all_params(
+            destination,
+            priority,
+            payment_id,
+            subaddr_indices,
+            unlock_time,
+            account,
+            relay,
+        )
+        return self._swept(self.raw_request("sweep_all", data), payment_id)
+
+    def _imported_key_images(self, _data):
+        return (
+            _data["height"],
+            from_atomic(_data["spent"]),
+            from_atomic(_data["unspent"]),
+        )
+
+    def _transfer_params(
+        self, destinations, priority, payment_id, unlock_time, account, relay
     ):
         data = {
             "account_index": account,
@@ -314,48 +409,29 @@ class JSONRPCWallet(object):
         }
         if payment_id is not None:
             data["payment_id"] = str(PaymentID(payment_id))
-        _transfers = self.raw_request("transfer_split", data)
-        _pertx = [
-            dict(_tx)
-            for _tx in map(
-                lambda vs: zip(
-                    ("txid", "amount", "fee", "key", "blob", "payment_id"), vs
-                ),
-                zip(
-                    *[
-                        _transfers[k]
-                        for k in (
-                            "tx_hash_list",
-                            "amount_list",
-                            "fee_list",
-                            "tx_key_list",
-                            "tx_blob_list",
-                        )
-                    ]
-                ),
-            )
-        ]
-        for d in _pertx:
-            d["payment_id"] = payment_id
-        return [self._tx(data) for data in _pertx]
+        return data
 
-    def sweep_all(
+    def _transferred(self, _transfers, payment_id):
+        return [self._tx(data) for data in self._pertx(_transfers, payment_id)]
+
+    def _unlocked_subaddr_indices(self, bals):
+        # retrieve indices of all subaddresses with positive unlocked balance
+        subaddr_indices = []
+        for subaddr in bals["per_subaddress"]:
+            if subaddr.get("unlocked_balance", 0):
+                subaddr_indices.append(subaddr["address_index"])
+        return subaddr_indices
+
+    def _sweep_all_params(
         self,
         destination,
         priority,
-        payment_id=None,
-        subaddr_indices=None,
-        unlock_time=0,
-        account=0,
-        relay=True,
+        payment_id,
+        subaddr_indices,
+        unlock_time,
+        account,
+        relay,
     ):
-        if not subaddr_indices:
-            # retrieve indices of all subaddresses with positive unlocked balance
-            bals = self.raw_request("get_balance", {"account_index": account})
-            subaddr_indices = []
-            for subaddr in bals["per_subaddress"]:
-                if subaddr.get("unlocked_balance", 0):
-                    subaddr_indices.append(subaddr["address_index"])
         data = {
             "account_index": account,
             "address": str(address(destination)),
@@ -368,7 +444,17 @@ class JSONRPCWallet(object):
         }
         if payment_id is not None:
             data["payment_id"] = str(PaymentID(payment_id))
-        _transfers = self.raw_request("sweep_all", data)
+        return data
+
+    def _swept(self, _transfers, payment_id):
+        return list(
+            zip(
+                [self._tx(data) for data in self._pertx(_transfers, payment_id)],
+                map(from_atomic, _transfers["amount_list"]),
+            )
+        )
+
+    def _pertx(self, _transfers, payment_id):
         _pertx = [
             dict(_tx)
             for _tx in map(
@@ -391,55 +477,58 @@ class JSONRPCWallet(object):
         ]
         for d in _pertx:
             d["payment_id"] = payment_id
-        return list(
-            zip(
-                [self._tx(data) for data in _pertx],
-                map(from_atomic, _transfers["amount_list"]),
-            )
-        )
+        return _pertx
 
     def raw_request(self, method, params=None, squelch_error_logging=False):
         hdr = {"Content-Type": "application/json"}
         data = {"jsonrpc": "2.0", "id": 0, "method": method, "params": params or {}}
         _log.debug(
-            "Method: {method}\nParams:\n{params}".format(
-                method=method, params=json.dumps(params, indent=2, sort_keys=True)
-            )
+            "Method: %s\nParams:\n%s",
+            method,
+            LogPayload(params, self.log_payload_limit),
         )
         rsp = self.session.post(
             self.url,
             headers=hdr,
-            data=json.dumps(data),
+            data=self.codec.dumps(data),
             auth=self.auth,
             timeout=self.timeout,
             verify=self.verify_ssl_certs,
             proxies=self.proxies,
         )
-
-        if rsp.status_code == 401:
+        self._check_status(method, rsp.status_code)
+        return self._check_result(method, self._decode(rsp), squelch_error_logging)
+
+    def _decode(self, rsp):
+        content = rsp.content
+        if isinstance(content, (bytes, str)):
+            return self.codec.loads(content)
+        # responses which aren't read from the network, like mocked ones, may lack the body
+        return rsp.json()
+
+    def _check_status(self, method, status_code):
+        if status_code == 401:
             raise Unauthorized("401 Unauthorized. Invalid RPC user name or password.")
-        elif rsp.status_code != 200:
+        elif status_code != 200:
             raise RPCError(
                 "Invalid HTTP status {code} for method {method}.".format(
-                    code=rsp.status_code, method=method
+                    code=status_code, method=method
                 )
             )
-        result = rsp.json()
-        _ppresult = json.dumps(result, indent=2, sort_keys=True)
-        _log.debug("Result:\n{result}".format(result=_ppresult))
+
+    def _check_result(self, method, result, squelch_error_logging):
+        _log.debug("Result:\n%s", LogPayload(result, self.log_payload_limit))
 
         if "error" in result:
             err = result["error"]
             if not squelch_error_logging:
-                _log.error("JSON RPC error:\n{result}".format(result=_ppresult))
+                _log.error("JSON RPC error:\n%s", LogPayload(result))
             if err["code"] in _err2exc:
                 raise _err2exc[err["code"]](err["message"])
             else:
                 raise RPCError(
                     "Method '{method}' failed with RPC Error of unknown code {code}, "
-                    "message: {message}".format(
-                        method=method, data=data, result=result, **err
-                    )
+                    "message: {message}".format(method=method, **err)
                 )
         return result["result"]
 
@@ -9,47 +9,23 @@
 #  + optimized
 #  + proper exceptions instead of returning errors as results
 
+from binascii import hexlify, unhexlify
+
 __alphabet = [
     ord(s) for s in "123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz"
 ]
 __b58base = 58
-__UINT64MAX = 2 ** 64
+__UINT64MAX = 2**64
 __encodedBlockSizes = [0, 2, 3, 5, 6, 7, 9, 10, 11]
+__decodedBlockSizes = {size: idx for idx, size in enumerate(__encodedBlockSizes)}
 __fullBlockSize = 8
 __fullEncodedBlockSize = 11
 
-
-def _hexToBin(hex_):
-    if len(hex_) % 2 != 0:
-        raise ValueError("Hex string has invalid length: %d" % len(hex_))
-    return [int(hex_[i : i + 2], 16) for i in range(0, len(hex_), 2)]
-
-
-def _binToHex(bin_):
-    return "".join("%02x" % int(b) for b in bin_)
-
-
-def _uint8be_to_64(data):
-    if not (1 <= len(data) <= 8):
-        raise ValueError("Invalid input length: %d" % len(data))
-
-    res = 0
-    for b in data:
-        res = res << 8 | b
-    return res
-
-
-def _uint64_to_8be(num, size):
-    if size < 1 or size > 8:
-        raise ValueError("Invalid input length: %d" % size)
-    res = [0] * size
-
-    twopow8 = 2 ** 8
-    for i in range(size - 1, -1, -1):
-        res[i] = num % twopow8
-        num = num // twopow8
-
-    return res
+# reverse lookup: ASCII code -> digit value, -1 for characters out of the alphabet
+__digits = [-1] * 256
+for __i, __c in enumerate(__alphabet):
+    __digits[__c] = __i
+del __i, __c
 
 
 def encode_block(data, buf, index):
@@ -58,21 +34,23 @@ def encode_block(data, buf, index):
     if l_data < 1 or l_data > __fullEncodedBlockSize:
         raise ValueError("Invalid block length: %d" % l_data)
 
-    num = _uint8be_to_64(data)
+    num = int.from_bytes(bytes(data), "big")
     i = __encodedBlockSizes[l_data] - 1
 
     while num > 0:
-        remainder = num % __b58base
-        num = num // __b58base
+        num, remainder = divmod(num, __b58base)
         buf[index + i] = __alphabet[remainder]
         i -= 1
 
     return buf
 
 
-def encode(hex):
-    """Encode hexadecimal string as base58 (ex: encoding a Monero address)."""
-    data = _hexToBin(hex)
+def encode_bytes(data):
+    """Encode binary data as base58 (ex: encoding a Monero address).
+
+    :param data: `bytes` or `bytearray`
+    :rtype: str
+    """
     l_data = len(data)
 
     if l_data == 0:
@@ -87,24 +65,36 @@ def encode(hex):
     res = bytearray([__alphabet[0]] * res_size)
 
     for i in range(full_block_count):
-        res = encode_block(
+        encode_block(
             data[(i * __fullBlockSize) : (i * __fullBlockSize + __fullBlockSize)],
             res,
             i * __fullEncodedBlockSize,
         )
 
     if last_block_size > 0:
-        res = encode_block(
-            data[
-                (full_block_count * __fullBlockSize) : (
-                    full_block_count * __fullBlockSize + last_block_size
-                )
-            ],
+        encode_block(
+            data[(full_block_count * __fullBlockSize) :],
             res,
             full_block_count * __fullEncodedBlockSize,
         )
 
-    return bytes(res).decode("ascii")
+    return res.decode("ascii")
+
+
+def encode(hex):
+    """Encode hexadecimal string as base58 (ex: encoding a Monero address)."""
+    if len(hex) % 2 != 0:
+        raise ValueError("Hex string has invalid length: %d" % len(hex))
+    return encode_bytes(unhexlify(hex))
+
+
+def encode_many(items):
+    """Encode a sequence of binary data items as base58.
+
+    :param items: iterable of `bytes`
+    :rtype: list of str
+    """
+    return [encode_bytes(data) for data in items]
 
 
 def decode_block(data, buf, index):
@@ -113,55 +103,52 @@ def decode_block(data, buf, index):
     if l_data < 1 or l_data > __fullEncodedBlockSize:
         raise ValueError("Invalid block length: %d" % l_data)
 
-    res_size = __encodedBlockSizes.index(l_data)
+    res_size = __decodedBlockSizes.get(l_data, 0)
     if res_size <= 0:
         raise ValueError("Invalid block size: %d" % res_size)
 
     res_num = 0
-    order = 1
-    for i in range(l_data - 1, -1, -1):
-        digit = __alphabet.index(data[i])
+    for c in data:
+        digit = __digits[c]
         if digit < 0:
-            raise ValueError("Invalid symbol: %s" % data[i])
-
-        product = order * digit + res_num
-        if product > __UINT64MAX:
-            raise ValueError(
-                "Overflow: %d * %d + %d = %d" % (order, digit, res_num, product)
-            )
-
-        res_num = product
-        order = order * __b58base
+            raise ValueError("Invalid symbol: %s" % chr(c))
+        res_num = res_num * __b58base + digit
 
+    if res_num >= __UINT64MAX:
+        raise ValueError("Overflow: %d doesn't fit in 64 bits" % res_num)
     if res_size < __fullBlockSize and 2 ** (8 * res_size) <= res_num:
         raise ValueError("Overflow: %d doesn't fit in %d bit(s)" % (res_num, res_size))
 
-    tmp_buf = _uint64_to_8be(res_num, res_size)
-    buf[index : index + len(tmp_buf)] = tmp_buf
+    buf[index : index + res_size] = res_num.to_bytes(res_size, "big")
 
     return buf
 
 
-def decode(enc):
-    """Decode a base58 string (ex: a Monero address) into hexidecimal form."""
-    enc = bytearray(enc, encoding="ascii")
+def decode_bytes(enc):
+    """Decode a base58 string (ex: a Monero address) into binary data.
+
+    :param enc: `str` or ASCII `bytes`
+    :rtype: bytes
+    """
+    if isinstance(enc, str):
+        enc = enc.encode("ascii")
     l_enc = len(enc)
 
     if l_enc == 0:
-        return ""
+        return b""
 
     full_block_count = l_enc // __fullEncodedBlockSize
     last_block_size = l_enc % __fullEncodedBlockSize
     try:
-        last_block_decoded_size = __encodedBlockSizes.index(last_block_size)
-    except ValueError:
+        last_block_decoded_size = __decodedBlockSizes[last_block_size]
+    except KeyError:
         raise ValueError("Invalid encoded length: %d" % l_enc)
 
     data_size = full_block_count * __fullBlockSize + last_block_decoded_size
 
     data = bytearray(data_size)
     for i in range(full_block_count):
-        data = decode_block(
+        decode_block(
             enc[
                 (i * __fullEncodedBlockSize) : (
                     i * __fullEncodedBlockSize + __fullEncodedBlockSize
@@ -172,14 +159,24 @@ def decode(enc):
         )
 
     if last_block_size > 0:
-        data = decode_block(
-            enc[
-                (full_block_count * __fullEncodedBlockSize) : (
-                    full_block_count * __fullEncodedBlockSize + last_block_size
-                )
-            ],
+        decode_block(
+            enc[(full_block_count * __fullEncodedBlockSize) :],
             data,
             full_block_count * __fullBlockSize,
         )
 
-    return _binToHex(data)
+    return bytes(data)
+
+
+def decode(enc):
+    """Decode a base58 string (ex: a Monero address) into hexidecimal form."""
+    return hexlify(decode_bytes(enc)).decode()
+
+
+def decode_many(items):
+    """Decode a sequence of base58 strings into binary data.
+
+    :param items: iterable of `str`
+    :rtype: list of bytes
+    """
+    return [decode_bytes(enc) for enc in items]
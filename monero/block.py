@@ -1,11 +1,18 @@
+import binascii
+import collections.abc
 import operator
+from . import exceptions
 from .transaction import Transaction
+from .transaction.serialization import block_hash
 
 
 class Block(object):
     """
     A Monero block. Identified by `hash` (optionaly by `height`).
 
+    The `transactions` may be a :class:`TransactionList`, which fetches them only when
+    accessed.
+
     This class is not intended to be turned into objects by the user,
     it is used by backends.
     """
@@ -39,6 +46,16 @@ class Block(object):
         self.transactions = kwargs.get("transactions", self.transactions or [])
         self.blob = kwargs.get("blob", self.blob)
 
+    def compute_hash(self):
+        """
+        Computes the block id from the blob, without relying on the backend.
+
+        :rtype: str
+        """
+        if not self.blob:
+            raise ValueError("Block {} has no blob".format(self.hash))
+        return binascii.hexlify(block_hash(binascii.unhexlify(self.blob))).decode()
+
     def __eq__(self, other):
         if isinstance(other, Block):
             return self.hash == other.hash
@@ -56,4 +73,74 @@ class Block(object):
                 "Only Transaction or hash strings may be used to test existence in Blocks, "
                 "got '{:s}'".format(tx)
             )
+        if isinstance(self.transactions, TransactionList):
+            return txid in self.transactions
         return txid in map(operator.attrgetter("hash"), self.transactions)
+
+
+class TransactionList(collections.abc.Sequence):
+    """
+    A sequence of transactions of known hashes, which are fetched only when accessed.
+    Accessing a transaction fetches the whole chunk it belongs to. Checking whether
+    a transaction is in the list, as well as the length of the list, needs no fetching.
+
+    This class is not intended to be turned into objects by the user,
+    it is used by backends.
+
+    :param hashes: the hashes of the transactions, in order
+    :param fetch: a callable returning a list of
+                :class:`Transaction <monero.transaction.Transaction>` for a list of hashes
+    :param chunk_size: the number of transactions fetched at once, or a callable returning
+                it, which is called on the first fetch
+    :param transactions: the transactions available already
+    """
+
+    def __init__(self, hashes, fetch, chunk_size=100, transactions=None):
+        self.hashes = list(hashes)
+        self._hashset = frozenset(self.hashes)
+        self._fetch = fetch
+        self._chunk_size = chunk_size
+        self._txs = {tx.hash: tx for tx in transactions or ()}
+
+    def __len__(self):
+        return len(self.hashes)
+
+    def __getitem__(self, idx):
+        if isinstance(idx, slice):
+            return [self[i] for i in range(*idx.indices(len(self)))]
+        txhash = self.hashes[idx]
+        if txhash not in self._txs:
+            idx = idx % len(self.hashes)
+            if callable(self._chunk_size):
+                self._chunk_size = self._chunk_size()
+            start = idx - idx % self._chunk_size
+            self._load(self.hashes[start : start + self._chunk_size])
+        return self._txs[txhash]
+
+    def __iter__(self):
+        for i in range(len(self.hashes)):
+            yield self[i]
+
+    def __contains__(self, tx):
+        if isinstance(tx, Transaction):
+            tx = tx.hash
+        return tx in self._hashset
+
+    def __repr__(self):
+        return repr(self.hashes)
+
+    def load(self):
+        """Fetches all transactions which haven't been fetched yet."""
+        self._load(self.hashes)
+
+    def _load(self, hashes):
+        missing = [txhash for txhash in hashes if txhash not in self._txs]
+        if not missing:
+            return
+        for tx in self._fetch(missing):
+            self._txs[tx.hash] = tx
+        for txhash in missing:
+            if txhash not in self._txs:
+                raise exceptions.BackendException(
+                    "Transaction {:s} not returned by the backend".format(txhash)
+                )
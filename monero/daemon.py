@@ -77,6 +77,18 @@ class Daemon(object):
             raise ValueError("Height or hash must be specified")
         return self._backend.block(bhash=bhash, height=height)
 
+    def blocks(self, heights):
+        """
+        Returns blocks of specified heights, with all their transactions. They are fetched
+        in the compact binary form, which makes it the cheaper way to get many blocks.
+        Unlike with :meth:`block`, the outputs of the transactions have no global index.
+
+        :param heights: list of int
+
+        :rtype: list of :class:`Block <monero.block.Block>`
+        """
+        return self._backend.blocks(heights)
+
     def transactions(self, hashes):
         """
         Returns transactions matching given hashes. Accepts single hash or a sequence.
@@ -86,3 +98,69 @@ class Daemon(object):
         if isinstance(hashes, str):
             hashes = [hashes]
         return self._backend.transactions(hashes)
+
+
+class AsyncDaemon(Daemon):
+    """Asynchronous Monero daemon.
+
+    Provides the same interface as :class:`Daemon`, but all methods are coroutines
+    and the `net` property has to be awaited. Many concurrent calls may be made within
+    a single event loop.
+
+    :param backend: an asynchronous daemon backend
+    :param \\**kwargs: arguments to initialize an
+                        :class:`AsyncJSONRPCDaemon <monero.backends.jsonrpc.AsyncJSONRPCDaemon>`
+                        instance if no backend is given
+    """
+
+    def __init__(self, backend=None, **kwargs):
+        if backend and len(kwargs):
+            raise ValueError("backend already given, other arguments are extraneous")
+
+        if not backend:
+            from .backends.jsonrpc.asyncdaemon import AsyncJSONRPCDaemon
+
+            backend = AsyncJSONRPCDaemon(**kwargs)
+        self._backend = backend
+
+    async def close(self):
+        """Closes the backend's connections."""
+        await self._backend.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    async def info(self):
+        return await self._backend.info()
+
+    @property
+    def net(self):
+        return self._backend.net()
+
+    async def height(self):
+        return (await self._backend.info())["height"]
+
+    async def send_transaction(self, tx, relay=True):
+        return await self._backend.send_transaction(tx.blob, relay=relay)
+
+    async def mempool(self):
+        return await self._backend.mempool()
+
+    async def headers(self, start_height, end_height=None):
+        return await self._backend.headers(start_height, end_height)
+
+    async def block(self, bhash=None, height=None):
+        if height is None and bhash is None:
+            raise ValueError("Height or hash must be specified")
+        return await self._backend.block(bhash=bhash, height=height)
+
+    async def blocks(self, heights):
+        return await self._backend.blocks(heights)
+
+    async def transactions(self, hashes):
+        if isinstance(hashes, str):
+            hashes = [hashes]
+        return await self._backend.transactions(hashes)
@@ -2,6 +2,7 @@ import binascii
 import nacl.bindings
 
 edwards_add = nacl.bindings.crypto_core_ed25519_add
+edwards_sub = nacl.bindings.crypto_core_ed25519_sub
 inv = nacl.bindings.crypto_core_ed25519_scalar_invert
 scalar_add = nacl.bindings.crypto_core_ed25519_scalar_add
 scalarmult_B = nacl.bindings.crypto_scalarmult_ed25519_base_noclamp
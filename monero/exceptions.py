@@ -14,6 +14,10 @@ class DaemonIsBusy(BackendException):
     pass
 
 
+class ReorganizationTooDeep(MoneroException):
+    pass
+
+
 class AccountException(MoneroException):
     pass
 
@@ -0,0 +1,212 @@
+"""
+Encoder and decoder of the Epee portable storage format, used by the daemon's binary
+(``.bin``) RPC endpoints.
+
+The data is a section (a `dict` with `str` keys) holding integers, booleans, floats, strings,
+nested sections and arrays of any of these. Strings are binary and decode to `bytes`.
+"""
+import struct
+
+SIGNATURE = b"\x01\x11\x01\x01\x01\x01\x02\x01\x01"
+
+TYPE_INT64 = 1
+TYPE_INT32 = 2
+TYPE_INT16 = 3
+TYPE_INT8 = 4
+TYPE_UINT64 = 5
+TYPE_UINT32 = 6
+TYPE_UINT16 = 7
+TYPE_UINT8 = 8
+TYPE_DOUBLE = 9
+TYPE_STRING = 10
+TYPE_BOOL = 11
+TYPE_OBJECT = 12
+TYPE_ARRAY = 13
+FLAG_ARRAY = 0x80
+
+_FIXED = {
+    TYPE_INT64: struct.Struct("<q"),
+    TYPE_INT32: struct.Struct("<i"),
+    TYPE_INT16: struct.Struct("<h"),
+    TYPE_INT8: struct.Struct("<b"),
+    TYPE_UINT64: struct.Struct("<Q"),
+    TYPE_UINT32: struct.Struct("<I"),
+    TYPE_UINT16: struct.Struct("<H"),
+    TYPE_UINT8: struct.Struct("<B"),
+    TYPE_DOUBLE: struct.Struct("<d"),
+}
+
+
+def loads(data):
+    """
+    Decodes portable storage data.
+
+    :param data: `bytes` starting with the storage signature
+    :rtype: dict
+    """
+    return _Decoder(data).decode()
+
+
+def dumps(section):
+    """
+    Encodes a `dict` into portable storage data. Non-negative integers are stored as
+    unsigned 64-bit numbers, negative ones as signed, and `str` values as UTF-8 strings.
+    Empty lists are omitted, as the type of their items is unknown.
+
+    :param section: `dict` with `str` keys
+    :rtype: bytes
+    """
+    out = bytearray(SIGNATURE)
+    _dump_section(out, section)
+    return bytes(out)
+
+
+def _pack_varint(value):
+    if value < 0x40:
+        return struct.pack("<B", value << 2)
+    elif value < 0x4000:
+        return struct.pack("<H", value << 2 | 1)
+    elif value < 0x40000000:
+        return struct.pack("<I", value << 2 | 2)
+    elif value < 0x4000000000000000:
+        return struct.pack("<Q", value << 2 | 3)
+    raise ValueError("Value {:d} is too big for a varint".format(value))
+
+
+def _value_type(value):
+    if isinstance(value, bool):
+        return TYPE_BOOL
+    elif isinstance(value, int):
+        return TYPE_UINT64 if value >= 0 else TYPE_INT64
+    elif isinstance(value, float):
+        return TYPE_DOUBLE
+    elif isinstance(value, (bytes, bytearray, str)):
+        return TYPE_STRING
+    elif isinstance(value, dict):
+        return TYPE_OBJECT
+    elif isinstance(value, (list, tuple)):
+        return TYPE_ARRAY
+    raise TypeError("Cannot encode {} in portable storage".format(type(value)))
+
+
+def _dump_section(out, section):
+    entries = [
+        (name, value)
+        for name, value in section.items()
+        if not (isinstance(value, (list, tuple)) and not value)
+    ]
+    out += _pack_varint(len(entries))
+    for name, value in entries:
+        name = name.encode()
+        if len(name) > 255:
+            raise ValueError("Key {!r} is too long".format(name))
+        out.append(len(name))
+        out += name
+        _dump_entry(out, value)
+
+
+def _dump_entry(out, value):
+    vtype = _value_type(value)
+    if vtype == TYPE_ARRAY:
+        itype = _value_type(value[0])
+        if itype == TYPE_ARRAY:
+            raise TypeError("Cannot encode nested arrays in portable storage")
+        out.append(itype | FLAG_ARRAY)
+        out += _pack_varint(len(value))
+        for item in value:
+            if _value_type(item) != itype:
+                raise TypeError("Array items must be of the same type")
+            _dump_value(out, itype, item)
+    else:
+        out.append(vtype)
+        _dump_value(out, vtype, value)
+
+
+def _dump_value(out, vtype, value):
+    if vtype == TYPE_STRING:
+        if isinstance(value, str):
+            value = value.encode()
+        out += _pack_varint(len(value))
+        out += value
+    elif vtype == TYPE_BOOL:
+        out.append(1 if value else 0)
+    elif vtype == TYPE_OBJECT:
+        _dump_section(out, value)
+    else:
+        out += _FIXED[vtype].pack(value)
+
+
+class _Decoder(object):
+    """
+    Walks over the data with an integer cursor, like
+    :class:`ExtraParser <monero.transaction.extra.ExtraParser>` does.
+    """
+
+    def __init__(self, data):
+        self.data = memoryview(data)
+        self.offset = 0
+
+    def decode(self):
+        if self.data[: len(SIGNATURE)] != SIGNATURE:
+            raise ValueError("Data doesn't start with portable storage signature")
+        self.offset = len(SIGNATURE)
+        section = self._section()
+        if self.offset != len(self.data):
+            raise ValueError(
+                "offset {:d}: {:d} bytes of excess data".format(
+                    self.offset, len(self.data) - self.offset
+                )
+            )
+        return section
+
+    def _take(self, size):
+        end = self.offset + size
+        if end > len(self.data):
+            raise ValueError(
+                "offset {:d}: {:d} bytes expected, data too short".format(
+                    self.offset, size
+                )
+            )
+        chunk = self.data[self.offset : end]
+        self.offset = end
+        return chunk
+
+    def _varint(self):
+        size = 1 << (self._take(1)[0] & 0x03)
+        self.offset -= 1
+        return int.from_bytes(self._take(size), "little") >> 2
+
+    def _section(self):
+        section = {}
+        for i in range(self._varint()):
+            namelen = self._take(1)[0]
+            name = self._take(namelen).tobytes().decode()
+            section[name] = self._entry()
+        return section
+
+    def _entry(self):
+        vtype = self._take(1)[0]
+        if vtype & FLAG_ARRAY:
+            return self._array(vtype & ~FLAG_ARRAY)
+        return self._value(vtype)
+
+    def _array(self, itype):
+        return [self._value(itype) for i in range(self._varint())]
+
+    def _value(self, vtype):
+        if vtype == TYPE_STRING:
+            return self._take(self._varint()).tobytes()
+        elif vtype == TYPE_OBJECT:
+            return self._section()
+        elif vtype == TYPE_BOOL:
+            return self._take(1)[0] != 0
+        elif vtype == TYPE_ARRAY:
+            # an array nested in another array carries its own type
+            return self._entry()
+        try:
+            fmt = _FIXED[vtype]
+        except KeyError:
+            raise ValueError(
+                "offset {:d}: unknown type 0x{:x}".format(self.offset - 1, vtype)
+            )
+        return fmt.unpack(self._take(fmt.size))[0]
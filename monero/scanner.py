@@ -0,0 +1,271 @@
+import binascii
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+import functools
+import json
+import logging
+import os
+
+from . import exceptions
+from .address import BaseAddress
+from .block import TransactionList
+from .transaction import Transaction
+from .wallet import SubaddressTable
+
+_log = logging.getLogger(__name__)
+
+
+def scan_transactions(txs, view_key, spend_pubkeys, workers=None, batch_size=50):
+    """
+    Scans transactions for outputs destined to any of given public spend keys and decodes
+    their amounts. The transactions are split into batches which are spread across a pool
+    of worker processes.
+
+    Unlike :meth:`Transaction.outputs() <monero.transaction.Transaction.outputs>` called
+    with a wallet, no requests are made to the wallet while scanning.
+
+    :param txs: a sequence of :class:`Transaction <monero.transaction.Transaction>` objects,
+                all of them must have the `json` attribute or a blob
+    :param view_key: the secret view key as hexadecimal `str`
+    :param spend_pubkeys: a :class:`SubaddressTable <monero.wallet.SubaddressTable>`
+                or a sequence of :class:`addresses <monero.address.BaseAddress>` or public
+                spend keys as hexadecimal `str`
+    :param workers: the number of worker processes; defaults to the number of CPUs.
+                If `1`, the scanning is done within the current process.
+    :param batch_size: the number of transactions sent to a worker at once
+    :rtype: list of :class:`Output <monero.transaction.Output>` having the `payment`
+                attribute set; if public spend keys were given as `str`, the payments
+                have no `local_address`
+    """
+    svk = binascii.unhexlify(view_key)
+    spend_keys, get_address = _spend_keys(spend_pubkeys)
+    if workers == 1:
+        return _scan(map, txs, svk, spend_keys, get_address, batch_size)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return _scan(executor.map, txs, svk, spend_keys, get_address, batch_size)
+
+
+class BlockScanner(object):
+    """
+    Scans the blockchain for outputs destined to given public spend keys.
+
+    Blocks are fetched from the daemon in batches of `prefetch` blocks. The next batch is
+    being fetched while the current one is scanned. The height and hash of the last scanned
+    block, together with a short history of preceding ones, are saved as a checkpoint, so
+    the scanning may be resumed later without processing the same blocks again.
+
+    Chain reorganizations are detected by comparing `prev_hash` of each fetched block with
+    the hash of the block scanned before. Then the scanner finds the fork point within
+    the history, calls `on_reorg` with the height of the first orphaned block and continues
+    from there. Outputs already yielded from orphaned blocks should be considered void.
+
+    :param daemon: a :class:`Daemon <monero.daemon.Daemon>`
+    :param view_key: the secret view key as hexadecimal `str`
+    :param spend_pubkeys: public spend keys, as accepted by :func:`scan_transactions`
+    :param start_height: the height of the first block to scan, unless a checkpoint exists
+    :param checkpoint: path of the file to keep the checkpoint in; if `None`, the checkpoint
+                is held only in memory
+    :param prefetch: the number of blocks fetched at once
+    :param workers: the number of worker processes, as in :func:`scan_transactions`
+    :param reorg_depth: the number of recent block hashes kept for finding the fork point
+    :param on_reorg: a callable taking the height of the first orphaned block
+    """
+
+    def __init__(
+        self,
+        daemon,
+        view_key,
+        spend_pubkeys,
+        start_height=0,
+        checkpoint=None,
+        prefetch=10,
+        workers=1,
+        reorg_depth=20,
+        on_reorg=None,
+    ):
+        if prefetch < 1:
+            raise ValueError("prefetch must be a positive number")
+        self.daemon = daemon
+        self.start_height = start_height
+        self.checkpoint = checkpoint
+        self.prefetch = prefetch
+        self.workers = workers
+        self.reorg_depth = reorg_depth
+        self.on_reorg = on_reorg
+        self._svk = binascii.unhexlify(view_key)
+        self._spend_keys, self._get_address = _spend_keys(spend_pubkeys)
+        self.history = []
+        if checkpoint and os.path.exists(checkpoint):
+            with open(checkpoint, "r") as fh:
+                self.history = [tuple(blk) for blk in json.load(fh)["history"]]
+
+    @property
+    def height(self):
+        """The height of the last scanned block or `None` if nothing has been scanned."""
+        return self.history[-1][0] if self.history else None
+
+    @property
+    def hash(self):
+        """The hash of the last scanned block or `None` if nothing has been scanned."""
+        return self.history[-1][1] if self.history else None
+
+    def scan(self, end_height=None):
+        """
+        Scans blocks from the checkpoint (or `start_height`) up to `end_height` inclusively,
+        which defaults to the top of the chain. Yields recognized outputs as they are found.
+
+        The checkpoint moves past a block as its last output is handed out. If the caller
+        stops in the middle of the outputs of a block, the scanning resumes from that block
+        and its outputs are yielded again. The method may be called again later to continue
+        with the newly mined blocks.
+
+        :rtype: generator of :class:`Output <monero.transaction.Output>`
+        """
+        if end_height is None:
+            end_height = self.daemon.height() - 1
+        fetcher = ThreadPoolExecutor(max_workers=1)
+        executor = None
+        scanmap = map
+        if self.workers != 1:
+            executor = ProcessPoolExecutor(max_workers=self.workers)
+            scanmap = executor.map
+        try:
+            start = self.start_height if self.height is None else self.height + 1
+            pending = self._submit(fetcher, start, end_height)
+            while pending:
+                blocks = pending.result()
+                restart = self._check_chain(blocks)
+                if restart is not None:
+                    pending = self._submit(fetcher, restart, end_height)
+                    continue
+                pending = self._submit(fetcher, blocks[-1].height + 1, end_height)
+                txs = [tx for blk in blocks for tx in blk.transactions]
+                # the whole batch is scanned at once, the outputs are yielded per block
+                found = {}
+                for out in _scan(
+                    scanmap, txs, self._svk, self._spend_keys, self._get_address
+                ):
+                    found.setdefault(out.transaction.hash, []).append(out)
+                for blk in blocks:
+                    outs = [
+                        out for tx in blk.transactions for out in found.get(tx.hash, ())
+                    ]
+                    if outs:
+                        # the checkpoint covers the blocks before, should the caller stop
+                        self._save()
+                        for out in outs[:-1]:
+                            yield out
+                    self.history.append((blk.height, blk.hash))
+                    self.history = self.history[-self.reorg_depth :]
+                    if outs:
+                        # the block is done once its last output is handed out
+                        self._save()
+                        yield outs[-1]
+                self._save()
+        finally:
+            fetcher.shutdown(wait=False)
+            if executor:
+                executor.shutdown()
+
+    def _submit(self, fetcher, start, end_height):
+        if start > end_height:
+            return None
+        return fetcher.submit(
+            self._fetch, start, min(start + self.prefetch - 1, end_height)
+        )
+
+    def _fetch(self, start, end):
+        blocks = [self.daemon.block(height=h) for h in range(start, end + 1)]
+        for blk in blocks:
+            # fetch now, while the previous batch is being scanned
+            if isinstance(blk.transactions, TransactionList):
+                blk.transactions.load()
+        return blocks
+
+    def _check_chain(self, blocks):
+        """
+        Returns `None` if the blocks continue the scanned chain, otherwise the height
+        to restart scanning from.
+        """
+        if self.history and blocks[0].prev_hash != self.hash:
+            fork = self._find_fork()
+            _log.warning(
+                "Chain reorganization detected, blocks from {:d} on are orphaned".format(
+                    fork
+                )
+            )
+            self.history = [blk for blk in self.history if blk[0] < fork]
+            self._save()
+            if self.on_reorg:
+                self.on_reorg(fork)
+            return fork
+        for prev, blk in zip(blocks, blocks[1:]):
+            if blk.prev_hash != prev.hash:
+                # the chain changed while the batch was being fetched
+                return blocks[0].height
+        return None
+
+    def _find_fork(self):
+        headers = self.daemon.headers(self.history[0][0], self.history[-1][0])
+        chain = {hdr["height"]: hdr["hash"] for hdr in headers}
+        for height, bhash in reversed(self.history):
+            if chain.get(height) == bhash:
+                return height + 1
+        raise exceptions.ReorganizationTooDeep(
+            "Chain reorganization goes deeper than the last {:d} blocks "
+            "scanned".format(len(self.history))
+        )
+
+    def _save(self):
+        if not self.checkpoint:
+            return
+        tmpname = self.checkpoint + ".tmp"
+        with open(tmpname, "w") as fh:
+            json.dump(
+                {
+                    "height": self.height,
+                    "hash": self.hash,
+                    "history": self.history,
+                },
+                fh,
+            )
+        os.replace(tmpname, self.checkpoint)
+
+
+def _spend_keys(spend_pubkeys):
+    if isinstance(spend_pubkeys, SubaddressTable):
+        return frozenset(spend_pubkeys), spend_pubkeys.address
+    addresses = {}
+    for key in spend_pubkeys:
+        if isinstance(key, BaseAddress):
+            addresses[binascii.unhexlify(key.spend_key())] = key
+        else:
+            addresses[binascii.unhexlify(key)] = None
+    return frozenset(addresses), addresses.__getitem__
+
+
+def _scan(scanmap, txs, svk, spend_keys, get_address, batch_size=50):
+    txs = list(txs)
+    batches = [
+        [
+            (pos, tx.hash, tx._decoded())
+            for pos, tx in enumerate(txs[i : i + batch_size])
+        ]
+        for i in range(0, len(txs), batch_size)
+    ]
+    results = scanmap(functools.partial(_scan_batch, svk, spend_keys), batches)
+    outs = []
+    for bidx, found in enumerate(results):
+        for pos, idx, psk, amount in found:
+            tx = txs[bidx * batch_size + pos]
+            outs.append(tx._output(idx, (get_address(psk), amount)))
+    return outs
+
+
+def _scan_batch(svk, spend_keys, batch):
+    found = []
+    for pos, txhash, txdata in batch:
+        tx = Transaction(hash=txhash)
+        tx._data = txdata
+        for idx, psk, amount in tx._scan(svk, spend_keys):
+            found.append((pos, idx, psk, amount))
+    return found
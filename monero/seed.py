@@ -113,7 +113,9 @@ class Seed(object):
         :rtype: bool
         """
         phrase = self.phrase.split(" ")
-        if self.word_list.get_checksum(self.phrase) == phrase[-1]:
+        prefix_length = self.word_list.unique_prefix_length
+        checksum = self.word_list.get_checksum(self.phrase)
+        if checksum[:prefix_length] == phrase[-1][:prefix_length]:
             return True
         raise ValueError("Invalid checksum")
 
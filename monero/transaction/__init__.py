@@ -1,5 +1,6 @@
 import binascii
 import itertools
+import json
 import operator
 import re
 import struct
@@ -10,6 +11,12 @@ from ..numbers import from_atomic, PaymentID
 from .. import ed25519
 from .. import exceptions
 from .extra import ExtraParser
+from .serialization import (
+    parse_transaction,
+    transaction_hash,
+    transaction_prefix_hash,
+    TransactionData,
+)
 from ..keccak import keccak_256
 
 
@@ -76,35 +83,52 @@ class OutgoingPayment(Payment):
     _reprstr = "out: {} @ {} {:.12f} id={}"
 
 
+# marks the fee or version which hasn't been determined yet
+_UNKNOWN = object()
+
+
 class Transaction(object):
     """
     A Monero transaction. Identified by `hash`, it can be a part of a block of some `height`
     or not yet mined (`height` is `None` then).
 
+    The contents are parsed from the `blob`, or from the `pruned_blob`, which lacks
+    the prunable part of signatures. Without either of them, they are decoded from `json`
+    if the backend has provided it. The hash of the prunable part may be given as
+    `prunable_hash`, which allows computing the transaction hash from the pruned blob.
+
+    The `blob`, `pruned_blob` and `json` may be given undecoded, as hexadecimal and JSON
+    strings respectively. They are decoded on first access. The JSON is decoded by the `codec`
+    of the backend, if given.
+
+    The `fee` and `version` are determined from the contents on first access, unless they
+    have been set. A `fee` given to the constructor, `None` included, is kept as it is.
+
     This class is not intended to be turned into objects by the user,
     it is used by backends.
     """
 
-    hash = None
-    fee = None
-    height = None
-    timestamp = None
-    key = None
-    blob = None
-    confirmations = None
-    output_indices = None
-    json = None
-    version = None
-    pubkeys = None
+    __slots__ = (
+        "hash",
+        "height",
+        "timestamp",
+        "key",
+        "prunable_hash",
+        "confirmations",
+        "output_indices",
+        "pubkeys",
+        "_fee",
+        "_blob",
+        "_pruned_blob",
+        "_json",
+        "_codec",
+        "_version",
+        "_data",
+    )
 
     @property
     def is_coinbase(self):
-        if self.json:
-            return "gen" in self.json["vin"][0]
-        raise exceptions.TransactionWithoutJSON(
-            "Tx {:s} has no .json attribute and it cannot be determined "
-            "if it's coinbase tx.".format(self.hash)
-        )
+        return self._decoded("it cannot be determined if it's coinbase tx").is_coinbase
 
     @property
     def size(self):
@@ -115,187 +139,252 @@ class Transaction(object):
             )
         return len(self.blob)
 
-    def __init__(self, **kwargs):
-        self.hash = kwargs.get("hash", self.hash)
-        self.fee = kwargs.get("fee", self.fee)
-        self.height = kwargs.get("height", self.height)
-        self.timestamp = kwargs.get("timestamp", self.timestamp)
-        self.key = kwargs.get("key", self.key)
-        self.blob = kwargs.get("blob", self.blob)
-        self.confirmations = kwargs.get("confirmations", self.confirmations)
-        self.output_indices = kwargs.get("output_indices", self.output_indices)
-        self.json = kwargs.get("json", self.json)
-        self.pubkeys = self.pubkeys or []
-        if self.json:
-            if "rct_signatures" in self.json:
-                self.version = 2
+    @property
+    def fee(self):
+        if self._fee is _UNKNOWN:
+            if self._json:
+                fee = self.json.get("rct_signatures", {}).get("txnFee")
+            elif self._blob or self._pruned_blob:
+                fee = self._decoded().fee
             else:
-                self.version = 1
+                fee = None
+            self._fee = from_atomic(fee) if fee else None
+        return self._fee
 
-    def outputs(self, wallet=None):
-        """
-        Returns a list of outputs. If wallet is given, decodes destinations and amounts
-        for outputs directed to the wallet, provided that matching subaddresses have been
-        already generated.
-        """
+    @fee.setter
+    def fee(self, value):
+        self._fee = value
 
-        def _scan_pubkeys(
-            svk, psk, stealth_address, amount, encamount, commitment, on_chain_vt
-        ):
-            for keyidx, tx_key in enumerate(self.pubkeys):
-                # precompute
-                svk_2 = ed25519.scalar_add(svk, svk)
-                svk_4 = ed25519.scalar_add(svk_2, svk_2)
-                svk_8 = ed25519.scalar_add(svk_4, svk_4)
-                #
-                shared_secret = ed25519.scalarmult(svk_8, tx_key)
-                if on_chain_vt:
-                    vt_hsdata = b"".join(
-                        [b"view_tag", shared_secret, varint.encode(idx)]
-                    )
-                    vt_full = keccak_256(vt_hsdata).digest()
-                    vt = vt_full[0:1]
-                    if vt != on_chain_vt:
-                        # short-circuit so it doesn't have to do the rest of this for ~99.6% of outputs
-                        # the view tag check yields false positives 1/256 times, because it's just 1 byte
-                        continue
+    @property
+    def blob(self):
+        if isinstance(self._blob, str):
+            self._blob = binascii.unhexlify(self._blob) or None
+        return self._blob
 
-                hsdata = b"".join(
-                    [
-                        shared_secret,
-                        varint.encode(idx),
-                    ]
-                )
-                Hs_ur = keccak_256(hsdata).digest()
-                Hs = ed25519.scalar_reduce(Hs_ur)
-                k = ed25519.edwards_add(
-                    ed25519.scalarmult_B(Hs),
-                    psk,
-                )
-                if k != stealth_address:
-                    continue
-                if not encamount:
-                    # Tx ver 1
-                    return Payment(
-                        amount=amount,
-                        timestamp=self.timestamp,
-                        transaction=self,
-                        local_address=addr,
+    @blob.setter
+    def blob(self, value):
+        self._blob = value
+
+    @property
+    def pruned_blob(self):
+        if isinstance(self._pruned_blob, str):
+            self._pruned_blob = binascii.unhexlify(self._pruned_blob) or None
+        return self._pruned_blob
+
+    @pruned_blob.setter
+    def pruned_blob(self, value):
+        self._pruned_blob = value
+
+    @property
+    def json(self):
+        if isinstance(self._json, (str, bytes)):
+            loads = self._codec.loads if self._codec else json.loads
+            self._json = loads(self._json)
+        return self._json
+
+    @json.setter
+    def json(self, value):
+        self._json = value
+
+    @property
+    def version(self):
+        if self._version is _UNKNOWN:
+            if self._json:
+                self._version = 2 if "rct_signatures" in self.json else 1
+            elif self._blob or self._pruned_blob:
+                self._version = self._decoded().version
+            else:
+                return None
+        return self._version
+
+    @version.setter
+    def version(self, value):
+        self._version = value
+
+    def __init__(self, **kwargs):
+        self.hash = kwargs.get("hash")
+        self.height = kwargs.get("height")
+        self.timestamp = kwargs.get("timestamp")
+        self.key = kwargs.get("key")
+        self.prunable_hash = kwargs.get("prunable_hash")
+        self.confirmations = kwargs.get("confirmations")
+        self.output_indices = kwargs.get("output_indices")
+        self.pubkeys = []
+        self._fee = kwargs.get("fee", _UNKNOWN)
+        self._blob = kwargs.get("blob")
+        self._pruned_blob = kwargs.get("pruned_blob")
+        self._json = kwargs.get("json")
+        self._codec = kwargs.get("codec")
+        self._version = _UNKNOWN
+        self._data = None
+
+    def _decoded(self, consequence=None):
+        """
+        Returns the :class:`TransactionData <monero.transaction.serialization.TransactionData>`
+        of the transaction, decoding it on the first call. The blob is preferred, as it
+        yields the sizes needed for hashing too and doesn't need the JSON decoded.
+        """
+        if self._data is None:
+            if self.blob or self.pruned_blob:
+                self._data = parse_transaction(self.blob or self.pruned_blob)
+            elif self.json:
+                self._data = TransactionData.from_json(self.json)
+            else:
+                raise exceptions.TransactionWithoutJSON(
+                    "Tx {:s} has neither .json attribute nor blob{}".format(
+                        str(self.hash), ", " + consequence if consequence else ""
                     )
-                amount_hs = keccak_256(b"amount" + Hs).digest()
-                xormask = amount_hs[: len(encamount)]
-                dec_amount = bytearray(
-                    a ^ b for a, b in zip(*map(bytearray, (encamount, xormask)))
                 )
-                # verify that the commitment == yG + bH
-                # https://web.getmonero.org/library/Zero-to-Monero-2-0-0.pdf#section.5.3
-                y = ed25519.scalar_reduce(keccak_256(b"commitment_mask" + Hs).digest())
-                yG = ed25519.scalarmult_B(y)
-                b = ed25519.scalar_reduce(bytes(dec_amount))
-                bH = ed25519.scalarmult_H(b)
-                amount = 0
-                if commitment == ed25519.edwards_add(yG, bH):
-                    int_amount = struct.unpack("<Q", dec_amount)[0]
-                    amount = from_atomic(int_amount)
-                    return Payment(
-                        amount=amount,
-                        timestamp=self.timestamp,
-                        transaction=self,
-                        local_address=addr,
-                    )
+        return self._data
 
-        if not self.json:
-            raise exceptions.TransactionWithoutJSON(
-                "Tx {:s} has no .json attribute".format(self.hash)
+    def _parsed_blob(self, consequence):
+        blob = self.blob or self.pruned_blob
+        if not blob:
+            raise exceptions.TransactionWithoutBlob(
+                "Tx {:s} has no blob, {}".format(str(self.hash), consequence)
             )
+        data = self._decoded()
+        if data.prefix_size is None:
+            # decoded from JSON before the blob was set
+            self._data = data = parse_transaction(blob)
+        return blob, data
+
+    def prefix_hash(self):
+        """
+        Computes the hash of the transaction prefix from the blob.
+
+        :rtype: str
+        """
+        blob, data = self._parsed_blob("hence the prefix hash cannot be computed")
+        return binascii.hexlify(transaction_prefix_hash(blob, data)).decode()
+
+    def compute_hash(self):
+        """
+        Computes the transaction hash from the blob, without relying on the backend.
+        If only the pruned blob is present, `prunable_hash` is needed too, unless the
+        transaction has no prunable data.
 
-        if wallet:
-            ep = ExtraParser(self.json["extra"])
-            extra = ep.parse()
-            self.pubkeys = extra.get("pubkeys", [])
+        Comparing the result against `hash` verifies the integrity of the blob.
+
+        :rtype: str
+        """
+        blob, data = self._parsed_blob("hence the hash cannot be computed")
+        prunable_hash = (
+            binascii.unhexlify(self.prunable_hash) if self.prunable_hash else None
+        )
+        return binascii.hexlify(transaction_hash(blob, prunable_hash, data)).decode()
+
+    def outputs(self, wallet=None, subaddresses=None):
+        """
+        Returns a list of outputs. If wallet is given, decodes destinations and amounts
+        for outputs directed to the wallet, provided that matching subaddresses have been
+        already generated.
+
+        Alternatively, a :class:`SubaddressTable <monero.wallet.SubaddressTable>` may be
+        given as `subaddresses`. Then the public spend key of each output's destination is
+        derived once and looked up in the table, instead of trying every wallet's address.
+        """
+        data = self._decoded()
+        if wallet and subaddresses is not None:
+            raise ValueError("wallet and subaddresses are mutually exclusive")
+
+        found = {}
+        if subaddresses is not None:
+            svk = binascii.unhexlify(subaddresses.view_key())
+            spend_keys = subaddresses
+            get_address = subaddresses.address
+        elif wallet:
             svk = binascii.unhexlify(wallet.view_key())
-            # fetch before loop to save on calls; cast to list to preserve over multiple iterations
-            addresses = list(
-                itertools.chain(
+            # fetch before scanning to save on calls
+            spend_keys = {
+                binascii.unhexlify(addr.spend_key()): addr
+                for addr in itertools.chain(
                     *map(operator.methodcaller("addresses"), wallet.accounts)
                 )
-            )
-        """
-        pre hard fork:
-        { 
-          "target": {
-            "key": "ea3f..."
-          }
-        }
-        post hard fork:
-        { 
-          "target": {
-            "tagged_key": {
-              "key": "ea3f...",
-              "view_tag": "a1"
             }
-          }
-        }
+            get_address = spend_keys.__getitem__
+        if wallet or subaddresses is not None:
+            found = {
+                idx: (get_address(psk), amount)
+                for idx, psk, amount in self._scan(svk, spend_keys)
+            }
+
+        return [self._output(idx, found.get(idx)) for idx in range(len(data.outputs))]
+
+    def _output(self, idx, match=None):
         """
-        outs = []
-        for idx, vout in enumerate(self.json["vout"]):
-            # see if post hard fork json structure present:
-            try:
-                if vout["target"]["tagged_key"]:
-                    # post fork transaction
-                    stealth_address = binascii.unhexlify(
-                        vout["target"]["tagged_key"]["key"]
-                    )
-                    orig_stealth_address = vout["target"]["tagged_key"]["key"]
-                    on_chain_vt = binascii.unhexlify(
-                        vout["target"]["tagged_key"]["view_tag"]
-                    )
-            except:
-                # pre fork transaction
-                stealth_address = binascii.unhexlify(vout["target"]["key"])
-                orig_stealth_address = vout["target"]["key"]
-                on_chain_vt = False
-                pass
-
-            encamount = None
-            commitment = None
-            if self.version == 2 and not self.is_coinbase:
-                encamount = binascii.unhexlify(
-                    self.json["rct_signatures"]["ecdhInfo"][idx]["amount"]
-                )
-                commitment = binascii.unhexlify(
-                    self.json["rct_signatures"]["outPk"][idx]
-                )
-            payment = None
+        Returns the :class:`Output` of index `idx` within the transaction. If `match`
+        is given as `(local_address, amount)`, the output is recognized as a payment.
+        """
+        data = self._decoded()
+        vout = data.outputs[idx]
+        payment = None
+        if match is not None:
+            local_address, amount = match
+            payment = Payment(
+                amount=amount,
+                timestamp=self.timestamp,
+                transaction=self,
+                local_address=local_address,
+            )
+        else:
             amount = (
-                from_atomic(vout["amount"])
-                if self.version == 1 or self.is_coinbase
+                from_atomic(vout.amount)
+                if data.version == 1 or data.is_coinbase
                 else None
             )
-            if wallet:
-                for addridx, addr in enumerate(addresses):
-                    psk = binascii.unhexlify(addr.spend_key())
-                    payment = _scan_pubkeys(
-                        svk,
-                        psk,
-                        stealth_address,
-                        amount,
-                        encamount,
-                        commitment,
-                        on_chain_vt,
-                    )
-                    if payment:
-                        break
-            outs.append(
-                Output(
-                    stealth_address=orig_stealth_address,
-                    amount=payment.amount if payment else amount,
-                    index=self.output_indices[idx] if self.output_indices else None,
-                    transaction=self,
-                    payment=payment,
+        return Output(
+            stealth_address=binascii.hexlify(vout.key).decode(),
+            amount=amount,
+            index=self.output_indices[idx] if self.output_indices else None,
+            transaction=self,
+            payment=payment,
+        )
+
+    def _scan(self, svk, spend_keys):
+        """
+        Scans outputs using the secret view key `svk` (as 32 bytes). Yields tuples of
+        `(index, public spend key, amount)` for those outputs which destination's public
+        spend key is in `spend_keys` (any container of 32-byte keys).
+
+        The shared secret depends only on the tx public key and the view key, so it's
+        derived once per tx public key and reused across all outputs.
+        """
+        data = self._decoded()
+        self.pubkeys = ExtraParser(data.extra).parse().get("pubkeys", [])
+        # precompute 8 * svk
+        svk_2 = ed25519.scalar_add(svk, svk)
+        svk_4 = ed25519.scalar_add(svk_2, svk_2)
+        svk_8 = ed25519.scalar_add(svk_4, svk_4)
+        derivations = [ed25519.scalarmult(svk_8, tx_key) for tx_key in self.pubkeys]
+        has_amounts = data.version == 2 and not data.is_coinbase
+        for idx, vout in enumerate(data.outputs):
+            stealth_address, on_chain_vt = vout.key, vout.view_tag
+            varint_idx = varint.encode(idx)
+            for shared_secret in derivations:
+                if on_chain_vt:
+                    vt = keccak_256(b"view_tag" + shared_secret + varint_idx).digest()
+                    if vt[0:1] != on_chain_vt:
+                        # short-circuit so it doesn't have to do the rest of this for ~99.6% of outputs
+                        # the view tag check yields false positives 1/256 times, because it's just 1 byte
+                        continue
+                Hs = ed25519.scalar_reduce(
+                    keccak_256(shared_secret + varint_idx).digest()
                 )
-            )
-        return outs
+                # D = P - Hs * B
+                psk = ed25519.edwards_sub(stealth_address, ed25519.scalarmult_B(Hs))
+                if psk not in spend_keys:
+                    continue
+                if not has_amounts:
+                    # Tx ver 1 or coinbase
+                    yield idx, psk, from_atomic(vout.amount)
+                    break
+                amount = _decode_amount(
+                    Hs, data.ecdh_amounts[idx], data.out_commitments[idx]
+                )
+                if amount is not None:
+                    yield idx, psk, amount
+                    break
 
     def __repr__(self):
         return self.hash
@@ -378,6 +467,38 @@ class PaymentManager(object):
         return fetch(self.account_idx, PaymentFilter(**filterparams))
 
 
+class AsyncPaymentManager(PaymentManager):
+    """
+    A payment query manager working with an asynchronous backend. Calling it returns
+    a coroutine.
+
+    This class is not intended to be turned into objects by the user,
+    it is used by backends.
+    """
+
+    async def __call__(self, **filterparams):
+        return await super(AsyncPaymentManager, self).__call__(**filterparams)
+
+
+def _decode_amount(Hs, encamount, commitment):
+    """
+    Decrypts the output amount and verifies it against the commitment. Returns `None`
+    if the commitment doesn't match.
+    """
+    amount_hs = keccak_256(b"amount" + Hs).digest()
+    xormask = amount_hs[: len(encamount)]
+    dec_amount = bytes(bytearray(a ^ b for a, b in zip(encamount, xormask)))
+    # verify that the commitment == yG + bH
+    # https://web.getmonero.org/library/Zero-to-Monero-2-0-0.pdf#section.5.3
+    y = ed25519.scalar_reduce(keccak_256(b"commitment_mask" + Hs).digest())
+    yG = ed25519.scalarmult_B(y)
+    b = ed25519.scalar_reduce(dec_amount)
+    bH = ed25519.scalarmult_H(b)
+    if commitment != ed25519.edwards_add(yG, bH):
+        return None
+    return from_atomic(struct.unpack("<Q", dec_amount)[0])
+
+
 def _validate_tx_id(txid):
     if not bool(re.compile("^[0-9a-f]{64}$").match(txid)):
         raise ValueError(
@@ -1,8 +1,14 @@
 import binascii
-import varint
 
 
 class ExtraParser(object):
+    """
+    Parser of the transaction's `extra` field. Walks over the data with an integer cursor,
+    so no copies of the remaining data are made while parsing.
+
+    :param extra: the `extra` field as hexadecimal `str`, `bytes` or a list of `int`
+    """
+
     TX_EXTRA_TAG_PADDING = 0x00
     TX_EXTRA_TAG_PUBKEY = 0x01
     TX_EXTRA_TAG_EXTRA_NONCE = 0x02
@@ -17,79 +23,71 @@ class ExtraParser(object):
     def __init__(self, extra):
         if isinstance(extra, str):
             extra = binascii.unhexlify(extra)
-        if isinstance(extra, bytes):
-            extra = list(extra)
-        self.extra = extra
+        elif not isinstance(extra, (bytes, bytearray, memoryview)):
+            extra = bytes(bytearray(extra))
+        self.extra = memoryview(extra)
 
     def parse(self):
         self.data = {}
         self.offset = 0
-        self._parse(self.extra)
+        extra = self.extra
+        size = len(extra)
+        while self.offset < size:
+            tag = extra[self.offset]
+            if tag == self.TX_EXTRA_TAG_PADDING:
+                self.offset += 1
+            elif tag == self.TX_EXTRA_TAG_PUBKEY:
+                self.offset += 1
+                self._pop_pubkey()
+            elif tag == self.TX_EXTRA_TAG_ADDITIONAL_PUBKEYS:
+                self.offset += 1
+                for i in range(self._pop_varint()):
+                    self._pop_pubkey()
+            elif tag == self.TX_EXTRA_TAG_EXTRA_NONCE:
+                self._pop_nonce()
+            else:
+                raise ValueError(
+                    "offset {:d}: unknown tag 0x{:x}".format(self.offset, tag)
+                )
         return self.data
 
-    def _strip_padding(self, extra):
-        while extra and extra[0] == self.TX_EXTRA_TAG_PADDING:
-            extra = extra[1:]
-            self.offset += 1
-        return extra
-
-    def _pop_pubkey(self, extra):
-        key = bytes(bytearray(extra[:32]))  # bytearray() is for py2 compatibility
+    def _pop_pubkey(self):
+        key = self.extra[self.offset : self.offset + 32]
         if len(key) < 32:
             raise ValueError(
                 "offset {:d}: only {:d} bytes of key data, expected 32".format(
                     self.offset, len(key)
                 )
             )
-        if "pubkeys" in self.data:
-            self.data["pubkeys"].append(key)
-        else:
-            self.data["pubkeys"] = [key]
-        extra = extra[32:]
+        self.data.setdefault("pubkeys", []).append(key.tobytes())
         self.offset += 32
-        return extra
 
-    def _extract_pubkey(self, extra):
-        if extra:
-            if extra[0] == self.TX_EXTRA_TAG_PUBKEY:
-                extra = extra[1:]
-                self.offset += 1
-                extra = self._pop_pubkey(extra)
-            elif extra[0] == self.TX_EXTRA_TAG_ADDITIONAL_PUBKEYS:
-                extra = extra[1:]
-                self.offset += 1
-                keycount = varint.decode_bytes(bytearray(extra))
-                valen = len(varint.encode(keycount))
-                extra = extra[valen:]
-                self.offset += valen
-                for i in range(keycount):
-                    extra = self._pop_pubkey(extra)
-        return extra
-
-    def _extract_nonce(self, extra):
-        if extra and extra[0] == self.TX_EXTRA_TAG_EXTRA_NONCE:
-            noncelen = extra[1]
-            extra = extra[2:]
-            self.offset += 2
-            if noncelen > len(extra):
+    def _pop_varint(self):
+        value = 0
+        shift = 0
+        while True:
+            if self.offset >= len(self.extra):
                 raise ValueError(
-                    "offset {:d}: extra nonce exceeds field size".format(self.offset)
+                    "offset {:d}: varint exceeds field size".format(self.offset)
                 )
-            nonce = bytearray(extra[:noncelen])
-            if "nonces" in self.data:
-                self.data["nonces"].append(nonce)
-            else:
-                self.data["nonces"] = [nonce]
-            extra = extra[noncelen:]
-            self.offset += noncelen
-        return extra
+            byte = self.extra[self.offset]
+            self.offset += 1
+            value |= (byte & 0x7F) << shift
+            if not byte & 0x80:
+                return value
+            shift += 7
 
-    def _parse(self, extra):
-        while extra:
-            if extra[0] not in self.KNOWN_TAGS:
-                raise ValueError(
-                    "offset {:d}: unknown tag 0x{:x}".format(self.offset, extra[0])
-                )
-            extra = self._strip_padding(extra)
-            extra = self._extract_pubkey(extra)
-            extra = self._extract_nonce(extra)
+    def _pop_nonce(self):
+        if self.offset + 1 >= len(self.extra):
+            raise ValueError(
+                "offset {:d}: extra nonce exceeds field size".format(self.offset)
+            )
+        noncelen = self.extra[self.offset + 1]
+        self.offset += 2
+        if noncelen > len(self.extra) - self.offset:
+            raise ValueError(
+                "offset {:d}: extra nonce exceeds field size".format(self.offset)
+            )
+        nonce = bytearray(self.extra[self.offset : self.offset + noncelen])
+        self.data.setdefault("nonces", []).append(nonce)
+        self.offset += noncelen
@@ -0,0 +1,452 @@
+"""
+Parser of binary transaction and block blobs.
+
+Only the transaction prefix and the base of RingCT signatures are decoded, which covers
+everything needed to find and decode outputs. The prunable part of signatures (range proofs
+and ring signatures) is left as it is. Blobs may be pruned, i.e. lack that part entirely.
+"""
+import binascii
+import collections
+import varint
+
+from ..keccak import keccak_256
+
+RCT_TYPE_NULL = 0
+RCT_TYPE_FULL = 1
+RCT_TYPE_SIMPLE = 2
+RCT_TYPE_BULLETPROOF = 3
+RCT_TYPE_BULLETPROOF2 = 4
+RCT_TYPE_CLSAG = 5
+RCT_TYPE_BULLETPROOF_PLUS = 6
+
+# types using the compact, 8-byte encrypted amounts
+_COMPACT_ECDH_TYPES = (
+    RCT_TYPE_BULLETPROOF2,
+    RCT_TYPE_CLSAG,
+    RCT_TYPE_BULLETPROOF_PLUS,
+)
+
+TXIN_GEN = 0xFF
+TXIN_TO_KEY = 0x02
+TXOUT_TO_KEY = 0x02
+TXOUT_TO_TAGGED_KEY = 0x03
+
+NULL_HASH = b"\0" * 32
+
+# The id of block 202612 was computed with a buggy tree hash of its transactions. The chain
+# keeps that id, so monerod recognizes the block by the hash of its whole blob and returns
+# the original id instead of the computed one.
+_BLOCK_202612_HEIGHT = 202612
+_BLOCK_202612_BLOB_HASH = binascii.unhexlify(
+    "3a8a2b3a29b50fc86ff73dd087ea43c6f0d6b8f936c849194d5c84c737903966"
+)
+_BLOCK_202612_ID = binascii.unhexlify(
+    "bbd604d2ba11ba27935e006ed39c9bfdd99b76bf4a50654bc1e1e61217962698"
+)
+
+
+TxIn = collections.namedtuple("TxIn", ("amount", "key_offsets", "key_image", "height"))
+TxIn.__doc__ = """
+A transaction input. Coinbase inputs have only the block `height`, others have `amount`
+(zero for RingCT), relative `key_offsets` of the ring members and the `key_image`
+(as 32 bytes).
+"""
+
+TxOut = collections.namedtuple("TxOut", ("amount", "key", "view_tag"))
+TxOut.__doc__ = """
+A transaction output: `amount` in atomic units (zero for RingCT), the one-time public `key`
+(as 32 bytes) and `view_tag` (1 byte or `None` for outputs made before view tags were
+introduced).
+"""
+
+
+class TransactionData(
+    collections.namedtuple(
+        "TransactionData",
+        (
+            "version",
+            "unlock_time",
+            "inputs",
+            "outputs",
+            "extra",
+            "rct_type",
+            "fee",
+            "ecdh_amounts",
+            "out_commitments",
+            "prefix_size",
+            "base_size",
+        ),
+    )
+):
+    """
+    Decoded contents of a transaction.
+
+    The RingCT fields are `rct_type`, `fee` (in atomic units), `ecdh_amounts` (encrypted
+    amounts of the outputs as `bytes`) and `out_commitments` (32-byte commitments of
+    the outputs). For transactions of version 1 these are `None`, `None` and empty lists.
+
+    `prefix_size` and `base_size` are the lengths of the prefix and of the prefix
+    together with the RingCT base within the blob. Both are `None` if the data has been
+    decoded from JSON.
+    """
+
+    __slots__ = ()
+
+    @property
+    def is_coinbase(self):
+        return bool(self.inputs) and self.inputs[0].height is not None
+
+    @classmethod
+    def from_json(cls, data):
+        """
+        Converts a transaction decoded by the daemon (the `as_json` field) into
+        the same structure as :func:`parse_transaction` returns.
+
+        :param data: `dict` decoded from JSON
+        :rtype: :class:`TransactionData`
+        """
+        inputs = []
+        for vin in data["vin"]:
+            if "gen" in vin:
+                inputs.append(TxIn(0, [], None, vin["gen"]["height"]))
+            else:
+                key = vin["key"]
+                inputs.append(
+                    TxIn(
+                        key["amount"],
+                        key["key_offsets"],
+                        binascii.unhexlify(key["k_image"]),
+                        None,
+                    )
+                )
+        outputs = []
+        for vout in data["vout"]:
+            target = vout["target"]
+            if "tagged_key" in target:
+                outputs.append(
+                    TxOut(
+                        vout["amount"],
+                        binascii.unhexlify(target["tagged_key"]["key"]),
+                        binascii.unhexlify(target["tagged_key"]["view_tag"]),
+                    )
+                )
+            else:
+                outputs.append(
+                    TxOut(vout["amount"], binascii.unhexlify(target["key"]), None)
+                )
+        rct = data.get("rct_signatures")
+        rct_type = fee = None
+        ecdh_amounts = []
+        out_commitments = []
+        if rct is not None:
+            rct_type = rct["type"]
+            fee = rct.get("txnFee")
+            ecdh_amounts = [
+                binascii.unhexlify(ecdh["amount"]) for ecdh in rct.get("ecdhInfo", [])
+            ]
+            out_commitments = list(map(binascii.unhexlify, rct.get("outPk", [])))
+        return cls(
+            data["version"],
+            data["unlock_time"],
+            inputs,
+            outputs,
+            bytes(bytearray(data["extra"])),
+            rct_type,
+            fee,
+            ecdh_amounts,
+            out_commitments,
+            None,
+            None,
+        )
+
+
+class BlockData(
+    collections.namedtuple(
+        "BlockData",
+        (
+            "major_version",
+            "minor_version",
+            "timestamp",
+            "prev_hash",
+            "nonce",
+            "miner_tx",
+            "miner_tx_blob",
+            "tx_hashes",
+            "header_size",
+        ),
+    )
+):
+    """
+    Decoded contents of a block.
+
+    `prev_hash` and the items of `tx_hashes` are 32 bytes each. The latter doesn't include
+    the miner transaction, which is given both decoded, as `miner_tx`
+    (a :class:`TransactionData`), and as `miner_tx_blob`. `header_size` is the length of
+    the header within the blob.
+    """
+
+    __slots__ = ()
+
+
+def parse_transaction(blob):
+    """
+    Decodes a transaction blob, which may be pruned.
+
+    :param blob: the transaction as `bytes`
+    :rtype: :class:`TransactionData`
+    """
+    return _Parser(blob).parse()
+
+
+def transaction_prefix_hash(blob, data=None):
+    """
+    Computes the hash of the transaction prefix, which is what the ring signatures sign.
+
+    :param blob: the transaction as `bytes`, may be pruned
+    :param data: the blob parsed already by :func:`parse_transaction`, if available
+    :rtype: bytes
+    """
+    if data is None or data.prefix_size is None:
+        data = parse_transaction(blob)
+    return keccak_256(blob[: data.prefix_size]).digest()
+
+
+def transaction_hash(blob, prunable_hash=None, data=None):
+    """
+    Computes the transaction hash. Transactions of version 1 are hashed as a whole, those
+    of version 2 by hashing the hashes of the prefix, of the RingCT base and of the prunable
+    part together.
+
+    A pruned blob of version 2 can be hashed only if the hash of the missing prunable part
+    is given. Pruned transactions of version 1 cannot be hashed at all, except for
+    coinbase ones, which have no signatures.
+
+    :param blob: the transaction as `bytes`, may be pruned
+    :param prunable_hash: the hash of the prunable part (32 bytes), if the blob is pruned
+    :param data: the blob parsed already by :func:`parse_transaction`, if available
+    :rtype: bytes
+    """
+    if data is None or data.prefix_size is None:
+        data = parse_transaction(blob)
+    if data.version == 1:
+        if len(blob) == data.prefix_size and not data.is_coinbase:
+            raise ValueError(
+                "Cannot compute the hash of a pruned transaction of version 1"
+            )
+        return keccak_256(blob).digest()
+    if data.rct_type == RCT_TYPE_NULL:
+        prunable_hash = NULL_HASH
+    elif len(blob) > data.base_size:
+        prunable_hash = keccak_256(blob[data.base_size :]).digest()
+    elif prunable_hash is None:
+        raise ValueError(
+            "The blob is pruned, the hash of the prunable part has to be given"
+        )
+    return keccak_256(
+        transaction_prefix_hash(blob, data)
+        + keccak_256(blob[data.prefix_size : data.base_size]).digest()
+        + prunable_hash
+    ).digest()
+
+
+def parse_block(blob):
+    """
+    Decodes a block blob.
+
+    :param blob: the block as `bytes`
+    :rtype: :class:`BlockData`
+    """
+    return _Parser(blob).parse_block()
+
+
+def tree_hash(hashes):
+    """
+    Computes the Merkle tree root of hashes, in the way Monero does it for the transactions
+    of a block.
+
+    :param hashes: a non-empty list of 32-byte hashes
+    :rtype: bytes
+    """
+    count = len(hashes)
+    if count == 0:
+        raise ValueError("Cannot compute the tree hash of no hashes")
+    elif count == 1:
+        return hashes[0]
+    elif count == 2:
+        return keccak_256(hashes[0] + hashes[1]).digest()
+    # the largest power of 2 lower than count
+    cnt = 1 << ((count - 1).bit_length() - 1)
+    ints = list(hashes[: 2 * cnt - count])
+    ints.extend(
+        keccak_256(hashes[i] + hashes[i + 1]).digest()
+        for i in range(2 * cnt - count, count, 2)
+    )
+    while len(ints) > 1:
+        ints = [
+            keccak_256(ints[i] + ints[i + 1]).digest() for i in range(0, len(ints), 2)
+        ]
+    return ints[0]
+
+
+def block_hash(blob, data=None):
+    """
+    Computes the block id.
+
+    :param blob: the block as `bytes`
+    :param data: the blob parsed already by :func:`parse_block`, if available
+    :rtype: bytes
+    """
+    data = data or parse_block(blob)
+    root = tree_hash(
+        [transaction_hash(data.miner_tx_blob, data=data.miner_tx)] + data.tx_hashes
+    )
+    hashing_blob = (
+        blob[: data.header_size] + root + varint.encode(len(data.tx_hashes) + 1)
+    )
+    bid = keccak_256(varint.encode(len(hashing_blob)) + hashing_blob).digest()
+    inputs = data.miner_tx.inputs
+    if (
+        len(inputs) == 1
+        and inputs[0].height == _BLOCK_202612_HEIGHT
+        and keccak_256(blob).digest() == _BLOCK_202612_BLOB_HASH
+    ):
+        return _BLOCK_202612_ID
+    return bid
+
+
+class _Parser(object):
+    """
+    Walks over the blob with an integer cursor, like
+    :class:`ExtraParser <monero.transaction.extra.ExtraParser>` does.
+    """
+
+    def __init__(self, blob):
+        self.blob = memoryview(blob)
+        self.offset = 0
+
+    def parse(self):
+        start = self.offset
+        version = self._varint()
+        unlock_time = self._varint()
+        inputs = [self._input() for i in range(self._varint())]
+        outputs = [self._output() for i in range(self._varint())]
+        extra = self._take(self._varint())
+        prefix_size = self.offset - start
+        rct_type = fee = None
+        ecdh_amounts = []
+        out_commitments = []
+        if version == 2:
+            rct_type = self._take(1)[0]
+            if rct_type != RCT_TYPE_NULL:
+                if rct_type > RCT_TYPE_BULLETPROOF_PLUS:
+                    raise ValueError(
+                        "offset {:d}: unknown RingCT type {:d}".format(
+                            self.offset - 1, rct_type
+                        )
+                    )
+                fee = self._varint()
+                if rct_type == RCT_TYPE_SIMPLE:
+                    # pseudo outputs
+                    self._take(32 * len(inputs))
+                if rct_type in _COMPACT_ECDH_TYPES:
+                    ecdh_amounts = [self._take(8) for o in outputs]
+                else:
+                    # the mask followed by the amount
+                    ecdh_amounts = [self._take(64)[32:] for o in outputs]
+                out_commitments = [self._take(32) for o in outputs]
+        elif version != 1:
+            raise ValueError("Unsupported transaction version {:d}".format(version))
+        return TransactionData(
+            version,
+            unlock_time,
+            inputs,
+            outputs,
+            extra,
+            rct_type,
+            fee,
+            ecdh_amounts,
+            out_commitments,
+            prefix_size,
+            self.offset - start,
+        )
+
+    def parse_block(self):
+        major_version = self._varint()
+        minor_version = self._varint()
+        timestamp = self._varint()
+        prev_hash = self._take(32)
+        nonce = int.from_bytes(self._take(4), "little")
+        header_size = self.offset
+        miner_tx = self.parse()
+        if not miner_tx.is_coinbase:
+            raise ValueError("The miner transaction has no coinbase input")
+        miner_tx_blob = self.blob[header_size : self.offset].tobytes()
+        tx_hashes = [self._take(32) for i in range(self._varint())]
+        if self.offset != len(self.blob):
+            raise ValueError(
+                "offset {:d}: {:d} bytes of excess data".format(
+                    self.offset, len(self.blob) - self.offset
+                )
+            )
+        return BlockData(
+            major_version,
+            minor_version,
+            timestamp,
+            prev_hash,
+            nonce,
+            miner_tx,
+            miner_tx_blob,
+            tx_hashes,
+            header_size,
+        )
+
+    def _take(self, size):
+        end = self.offset + size
+        if end > len(self.blob):
+            raise ValueError(
+                "offset {:d}: {:d} bytes expected, blob too short".format(
+                    self.offset, size
+                )
+            )
+        chunk = self.blob[self.offset : end].tobytes()
+        self.offset = end
+        return chunk
+
+    def _varint(self):
+        value = 0
+        shift = 0
+        blob = self.blob
+        while True:
+            if self.offset >= len(blob):
+                raise ValueError(
+                    "offset {:d}: varint exceeds blob size".format(self.offset)
+                )
+            byte = blob[self.offset]
+            self.offset += 1
+            value |= (byte & 0x7F) << shift
+            if not byte & 0x80:
+                return value
+            shift += 7
+
+    def _input(self):
+        tag = self._take(1)[0]
+        if tag == TXIN_GEN:
+            return TxIn(0, [], None, self._varint())
+        elif tag == TXIN_TO_KEY:
+            amount = self._varint()
+            key_offsets = [self._varint() for i in range(self._varint())]
+            return TxIn(amount, key_offsets, self._take(32), None)
+        raise ValueError(
+            "offset {:d}: unsupported input type 0x{:02x}".format(self.offset - 1, tag)
+        )
+
+    def _output(self):
+        amount = self._varint()
+        tag = self._take(1)[0]
+        if tag == TXOUT_TO_KEY:
+            return TxOut(amount, self._take(32), None)
+        elif tag == TXOUT_TO_TAGGED_KEY:
+            return TxOut(amount, self._take(32), self._take(1))
+        raise ValueError(
+            "offset {:d}: unsupported output type 0x{:02x}".format(self.offset - 1, tag)
+        )
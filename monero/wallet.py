@@ -1,16 +1,144 @@
-from binascii import hexlify, unhexlify
+from binascii import unhexlify
+from concurrent.futures import ProcessPoolExecutor
+import functools
 import struct
 
 from . import address
 from .backends.jsonrpc import JSONRPCWallet
-from . import base58
 from . import const
 from . import ed25519
 from . import numbers
-from .transaction import Payment, PaymentManager
+from .transaction import AsyncPaymentManager, Payment, PaymentManager
 from .keccak import keccak_256
 
 
+def _subaddress_spend_key(master_svk, master_psk, major, minor):
+    # m = Hs("SubAddr\0" || master_svk || major || minor)
+    hsdata = b"".join(
+        [
+            b"SubAddr\0",
+            master_svk,
+            struct.pack("<I", major),
+            struct.pack("<I", minor),
+        ]
+    )
+    m = keccak_256(hsdata).digest()
+    # D = master_psk + m * B
+    return ed25519.edwards_add(
+        master_psk, ed25519.scalarmult_B(ed25519.scalar_reduce(m))
+    )
+
+
+def _subaddress(master_svk, D, net):
+    # C = master_svk * D
+    C = ed25519.scalarmult(master_svk, D)
+    netbyte = bytearray([const.SUBADDR_NETBYTES[const.NETS.index(net)]])
+    data = netbyte + D + C
+    checksum = keccak_256(data).digest()[:4]
+    return address.SubAddress._from_bytes(data + checksum)
+
+
+def _subaddresses(master_svk, master_address, major, minors):
+    master_psk = unhexlify(master_address.spend_key())
+    addrs = []
+    for minor in minors:
+        if major == minor == 0:
+            addrs.append(master_address)
+            continue
+        D = _subaddress_spend_key(master_svk, master_psk, major, minor)
+        addrs.append(_subaddress(master_svk, D, master_address.net))
+    return addrs
+
+
+def _check_index(name, index):
+    if index < 0 or index >= 2**32:
+        raise ValueError("{} index {} is outside uint32 range".format(name, index))
+
+
+class SubaddressTable(object):
+    """
+    A lookup table mapping public spend keys of wallet's addresses to their
+    `(major, minor)` indices. Used for output recognition, where a single
+    lookup replaces trying every address.
+
+    This class is not intended to be turned into objects by the user,
+    use :meth:`Wallet.subaddress_table() <monero.wallet.Wallet.subaddress_table>` instead.
+
+    :param master_address: the master :class:`Address <monero.address.Address>` of the wallet
+    :param view_key: the secret view key as hexadecimal `str`
+    """
+
+    master_address = None
+
+    def __init__(self, master_address, view_key):
+        self.master_address = master_address
+        self._view_key = view_key
+        self._svk = unhexlify(view_key)
+        self._psk = unhexlify(master_address.spend_key())
+        self._indices = {self._psk: (0, 0)}
+        self._minors = {}
+        self._addresses = {}
+
+    def view_key(self):
+        """
+        Returns private view key.
+
+        :rtype: str
+        """
+        return self._view_key
+
+    def extend(self, major, addresses):
+        """
+        Makes the table cover the first `addresses` addresses of account `major`.
+        Keys already present in the table are not calculated again.
+        """
+        _check_index("major", major)
+        if addresses > 2**32:
+            raise ValueError("{} addresses exceed uint32 range".format(addresses))
+        for minor in range(self._minors.get(major, 0), addresses):
+            if major == minor == 0:
+                continue
+            D = _subaddress_spend_key(self._svk, self._psk, major, minor)
+            self._indices[D] = (major, minor)
+        self._minors[major] = max(self._minors.get(major, 0), addresses)
+
+    def index(self, spend_key):
+        """
+        Returns `(major, minor)` indices of the address with given public spend key
+        or `None` if the key is not in the table.
+
+        :param spend_key: public spend key as 32 `bytes`
+        :rtype: (int, int) or None
+        """
+        return self._indices.get(spend_key)
+
+    def address(self, spend_key):
+        """
+        Returns the address with given public spend key.
+
+        :param spend_key: public spend key as 32 `bytes`
+        :rtype: :class:`BaseAddress <monero.address.BaseAddress>`
+        """
+        major, minor = self._indices[spend_key]
+        if major == minor == 0:
+            return self.master_address
+        try:
+            return self._addresses[major, minor]
+        except KeyError:
+            addr = _subaddress(self._svk, spend_key, self.master_address.net)
+            self._addresses[major, minor] = addr
+            return addr
+
+    def __contains__(self, spend_key):
+        return spend_key in self._indices
+
+    def __iter__(self):
+        return iter(self._indices)
+
+    def __len__(self):
+        return len(self._indices)
+
+
 class Wallet(object):
     """
     Monero wallet.
@@ -32,6 +160,7 @@ class Wallet(object):
     """
 
     accounts = None
+    _subaddress_table = None
 
     def __init__(self, backend=None, **kwargs):
         if backend and len(kwargs):
@@ -49,9 +178,12 @@ class Wallet(object):
         exists in multiple instances, calling `refresh()` will be necessary to update
         the list of accounts.
         """
+        self._update_accounts(self._backend.accounts())
+
+    def _update_accounts(self, accounts):
         self.accounts = self.accounts or []
         idx = 0
-        for _acc in self._backend.accounts():
+        for _acc in accounts:
             _acc.wallet = self
             try:
                 if self.accounts[idx]:
@@ -211,37 +343,77 @@ class Wallet(object):
         :rtype: :class:`BaseAddress <monero.address.BaseAddress>`
         """
         # ensure indexes are within uint32
-        if major < 0 or major >= 2**32:
-            raise ValueError("major index {} is outside uint32 range".format(major))
-        if minor < 0 or minor >= 2**32:
-            raise ValueError("minor index {} is outside uint32 range".format(minor))
+        _check_index("major", major)
+        _check_index("minor", minor)
         master_address = self.address()
         if major == minor == 0:
             return master_address
-        master_svk = unhexlify(self.view_key())
-        master_psk = unhexlify(self.address().spend_key())
-        # m = Hs("SubAddr\0" || master_svk || major || minor)
-        hsdata = b"".join(
-            [
-                b"SubAddr\0",
-                master_svk,
-                struct.pack("<I", major),
-                struct.pack("<I", minor),
-            ]
-        )
-        m = keccak_256(hsdata).digest()
-        # D = master_psk + m * B
-        D = ed25519.edwards_add(
-            master_psk, ed25519.scalarmult_B(ed25519.scalar_reduce(m))
+        return _subaddresses(
+            unhexlify(self.view_key()), master_address, major, [minor]
+        )[0]
+
+    def get_addresses(self, major, minors, workers=1, chunk_size=1000):
+        """
+        Calculates sub-addresses for account index (`major`) and a range of address indices
+        within the account (`minors`). The master keys are fetched from the backend only once.
+
+        The addresses are yielded in the order of `minors`. When `workers` is other than `1`,
+        chunks of `chunk_size` indices are calculated in a pool of worker processes.
+
+        :param major: account index
+        :param minors: a `range` or other iterable of address indices
+        :param workers: the number of worker processes, `None` meaning the number of CPUs
+        :param chunk_size: the number of addresses calculated by a worker at once
+        :rtype: generator of :class:`BaseAddress <monero.address.BaseAddress>`
+        """
+        minors = self._check_indices(major, minors)
+        return self._stream_addresses(
+            self.view_key(), self.address(), major, minors, workers, chunk_size
         )
-        # C = master_svk * D
-        C = ed25519.scalarmult(master_svk, D)
-        netbyte = bytearray(
-            [const.SUBADDR_NETBYTES[const.NETS.index(master_address.net)]]
+
+    @staticmethod
+    def _check_indices(major, minors):
+        _check_index("major", major)
+        minors = list(minors)
+        for minor in minors:
+            _check_index("minor", minor)
+        return minors
+
+    @staticmethod
+    def _stream_addresses(view_key, master_address, major, minors, workers, chunk_size):
+        derive = functools.partial(
+            _subaddresses, unhexlify(view_key), master_address, major
         )
-        data = netbyte + D + C
-        checksum = keccak_256(data).digest()[:4]
-        return address.SubAddress(base58.encode(hexlify(data + checksum)))
+        chunks = [minors[i : i + chunk_size] for i in range(0, len(minors), chunk_size)]
+        if workers == 1:
+            for chunk in chunks:
+                for addr in derive(chunk):
+                    yield addr
+            return
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            for addrs in executor.map(derive, chunks):
+                for addr in addrs:
+                    yield addr
+
+    def subaddress_table(self, accounts=None, addresses=200):
+        """
+        Returns a lookup table of public spend keys of the wallet's addresses, which allows
+        :meth:`Transaction.outputs() <monero.transaction.Transaction.outputs>` to recognize
+        outputs at a cost independent of the number of subaddresses.
+
+        The table is kept by the wallet and subsequent calls only extend it with
+        the keys that haven't been calculated yet.
+
+        :param accounts: the number of accounts to cover; defaults to all accounts of the wallet
+        :param addresses: the number of addresses to cover within each account
+        :rtype: :class:`SubaddressTable`
+        """
+        if self._subaddress_table is None:
+            self._subaddress_table = SubaddressTable(self.address(), self.view_key())
+        accounts = len(self.accounts) if accounts is None else accounts
+        for major in range(accounts):
+            self._subaddress_table.extend(major, addresses)
+        return self._subaddress_table
 
     def address_balance(self, addresses=None):
         """
@@ -360,3 +532,198 @@ class Wallet(object):
             unlock_time=unlock_time,
             relay=relay,
         )
+
+
+class AsyncWallet(Wallet):
+    """
+    Monero wallet operated through an asynchronous backend.
+
+    Provides the same interface as :class:`Wallet`, but the methods which communicate with
+    the backend are coroutines, as are the methods of its
+    :class:`accounts <monero.account.AsyncAccount>` and payment managers.
+
+    The accounts aren't loaded on initialization. Await :meth:`refresh` first or use
+    the wallet as an asynchronous context manager, which also closes the backend on exit.
+
+    :param backend: an asynchronous wallet backend
+    :param \\**kwargs: arguments to initialize an
+                        :class:`AsyncJSONRPCWallet <monero.backends.jsonrpc.AsyncJSONRPCWallet>`
+                        instance if no backend is given
+    """
+
+    def __init__(self, backend=None, **kwargs):
+        if backend and len(kwargs):
+            raise ValueError("backend already given, other arguments are extraneous")
+
+        if not backend:
+            from .backends.jsonrpc.asyncwallet import AsyncJSONRPCWallet
+
+            backend = AsyncJSONRPCWallet(**kwargs)
+        self._backend = backend
+        self.incoming = AsyncPaymentManager(0, self._backend, "in")
+        self.outgoing = AsyncPaymentManager(0, self._backend, "out")
+        self.accounts = []
+
+    async def close(self):
+        """Closes the backend's connections."""
+        await self._backend.close()
+
+    async def __aenter__(self):
+        await self.refresh()
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    async def refresh(self):
+        self._update_accounts(await self._backend.accounts())
+
+    async def height(self):
+        return await self._backend.height()
+
+    async def spend_key(self):
+        key = await self._backend.spend_key()
+        if key == numbers.EMPTY_KEY:
+            return None
+        return key
+
+    async def view_key(self):
+        return await self._backend.view_key()
+
+    async def seed(self):
+        return await self._backend.seed()
+
+    async def new_account(self, label=None):
+        acc, addr = await self._backend.new_account(label=label)
+        assert acc.index == len(self.accounts)
+        self.accounts.append(acc)
+        return acc
+
+    async def confirmations(self, txn_or_pmt):
+        if isinstance(txn_or_pmt, Payment):
+            txn = txn_or_pmt.transaction
+        else:
+            txn = txn_or_pmt
+        try:
+            return max(0, await self.height() - txn.height)
+        except TypeError:
+            return 0
+
+    async def export_outputs(self):
+        return await self._backend.export_outputs()
+
+    async def import_outputs(self, outputs_hex):
+        return await self._backend.import_outputs(outputs_hex)
+
+    async def export_key_images(self):
+        return await self._backend.export_key_images()
+
+    async def import_key_images(self, key_images_hex):
+        return await self._backend.import_key_images(key_images_hex)
+
+    async def balances(self):
+        return await self.accounts[0].balances()
+
+    async def balance(self, unlocked=False):
+        return await self.accounts[0].balance(unlocked=unlocked)
+
+    async def address(self):
+        return await self.accounts[0].address()
+
+    async def addresses(self):
+        return await self.accounts[0].addresses()
+
+    async def new_address(self, label=None):
+        return await self.accounts[0].new_address(label=label)
+
+    async def get_address(self, major, minor):
+        _check_index("major", major)
+        _check_index("minor", minor)
+        master_address = await self.address()
+        if major == minor == 0:
+            return master_address
+        return _subaddresses(
+            unhexlify(await self.view_key()), master_address, major, [minor]
+        )[0]
+
+    async def get_addresses(self, major, minors, workers=1, chunk_size=1000):
+        """
+        Fetches the master keys and returns a generator of sub-addresses, like
+        :meth:`Wallet.get_addresses`. The calculation itself is not asynchronous.
+
+        :rtype: generator of :class:`BaseAddress <monero.address.BaseAddress>`
+        """
+        minors = self._check_indices(major, minors)
+        return self._stream_addresses(
+            await self.view_key(),
+            await self.address(),
+            major,
+            minors,
+            workers,
+            chunk_size,
+        )
+
+    async def subaddress_table(self, accounts=None, addresses=200):
+        if self._subaddress_table is None:
+            self._subaddress_table = SubaddressTable(
+                await self.address(), await self.view_key()
+            )
+        accounts = len(self.accounts) if accounts is None else accounts
+        for major in range(accounts):
+            self._subaddress_table.extend(major, addresses)
+        return self._subaddress_table
+
+    async def address_balance(self, addresses=None):
+        return await self.accounts[0].address_balance(addresses=addresses)
+
+    async def transfer(
+        self,
+        address,
+        amount,
+        priority=const.PRIO_NORMAL,
+        payment_id=None,
+        unlock_time=0,
+        relay=True,
+    ):
+        return await self.accounts[0].transfer(
+            address,
+            amount,
+            priority=priority,
+            payment_id=payment_id,
+            unlock_time=unlock_time,
+            relay=relay,
+        )
+
+    async def transfer_multiple(
+        self,
+        destinations,
+        priority=const.PRIO_NORMAL,
+        payment_id=None,
+        unlock_time=0,
+        relay=True,
+    ):
+        return await self.accounts[0].transfer_multiple(
+            destinations,
+            priority=priority,
+            payment_id=payment_id,
+            unlock_time=unlock_time,
+            relay=relay,
+        )
+
+    async def sweep_all(
+        self,
+        address,
+        priority=const.PRIO_NORMAL,
+        payment_id=None,
+        subaddr_indices=None,
+        unlock_time=0,
+        relay=True,
+    ):
+        return await self.accounts[0].sweep_all(
+            address,
+            priority=priority,
+            payment_id=payment_id,
+            subaddr_indices=subaddr_indices,
+            unlock_time=unlock_time,
+            relay=relay,
+        )
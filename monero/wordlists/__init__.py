@@ -1,14 +1,14 @@
-from .wordlist import get_wordlist, list_wordlists
-from .english import English
-
-from .chinese_simplified import ChineseSimplified
-from .dutch import Dutch
-from .esperanto import Esperanto
-from .french import French
-from .german import German
-from .italian import Italian
-from .japanese import Japanese
-from .lojban import Lojban
-from .portuguese import Portuguese
-from .russian import Russian
-from .spanish import Spanish
+import importlib
+
+from .wordlist import LANGUAGES, get_wordlist, list_wordlists
+
+_CLASSES = {clsname: module for module, clsname in LANGUAGES.values()}
+
+
+def __getattr__(name):
+    # word list classes are imported on first access, see LANGUAGES
+    try:
+        module = _CLASSES[name]
+    except KeyError:
+        raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+    return getattr(importlib.import_module("." + module, __name__), name)
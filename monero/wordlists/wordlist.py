@@ -1,6 +1,7 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
+import importlib
 import logging
 from binascii import crc32
 
@@ -8,6 +9,22 @@ from binascii import crc32
 WORDLISTS = {}
 _log = logging.getLogger(__name__)
 
+# Built-in word lists, imported on first use: english_language_name -> (module, class)
+LANGUAGES = {
+    "English": ("english", "English"),
+    "Chinese (simplified)": ("chinese_simplified", "ChineseSimplified"),
+    "Dutch": ("dutch", "Dutch"),
+    "Esperanto": ("esperanto", "Esperanto"),
+    "French": ("french", "French"),
+    "German": ("german", "German"),
+    "Italian": ("italian", "Italian"),
+    "Japanese": ("japanese", "Japanese"),
+    "Lojban": ("lojban", "Lojban"),
+    "Portuguese": ("portuguese", "Portuguese"),
+    "Russian": ("russian", "Russian"),
+    "Spanish": ("spanish", "Spanish"),
+}
+
 
 class WordlistType(type):
     def __new__(cls, name, bases, attrs):
@@ -40,6 +57,7 @@ class WordlistType(type):
 
 class Wordlist(metaclass=WordlistType):
     n = 1626
+    _word_index = None
 
     @classmethod
     def encode(cls, hex):
@@ -62,14 +80,38 @@ class Wordlist(metaclass=WordlistType):
         phrase = phrase.split(" ")
         out = ""
         for i in range(len(phrase) // 3):
-            word1, word2, word3 = phrase[3 * i : 3 * i + 3]
-            w1 = cls.word_list.index(word1)
-            w2 = cls.word_list.index(word2) % cls.n
-            w3 = cls.word_list.index(word3) % cls.n
+            w1, w2, w3 = map(cls.word_index, phrase[3 * i : 3 * i + 3])
             x = w1 + cls.n * ((w2 - w1) % cls.n) + cls.n * cls.n * ((w3 - w2) % cls.n)
             out += endian_swap("%08x" % x)
         return out
 
+    @classmethod
+    def word_index(cls, word):
+        """Returns the position of the word in the list. The word may be truncated
+        to the first `unique_prefix_length` characters.
+
+        :rtype: int
+        :raises: `ValueError` if the word is not in the list
+        """
+        index = cls.__dict__.get("_word_index")
+        if index is None:
+            index = {}
+            for i, w in enumerate(cls.word_list):
+                index[w] = i
+            for i, w in enumerate(cls.word_list):
+                index.setdefault(w[: cls.unique_prefix_length], i)
+            cls._word_index = index
+        try:
+            return index[word]
+        except KeyError:
+            pass
+        try:
+            return index[word[: cls.unique_prefix_length]]
+        except KeyError:
+            raise ValueError(
+                "Word {0} is not in the {1} list".format(word, cls.__name__)
+            )
+
     @classmethod
     def get_checksum(cls, phrase):
         """Given a mnemonic word string, return a string of the computed checksum.
@@ -93,6 +135,13 @@ class Wordlist(metaclass=WordlistType):
 
 
 def get_wordlist(name):
+    """Returns the word list of given English name of the language. Built-in word lists
+    are imported on the first request.
+
+    :rtype: subclass of :class:`Wordlist`
+    """
+    if name not in WORDLISTS and name in LANGUAGES:
+        importlib.import_module("." + LANGUAGES[name][0], __package__)
     try:
         return WORDLISTS[name]
     except KeyError:
@@ -100,7 +149,11 @@ def get_wordlist(name):
 
 
 def list_wordlists():
-    return WORDLISTS.keys()
+    """Returns English names of all available word lists, including those not imported yet.
+
+    :rtype: list of str
+    """
+    return list(LANGUAGES) + [name for name in WORDLISTS if name not in LANGUAGES]
 
 
 def endian_swap(word):
@@ -31,6 +31,7 @@ setup(
     long_description=open("README.rst", "rb").read().decode("utf-8"),
     install_requires=open("requirements.txt", "r").read().splitlines(),
     tests_require=open("test_requirements.txt", "r").read().splitlines(),
+    extras_require={"async": ["aiohttp>=3.12"], "json": ["orjson"]},
     packages=find_packages(".", exclude=["tests"]),
     include_package_data=True,
     author="Michał Sałaban",
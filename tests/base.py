@@ -1,5 +1,6 @@
 import json
 import os
+import re
 import unittest
 
 
@@ -7,10 +8,19 @@ class JSONTestCase(unittest.TestCase):
     jsonrpc_url = "http://127.0.0.1:18088/json_rpc"
     data_subdir = None
 
-    def _read(self, *args):
+    def _path(self, *args):
         path = os.path.join(os.path.dirname(__file__), "data")
         if self.data_subdir:
             path = os.path.join(path, self.data_subdir)
-        path = os.path.join(path, *args)
-        with open(path, "r") as fh:
+        return os.path.join(path, *args)
+
+    def _read(self, *args):
+        with open(self._path(*args), "r") as fh:
             return json.loads(fh.read())
+
+    def _read_hex(self, *args):
+        # binary data written as hexadecimal digits, with comments after '#'
+        with open(self._path(*args), "r") as fh:
+            return bytes.fromhex(
+                "".join(re.sub(r"#.*", "", line) for line in fh).replace(" ", "")
+            )
@@ -1,7 +1,15 @@
+import pickle
 import unittest
 
 from monero import const
-from monero.address import Address, SubAddress, IntegratedAddress, address
+from monero.address import (
+    Address,
+    SubAddress,
+    IntegratedAddress,
+    address,
+    address_cache_clear,
+    address_cache_info,
+)
 from tests.utils import classproperty
 
 
@@ -16,7 +24,7 @@ class Tests(object):
         self.assertEqual("{:s}".format(a), self.addr)
         self.assertEqual(a.spend_key(), self.psk)
         self.assertEqual(a.view_key(), self.pvk)
-        self.assertEqual(hash(a), hash(self.addr))
+        self.assertEqual(hash(a), hash(Address(self.addr)))
         ba = Address(self.addr.encode())
         self.assertEqual(ba, a)
         ba = address(self.addr.encode())
@@ -56,7 +64,7 @@ class Tests(object):
         self.assertEqual(a, a2)
         self.assertEqual(a, self.addr)
         self.assertEqual(self.addr, a)
-        self.assertEqual(hash(a), hash(self.addr))
+        self.assertEqual(hash(a), hash(Address(self.addr)))
         self.assertEqual(a.net, self.net)
         self.assertEqual(a2.net, self.net)
 
@@ -66,7 +74,7 @@ class Tests(object):
         self.assertEqual(ia, ia2)
         self.assertEqual(ia, self.iaddr)
         self.assertEqual(self.iaddr, ia)
-        self.assertEqual(hash(ia), hash(self.iaddr))
+        self.assertEqual(hash(ia), hash(IntegratedAddress(self.iaddr)))
         self.assertEqual(ia.net, self.net)
         self.assertEqual(ia2.net, self.net)
         self.assertEqual(ia2.base_address(), a)
@@ -80,7 +88,7 @@ class Tests(object):
         self.assertEqual(sa, sa2)
         self.assertEqual(sa, self.subaddr)
         self.assertEqual(self.subaddr, sa)
-        self.assertEqual(hash(sa), hash(self.subaddr))
+        self.assertEqual(hash(sa), hash(SubAddress(self.subaddr)))
         self.assertEqual(sa.net, self.net)
         self.assertEqual(sa2.net, self.net)
 
@@ -160,6 +168,66 @@ class Tests(object):
         self.assertRaises(ValueError, SubAddress, self.addr)
         self.assertRaises(ValueError, SubAddress, self.iaddr)
 
+    def test_immutable(self):
+        a = Address(self.addr, label="a")
+        self.assertFalse(hasattr(a, "__dict__"))
+        with self.assertRaises(AttributeError):
+            a.label = "b"
+        with self.assertRaises(AttributeError):
+            a._decoded = b""
+        with self.assertRaises(AttributeError):
+            del a.label
+        self.assertEqual(a.label, "a")
+        self.assertIsNone(IntegratedAddress(self.iaddr).label)
+
+    def test_pickle(self):
+        for addr in (
+            Address(self.addr, label="a"),
+            SubAddress(self.subaddr),
+            IntegratedAddress(self.iaddr),
+        ):
+            unpickled = pickle.loads(pickle.dumps(addr))
+            self.assertIs(type(unpickled), type(addr))
+            self.assertEqual(unpickled, addr)
+            self.assertEqual(str(unpickled), str(addr))
+            self.assertEqual(unpickled.label, addr.label)
+
+    def test_sets_and_dicts(self):
+        a = Address(self.addr)
+        ia = a.with_payment_id(self.pid)
+        addrs = {a, SubAddress(self.subaddr), ia}
+        self.assertIn(Address(self.addr), addrs)
+        self.assertIn(ia.base_address(), addrs)
+        self.assertIn(IntegratedAddress(self.iaddr), addrs)
+        self.assertIn(Address(self.addr.encode()), addrs)
+        # hashing doesn't need the base58 form
+        la = a._with_label("label")
+        self.assertIn(la, addrs)
+        self.assertIsNone(la._str)
+        self.assertNotEqual(a, ia)
+        self.assertEqual(hash(ia), hash(IntegratedAddress(self.iaddr)))
+
+    def test_cache(self):
+        address_cache_clear()
+        a = address(self.addr)
+        self.assertIs(address(self.addr), a)
+        self.assertIs(address(self.addr.encode()), a)
+        info = address_cache_info()
+        self.assertEqual(info.misses, 1)
+        self.assertEqual(info.hits, 2)
+        la = address(self.addr, label="labeled")
+        self.assertIsNot(la, a)
+        self.assertEqual(la, a)
+        self.assertEqual(la.label, "labeled")
+        self.assertIsNone(a.label)
+        self.assertIsNone(address(self.subaddr).label)
+        self.assertIsInstance(address(self.iaddr), IntegratedAddress)
+        self.assertRaises(ValueError, address, self.addr_invalid)
+        self.assertRaises(ValueError, address, self.addr_invalid)
+        self.assertEqual(address_cache_info().currsize, 3)
+        address_cache_clear()
+        self.assertEqual(address_cache_info().currsize, 0)
+
     def test_subaddress_cannot_into_integrated(self):
         sa = SubAddress(self.subaddr)
         self.assertRaises(TypeError, sa.with_payment_id, self.pid)
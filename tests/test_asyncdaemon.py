@@ -0,0 +1,228 @@
+import asyncio
+import decimal
+import json
+import logging
+import unittest
+
+try:
+    from aioresponses import aioresponses, CallbackResult
+except ImportError:
+    aioresponses = None
+
+from monero.backends.jsonrpc import AsyncJSONRPCDaemon, RPCError
+from monero.backends.jsonrpc import Unauthorized
+from monero.const import NET_STAGE
+from monero.daemon import AsyncDaemon
+from monero.exceptions import DaemonIsBusy
+
+from .base import JSONTestCase
+
+
+@unittest.skipIf(aioresponses is None, "aiohttp and aioresponses are required")
+class AsyncJSONRPCDaemonTestCase(JSONTestCase):
+    jsonrpc_url = "http://127.0.0.1:18081/json_rpc"
+    transactions_url = "http://127.0.0.1:18081/get_transactions"
+    mempool_url = "http://127.0.0.1:18081/get_transaction_pool"
+    getheight_url = "http://127.0.0.1:18081/get_height"
+    data_subdir = "test_jsonrpcdaemon"
+
+    def setUp(self):
+        self.loop = asyncio.new_event_loop()
+        self.daemon = AsyncDaemon()
+        self.backend = self.daemon._backend
+        logging.getLogger("monero.backends.jsonrpc.daemon").disabled = True
+
+    def tearDown(self):
+        self.loop.run_until_complete(self.daemon.close())
+        self.loop.close()
+
+    def run_async(self, coro):
+        return self.loop.run_until_complete(coro)
+
+    def test_basic_info(self):
+        with aioresponses() as m:
+            m.post(
+                self.jsonrpc_url,
+                payload=self._read("test_basic_info-get_info.json"),
+                repeat=True,
+            )
+            self.assertTrue(self.run_async(self.daemon.info()))
+            self.assertEqual(self.run_async(self.daemon.height()), 294993)
+            self.assertEqual(self.run_async(self.daemon.net), NET_STAGE)
+
+    def test_block(self):
+        with aioresponses() as m:
+            m.post(
+                self.jsonrpc_url,
+                payload=self._read(
+                    "test_block-423cd4d170c53729cf25b4243ea576d1e901d86e26c06d6a7f79815f3fcb9a89.json"
+                ),
+            )
+            m.post(
+                self.transactions_url,
+                payload=self._read(
+                    "test_block-423cd4d170c53729cf25b4243ea576d1e901d86e26c06d6a7f79815f3fcb9a89-txns.json"
+                ),
+            )
+            blk = self.run_async(
+                self.daemon.block(
+                    "423cd4d170c53729cf25b4243ea576d1e901d86e26c06d6a7f79815f3fcb9a89"
+                )
+            )
+        self.assertEqual(blk.height, 451992)
+        self.assertIsInstance(blk.reward, decimal.Decimal)
+        self.assertIn(
+            "24fb42f9f324082658524b29b4cf946a9f5fcfa82194070e2f17c1875e15d5d0", blk
+        )
+        with self.assertRaises(ValueError):
+            self.run_async(self.daemon.block())
+
+    def test_chunking(self):
+        chunks = [
+            self._read("test_chunking-20-get_transactions_1of2.json"),
+            self._read("test_chunking-20-get_transactions_2of2.json"),
+        ]
+
+        def get_transactions(url, **kwargs):
+            first = json.loads(kwargs["data"])["txs_hashes"][0]
+            for chunk in chunks:
+                if chunk["txs"][0]["tx_hash"] == first:
+                    return CallbackResult(payload=chunk)
+
+        with aioresponses() as m:
+            m.post(
+                self.jsonrpc_url,
+                payload=self._read("test_chunking-10-block-693324.json"),
+            )
+            m.post(self.transactions_url, callback=get_transactions, repeat=True)
+            blk = self.run_async(self.daemon.block(height=693324))
+        self.assertEqual(len(blk.transactions), 105)
+        self.assertEqual(len(set(blk.transactions)), 105)
+
+    def test_concurrent_requests(self):
+        with aioresponses() as m:
+            m.post(
+                self.jsonrpc_url,
+                payload=self._read("test_headers_2279790_2279799.json"),
+                repeat=True,
+            )
+
+            async def many():
+                return await asyncio.gather(
+                    *[self.daemon.headers(2279790, 2279799) for _ in range(20)]
+                )
+
+            results = self.run_async(many())
+        self.assertEqual(len(results), 20)
+        for headers in results:
+            self.assertEqual(len(headers), 10)
+            self.assertEqual(headers[9]["nonce"], 275623)
+
+    def test_batch(self):
+        blkhash = self._read("test_on_get_block_hash_2000000.json")
+
+        def batch(url, **kwargs):
+            calls = json.loads(kwargs["data"])
+            return CallbackResult(
+                payload=[dict(blkhash, id=call["id"]) for call in calls]
+            )
+
+        with aioresponses() as m:
+            m.post(self.jsonrpc_url, callback=batch)
+
+            async def run():
+                async with self.backend.batch() as b:
+                    hashes = [b.on_get_block_hash(h) for h in range(10)]
+                    with self.assertRaises(ValueError):
+                        b.get_height()
+                return hashes
+
+            hashes = self.run_async(run())
+        self.assertEqual(len(hashes), 10)
+        self.assertEqual(set(h.result for h in hashes), set([blkhash["result"]]))
+
+    def test_blocks(self):
+        with aioresponses() as m:
+            m.post(
+                "http://127.0.0.1:18081/get_blocks_by_height.bin",
+                body=self._read_hex("test_get_blocks_by_height_bin_451992.hex"),
+            )
+            blocks = self.run_async(self.daemon.blocks([451992]))
+        self.assertEqual(len(blocks), 1)
+        self.assertEqual(
+            blocks[0].hash,
+            "423cd4d170c53729cf25b4243ea576d1e901d86e26c06d6a7f79815f3fcb9a89",
+        )
+        self.assertEqual(len(blocks[0].transactions), 5)
+
+    def test_get_o_indexes_bin(self):
+        body = self._read_hex("test_get_o_indexes_bin_7e5fea.hex")
+        with aioresponses() as m:
+            m.post("http://127.0.0.1:18081/get_o_indexes.bin", body=body)
+            res = self.run_async(
+                self.backend.get_o_indexes_bin(
+                    "7e5fea8470c5771315bab4b3c77493d2ff534f5201c7c6b2bab069cb7d21ce7b"
+                )
+            )
+        self.assertEqual(res["o_indexes"], [2100602, 2100603])
+        self.assertEqual(res["status"], "OK")
+
+    def test_mempool(self):
+        with aioresponses() as m:
+            m.post(
+                self.mempool_url, payload=self._read("test_mempool-transactions.json")
+            )
+            txs = self.run_async(self.daemon.mempool())
+        self.assertTrue(txs)
+        self.assertEqual(txs[0].confirmations, 0)
+
+    def test_raw_methods(self):
+        with aioresponses() as m:
+            m.post(
+                self.jsonrpc_url,
+                payload=self._read("test_get_block_count_2287024.json"),
+            )
+            m.post(
+                self.getheight_url, payload=self._read("test_get_height_2294632.json")
+            )
+            m.post(self.jsonrpc_url, payload=self._read("test_get_bans.json"))
+            self.assertEqual(
+                self.run_async(self.backend.get_block_count())["count"], 2287024
+            )
+            self.assertEqual(
+                self.run_async(self.backend.get_height())["height"], 2294632
+            )
+            self.assertIn("bans", self.run_async(self.backend.get_bans()))
+        with self.assertRaises(ValueError):
+            self.run_async(self.backend.on_get_block_hash(-1))
+
+    def test_errors(self):
+        with aioresponses() as m:
+            m.post(self.jsonrpc_url, status=401)
+            m.post(self.jsonrpc_url, payload=self._read("test_invalid_param.json"))
+            m.post(
+                self.jsonrpc_url,
+                payload=self._read("test_get_last_block_header_BUSY.json"),
+            )
+            m.post(
+                self.jsonrpc_url,
+                payload={
+                    "id": 0,
+                    "jsonrpc": "2.0",
+                    "error": {"code": -32601, "message": "Method not found"},
+                },
+            )
+            with self.assertRaises(Unauthorized):
+                self.run_async(self.daemon.info())
+            with self.assertRaises(RPCError):
+                self.run_async(self.daemon.block(height=-1))
+            with self.assertRaises(DaemonIsBusy):
+                self.run_async(self.backend.get_last_block_header())
+            self.assertTrue(self.run_async(self.backend.restricted()))
+
+    def test_init_default_backend(self):
+        self.assertIsInstance(
+            AsyncDaemon(host="localhost")._backend, AsyncJSONRPCDaemon
+        )
+        with self.assertRaises(ValueError):
+            AsyncDaemon(backend=AsyncJSONRPCDaemon(), port=18089)
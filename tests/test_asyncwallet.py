@@ -0,0 +1,208 @@
+import asyncio
+from decimal import Decimal
+import logging
+import subprocess
+import sys
+import unittest
+
+try:
+    from aioresponses import aioresponses
+except ImportError:
+    aioresponses = None
+
+from monero.account import AsyncAccount
+from monero.address import Address, SubAddress
+from monero.backends.jsonrpc import AsyncJSONRPCWallet, Unauthorized
+from monero.exceptions import AccountIndexOutOfBound
+from monero.transaction import Transaction
+from monero.wallet import AsyncWallet
+
+from .base import JSONTestCase
+
+
+@unittest.skipIf(aioresponses is None, "aiohttp and aioresponses are required")
+class AsyncJSONRPCWalletTestCase(JSONTestCase):
+    jsonrpc_url = "http://127.0.0.1:18088/json_rpc"
+    data_subdir = "test_jsonrpcwallet"
+
+    def setUp(self):
+        self.loop = asyncio.new_event_loop()
+        self.wallet = AsyncWallet()
+        logging.getLogger("monero.backends.jsonrpc.wallet").disabled = True
+
+    def tearDown(self):
+        self.loop.run_until_complete(self.wallet.close())
+        self.loop.close()
+
+    def run_async(self, coro):
+        return self.loop.run_until_complete(coro)
+
+    def test_account_creation(self):
+        with aioresponses() as m:
+            for name in (
+                "test_account_creation-00-get_accounts.json",
+                "test_account_creation-10-create_account.json",
+                "test_account_creation-20-getbalance.json",
+                "test_account_creation-30-get_accounts.json",
+            ):
+                m.post(self.jsonrpc_url, payload=self._read(name))
+            self.assertEqual(self.wallet.accounts, [])
+            self.run_async(self.wallet.refresh())
+            self.assertEqual(1, len(self.wallet.accounts))
+            self.assertIsInstance(self.wallet.accounts[0], AsyncAccount)
+            self.run_async(self.wallet.new_account("account 1"))
+            self.assertEqual(2, len(self.wallet.accounts))
+            self.assertEqual("account 1", self.wallet.accounts[1].label)
+            self.assertEqual(0, self.run_async(self.wallet.accounts[1].balance()))
+            acc0, acc1 = self.wallet.accounts
+            self.run_async(self.wallet.refresh())
+        self.assertEqual([acc0, acc1], self.wallet.accounts)
+
+    def test_new_address(self):
+        with aioresponses() as m:
+            for name in (
+                "test_new_address-00-get_accounts.json",
+                "test_new_address-10-new_address_account_0.json",
+                "test_new_address-20-new_address_account_1.json",
+            ):
+                m.post(self.jsonrpc_url, payload=self._read(name))
+
+            async def run():
+                async with self.wallet as w:
+                    return (
+                        await w.new_address(),
+                        await w.accounts[1].new_address(),
+                    )
+
+            (subaddr0, index0), (subaddr1, index1) = self.run_async(run())
+        self.assertIsInstance(subaddr0, SubAddress)
+        self.assertIsInstance(index0, int)
+        self.assertIsInstance(subaddr1, SubAddress)
+        self.assertIsInstance(index1, int)
+
+    def test_address(self):
+        with aioresponses() as m:
+            m.post(
+                self.jsonrpc_url,
+                payload=self._read("test_address-00-get_accounts.json"),
+            )
+            m.post(
+                self.jsonrpc_url,
+                payload=self._read("test_address-10-getaddress.json"),
+                repeat=True,
+            )
+            self.run_async(self.wallet.refresh())
+            addr = self.run_async(self.wallet.address())
+            self.assertIsInstance(addr, Address)
+            self.assertEqual(self.run_async(self.wallet.get_address(0, 0)), addr)
+
+    def test_incoming_by_tx_id(self):
+        with aioresponses() as m:
+            m.post(
+                self.jsonrpc_url,
+                payload=self._read("test_incoming_by_tx_id-00-get_accounts.json"),
+            )
+            m.post(
+                self.jsonrpc_url,
+                payload=self._read(
+                    "test_incoming_by_tx_id-7ab84-get_transfer_by_txid.json"
+                ),
+            )
+            m.post(
+                self.jsonrpc_url,
+                payload={
+                    "id": 0,
+                    "jsonrpc": "2.0",
+                    "error": {
+                        "code": -8,
+                        "message": "Transaction not found.",
+                    },
+                },
+            )
+            self.run_async(self.wallet.refresh())
+            pmts = self.run_async(
+                self.wallet.incoming(
+                    tx_id=[
+                        "7ab84fe2fb34467c590cde2f7d6ba7de5928a2db6c84c6ccfff8962eca0ad99c",
+                        "0000000000000000000000000000000000000000000000000000000000000000",
+                    ]
+                )
+            )
+        self.assertEqual(len(pmts), 3)
+        self.assertEqual(pmts[0].amount, Decimal(1))
+        self.assertEqual(pmts[1].amount, Decimal(1))
+        self.assertEqual(pmts[2].amount, Decimal(2))
+
+    def test_sweep_all(self):
+        with aioresponses() as m:
+            for name in (
+                "test_sweep_all-00-get_accounts.json",
+                "test_sweep_all-10-getbalance.json",
+                "test_sweep_all-20-sweep_all.json",
+            ):
+                m.post(self.jsonrpc_url, payload=self._read(name))
+            self.run_async(self.wallet.refresh())
+            result = self.run_async(
+                self.wallet.sweep_all(
+                    "55LTR8KniP4LQGJSPtbYDacR7dz8RBFnsfAKMaMuwUNYX6aQbBcovzDPyrQF9KXF9tVU6Xk3K8no1BywnJX6GvZX8yJsXvt",
+                    relay=False,
+                )
+            )
+        self.assertEqual(len(result), 1)
+        self.assertIsInstance(result[0][0], Transaction)
+        self.assertEqual(Decimal("111.086545699972"), result[0][1])
+
+    def test_backend_context_manager(self):
+        async def use_backend():
+            async with AsyncJSONRPCWallet() as backend:
+                self.assertEqual(await backend.height(), 1087606)
+                self.assertIsNotNone(backend.session)
+            return backend
+
+        with aioresponses() as m:
+            m.post(
+                self.jsonrpc_url,
+                payload={"id": 0, "jsonrpc": "2.0", "result": {"height": 1087606}},
+            )
+            backend = self.run_async(use_backend())
+        self.assertIsNone(backend.session)
+
+    def test_errors(self):
+        with aioresponses() as m:
+            m.post(self.jsonrpc_url, status=401)
+            m.post(
+                self.jsonrpc_url,
+                payload={
+                    "id": 0,
+                    "jsonrpc": "2.0",
+                    "error": {
+                        "code": -14,
+                        "message": "account index is out of bound",
+                    },
+                },
+            )
+            with self.assertRaises(Unauthorized):
+                self.run_async(self.wallet.refresh())
+            with self.assertRaises(AccountIndexOutOfBound):
+                self.run_async(self.wallet._backend.balances(account=5))
+
+    def test_init_default_backend(self):
+        self.assertIsInstance(
+            AsyncWallet(host="localhost")._backend, AsyncJSONRPCWallet
+        )
+        with self.assertRaises(ValueError):
+            AsyncWallet(backend=AsyncJSONRPCWallet(), port=18089)
+
+
+class AsyncImportTestCase(unittest.TestCase):
+    def test_sync_import_skips_aiohttp(self):
+        loaded = subprocess.check_output(
+            [
+                sys.executable,
+                "-c",
+                "import sys, monero.daemon, monero.wallet; "
+                "print(sorted(m for m in sys.modules "
+                "if m.split('.')[-1] in ('aiohttp', 'asyncdaemon', 'asyncwallet')))",
+            ]
+        )
+        self.assertEqual(loaded.strip(), b"[]")
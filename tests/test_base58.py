@@ -1,6 +1,14 @@
+from binascii import hexlify, unhexlify
 import unittest
 
-from monero.base58 import decode, encode
+from monero.base58 import (
+    decode,
+    decode_bytes,
+    decode_many,
+    encode,
+    encode_bytes,
+    encode_many,
+)
 
 
 class Base58EncodeTestCase(unittest.TestCase):
@@ -21,3 +29,41 @@ class Base58DecodeTestCase(unittest.TestCase):
         with self.assertRaises(ValueError) as cm:
             decode("f")
         self.assertEqual(str(cm.exception), "Invalid encoded length: 1")
+
+    def test_decode_invalid_symbol(self):
+        with self.assertRaises(ValueError) as cm:
+            decode("0" * 11)
+        self.assertEqual(str(cm.exception), "Invalid symbol: 0")
+
+    def test_decode_overflow(self):
+        with self.assertRaises(ValueError):
+            decode("z" * 11)
+        with self.assertRaises(ValueError):
+            decode("zz")
+
+
+class Base58BytesTestCase(unittest.TestCase):
+    addr = "47ewoP19TN7JEEnFKUJHAYhGxkeTRH82sf36giEp9AcNfDBfkAtRLX7A6rZz18bbNHPNV7ex6WYbMN3aKisFRJZ8Ebsmgef"
+
+    def test_round_trip(self):
+        data = decode_bytes(self.addr)
+        self.assertEqual(len(data), 69)
+        self.assertEqual(data, unhexlify(decode(self.addr)))
+        self.assertEqual(encode_bytes(data), self.addr)
+        self.assertEqual(encode(hexlify(data)), self.addr)
+        for size in range(0, 40):
+            data = bytes(range(size))
+            self.assertEqual(decode_bytes(encode_bytes(data)), data)
+            self.assertEqual(encode_bytes(data), encode(hexlify(data)))
+
+    def test_empty(self):
+        self.assertEqual(encode_bytes(b""), "")
+        self.assertEqual(decode_bytes(""), b"")
+
+    def test_many(self):
+        addrs = [self.addr, encode_bytes(b"\0" * 69)]
+        decoded = decode_many(addrs)
+        self.assertEqual(decoded, [decode_bytes(self.addr), b"\0" * 69])
+        self.assertEqual(encode_many(decoded), addrs)
+        with self.assertRaises(ValueError):
+            decode_many([self.addr, "I" * 95])
@@ -1,7 +1,8 @@
 from datetime import datetime
 import unittest
 
-from monero.block import Block
+from monero.block import Block, TransactionList
+from monero.exceptions import BackendException
 from monero.numbers import from_atomic
 from monero.transaction import Transaction
 
@@ -71,3 +72,63 @@ class BlockTestCase(unittest.TestCase):
         self.assertIn(self.tx2.hash, self.block1_duplicate)
         self.assertIn(self.tx3.hash, self.block1_duplicate)
         self.assertIn(self.tx4.hash, self.block1_duplicate)
+
+
+class TransactionListTestCase(unittest.TestCase):
+    def setUp(self):
+        self.hashes = ["{:064x}".format(i) for i in range(10)]
+        self.fetched = []
+
+    def fetch(self, hashes):
+        self.fetched.append(hashes)
+        return [Transaction(hash=h) for h in hashes]
+
+    def test_lazy(self):
+        miner_tx = Transaction(hash=self.hashes[0])
+        txs = TransactionList(
+            self.hashes, self.fetch, chunk_size=4, transactions=[miner_tx]
+        )
+        blk = Block(hash="ab" * 32, transactions=txs)
+        self.assertEqual(len(blk.transactions), 10)
+        self.assertIn(self.hashes[9], blk)
+        self.assertIn(miner_tx, blk)
+        self.assertNotIn("ff" * 32, blk)
+        self.assertIs(txs[0], miner_tx)
+        self.assertEqual(self.fetched, [])
+        self.assertEqual(txs[5].hash, self.hashes[5])
+        self.assertEqual(self.fetched, [self.hashes[4:8]])
+        self.assertEqual(txs[-1].hash, self.hashes[9])
+        self.assertEqual(self.fetched[-1], self.hashes[8:])
+        self.assertEqual([tx.hash for tx in txs], self.hashes)
+        self.assertEqual(self.fetched[-1], self.hashes[1:4])
+        self.assertEqual(len(self.fetched), 3)
+        self.assertEqual([tx.hash for tx in txs[2:4]], self.hashes[2:4])
+        with self.assertRaises(IndexError):
+            txs[10]
+
+    def test_load(self):
+        txs = TransactionList(self.hashes, self.fetch, chunk_size=4)
+        txs.load()
+        self.assertEqual(self.fetched, [self.hashes])
+        txs.load()
+        self.assertEqual(len(self.fetched), 1)
+
+    def test_chunk_size_callable(self):
+        sizes = []
+
+        def chunk_size():
+            sizes.append(4)
+            return 4
+
+        txs = TransactionList(self.hashes, self.fetch, chunk_size=chunk_size)
+        self.assertEqual(len(txs), 10)
+        self.assertEqual(sizes, [])
+        self.assertEqual(txs[5].hash, self.hashes[5])
+        self.assertEqual(self.fetched, [self.hashes[4:8]])
+        self.assertEqual([tx.hash for tx in txs], self.hashes)
+        self.assertEqual(sizes, [4])
+
+    def test_missing(self):
+        txs = TransactionList(self.hashes, lambda hashes: [], chunk_size=4)
+        with self.assertRaises(BackendException):
+            txs[0]
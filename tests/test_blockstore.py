@@ -0,0 +1,186 @@
+import os
+import shutil
+import tempfile
+from unittest.mock import patch
+
+import responses
+
+from monero.backends.blockstore import BlockStore
+from monero.backends.jsonrpc import JSONRPCDaemon
+from monero.block import Block
+from monero.daemon import Daemon
+from monero.exceptions import BackendException, TransactionWithoutBlob
+from monero.scanner import scan_transactions
+from monero.transaction import Transaction
+
+from .base import JSONTestCase
+from .test_scanner import FakeDaemon, ScannerTestBase
+
+
+class BlockStoreTestCase(JSONTestCase):
+    jsonrpc_url = "http://127.0.0.1:18081/json_rpc"
+    transactions_url = "http://127.0.0.1:18081/get_transactions"
+    data_subdir = "test_jsonrpcdaemon"
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.path = os.path.join(self.tmpdir, "blocks.sqlite")
+        self.store = BlockStore(self.path)
+
+    def tearDown(self):
+        self.store.close()
+        shutil.rmtree(self.tmpdir)
+
+    @responses.activate
+    def test_sync(self):
+        responses.add(
+            responses.POST,
+            self.jsonrpc_url,
+            json=self._read(
+                "test_block-423cd4d170c53729cf25b4243ea576d1e901d86e26c06d6a7f79815f3fcb9a89.json"
+            ),
+        )
+        responses.add(
+            responses.POST,
+            self.transactions_url,
+            json=self._read(
+                "test_block-423cd4d170c53729cf25b4243ea576d1e901d86e26c06d6a7f79815f3fcb9a89-txns.json"
+            ),
+        )
+        daemon = Daemon(JSONRPCDaemon(prune_transactions=False))
+        self.assertEqual(self.store.sync(daemon, 451992, 451992), 1)
+        blk = daemon.block(height=451992)
+        self.store.close()
+
+        self.store = BlockStore(self.path)
+        offline = Daemon(backend=self.store)
+        self.assertEqual(offline.height(), 451993)
+        stored = offline.block(height=451992)
+        self.assertEqual(stored, blk)
+        self.assertEqual(stored.prev_hash, blk.prev_hash)
+        self.assertEqual(stored.reward, blk.reward)
+        self.assertEqual(stored.timestamp, blk.timestamp)
+        self.assertEqual(stored.compute_hash(), blk.hash)
+        self.assertEqual(
+            [tx.hash for tx in stored.transactions],
+            [tx.hash for tx in blk.transactions],
+        )
+        for tx, orig in zip(stored.transactions, blk.transactions):
+            self.assertIsNone(tx.blob)
+            self.assertEqual(tx.compute_hash(), tx.hash)
+            self.assertEqual(tx.height, 451992)
+            self.assertEqual(tx.fee, orig.fee)
+            self.assertEqual(tx.output_indices, orig.output_indices)
+            self.assertEqual(
+                [out.stealth_address for out in tx.outputs()],
+                [out.stealth_address for out in orig.outputs()],
+            )
+        self.assertEqual(offline.block(blk.hash), blk)
+        hdr = offline.headers(451992)[0]
+        self.assertEqual(hdr["hash"], blk.hash)
+        self.assertEqual(hdr["depth"], 0)
+        self.assertEqual(
+            offline.transactions(
+                "24fb42f9f324082658524b29b4cf946a9f5fcfa82194070e2f17c1875e15d5d0"
+            )[0].height,
+            451992,
+        )
+        with self.assertRaises(BackendException):
+            offline.block(height=451993)
+        with self.assertRaises(TransactionWithoutBlob):
+            self.store.add_transactions([Transaction(hash="ab" * 32)])
+
+    def _add_block_responses(self):
+        responses.add(
+            responses.POST,
+            self.jsonrpc_url,
+            json=self._read(
+                "test_block-423cd4d170c53729cf25b4243ea576d1e901d86e26c06d6a7f79815f3fcb9a89.json"
+            ),
+        )
+        responses.add(
+            responses.POST,
+            self.transactions_url,
+            json=self._read(
+                "test_block-423cd4d170c53729cf25b4243ea576d1e901d86e26c06d6a7f79815f3fcb9a89-txns.json"
+            ),
+        )
+
+    @responses.activate
+    def test_sync_confirmations(self):
+        self._add_block_responses()
+        daemon = Daemon(JSONRPCDaemon(prune_transactions=False))
+        with patch.object(daemon, "height", return_value=452001):
+            # the block 451992 has only 9 confirmations
+            self.assertEqual(self.store.sync(daemon, 451992), 0)
+            self.assertEqual(self.store.sync(daemon, 451992, confirmations=9), 1)
+        self.assertEqual(len(responses.calls), 2)
+        self.assertEqual(self.store.info()["height"], 451993)
+
+    def _chain(self, start, length, fork=None):
+        blocks = []
+        prev_hash = None
+        for height in range(start, start + length):
+            bhash = "{:064x}".format(
+                height if fork is None or height < fork else -height
+            )
+            blocks.append(Block(height=height, hash=bhash, prev_hash=prev_hash))
+            prev_hash = bhash
+        return blocks
+
+    def test_sync_reorganization(self):
+        daemon = FakeDaemon(self._chain(100, 6))
+        self.assertEqual(self.store.sync(daemon, 100, 105), 6)
+        # blocks from 103 on get replaced
+        daemon.blocks = self._chain(100, 8, fork=103)
+        daemon.fetched = []
+        with self.assertLogs("monero.backends.blockstore", "WARNING"):
+            self.assertEqual(self.store.sync(daemon, end_height=107), 5)
+        self.assertEqual(daemon.fetched, [106, 103, 104, 105, 106, 107])
+        offline = Daemon(backend=self.store)
+        self.assertEqual(offline.height(), 108)
+        self.assertEqual(
+            [blk.hash for blk in offline.blocks(range(100, 108))],
+            [blk.hash for blk in daemon.blocks],
+        )
+
+
+class BlockStoreScanTestCase(ScannerTestBase):
+    def setUp(self):
+        super(BlockStoreScanTestCase, self).setUp()
+        self.tmpdir = tempfile.mkdtemp()
+        self.store = BlockStore(os.path.join(self.tmpdir, "blocks.sqlite"))
+
+    def tearDown(self):
+        self.store.close()
+        shutil.rmtree(self.tmpdir)
+
+    def test_offline_scan(self):
+        txs = []
+        for name in (
+            "test_multiple_outputs-daemon-00-get_transactions.json",
+            "test_v2_single_output-daemon-00-get_transactions.json",
+        ):
+            for tx in self._read(name)["txs"]:
+                txs.append(
+                    Transaction(
+                        hash=tx["tx_hash"],
+                        height=tx["block_height"],
+                        output_indices=tx["output_indices"],
+                        blob=tx["as_hex"] or None,
+                        pruned_blob=tx["pruned_as_hex"] or None,
+                        prunable_hash=tx["prunable_hash"],
+                    )
+                )
+        self.store.add_transactions(txs)
+        stored = self.store.transactions([tx.hash for tx in txs])
+        table = self.wallet.subaddress_table(accounts=2, addresses=30)
+        outs = scan_transactions(self.txs[:-1], self.svk, table, workers=1)
+        stored_outs = scan_transactions(stored, self.svk, table, workers=1)
+        self.assertEqual(len(stored_outs), 5)
+        self.assertEqual(
+            [(out.transaction.hash, out.amount, out.index) for out in stored_outs],
+            [(out.transaction.hash, out.amount, out.index) for out in outs],
+        )
+        for tx in stored:
+            self.assertEqual(tx.compute_hash(), tx.hash)
@@ -0,0 +1,55 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+from monero.backends.jsonrpc.cache import MemoryCache, ResponseCache, SQLiteCache
+
+
+class ResponseCacheTestCase(unittest.TestCase):
+    def test_abstract(self):
+        self.assertRaises(TypeError, ResponseCache)
+
+
+class MemoryCacheTestCase(unittest.TestCase):
+    def test_lru(self):
+        cache = MemoryCache(maxsize=2)
+        cache.set("a", {"x": 1})
+        cache.set("b", "bb")
+        self.assertEqual(cache.get("a"), {"x": 1})
+        cache.set("c", [1, 2])
+        # "b" was the least recently used
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.get("a"), {"x": 1})
+        self.assertEqual(cache.get("c"), [1, 2])
+        self.assertEqual(cache.stats(), {"hits": 3, "misses": 1, "entries": 2})
+
+    def test_copies(self):
+        cache = MemoryCache()
+        value = {"x": [1, 2]}
+        cache.set("a", value)
+        value["x"].append(3)
+        self.assertEqual(cache.get("a"), {"x": [1, 2]})
+        cache.get("a")["x"].append(4)
+        self.assertEqual(cache.get("a"), {"x": [1, 2]})
+
+
+class SQLiteCacheTestCase(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.path = os.path.join(self.tmpdir, "cache.sqlite")
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def test_persistence(self):
+        cache = SQLiteCache(self.path)
+        self.assertIsNone(cache.get("a"))
+        cache.set("a", {"x": [1, "2"]})
+        cache.set("a", {"x": [1, "3"]})
+        cache.close()
+        cache = SQLiteCache(self.path)
+        self.assertEqual(cache.get("a"), {"x": [1, "3"]})
+        self.assertEqual(cache.stats(), {"hits": 1, "misses": 0, "entries": 1})
+        self.assertEqual(len(cache), 1)
+        cache.close()
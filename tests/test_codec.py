@@ -0,0 +1,94 @@
+import json
+import unittest
+from unittest.mock import Mock, patch
+
+from monero.backends.jsonrpc import JSONRPCDaemon, JSONRPCWallet
+from monero.backends.jsonrpc import codec as codec_module
+from monero.backends.jsonrpc.codec import (
+    CODECS,
+    JSONCodec,
+    UjsonCodec,
+    default_codec,
+    get_codec,
+)
+from monero.transaction import Transaction
+
+
+def _installed():
+    for name in CODECS:
+        try:
+            yield get_codec(name)
+        except ImportError:
+            pass
+
+
+class JSONCodecTestCase(unittest.TestCase):
+    doc = {"status": "OK", "height": 2279790, "txs": [{"as_hex": "ab", "fee": 0.5}]}
+
+    def test_round_trip(self):
+        for codec in _installed():
+            with self.subTest(codec=codec.name):
+                self.assertEqual(codec.loads(codec.dumps(self.doc)), self.doc)
+                self.assertEqual(codec.loads(json.dumps(self.doc).encode()), self.doc)
+
+    def test_big_integers(self):
+        doc = {"difficulty": 2**70}
+        for codec in _installed():
+            with self.subTest(codec=codec.name):
+                self.assertEqual(codec.loads(json.dumps(doc)), doc)
+                self.assertEqual(json.loads(codec.dumps(doc)), doc)
+
+    def test_invalid(self):
+        for codec in _installed():
+            with self.subTest(codec=codec.name):
+                self.assertRaises(ValueError, codec.loads, b"{status: OK")
+
+    def test_invalid_not_parsed_again(self):
+        for codec in _installed():
+            if codec.name == "json":
+                continue
+            with self.subTest(codec=codec.name), patch.object(
+                codec_module, "json"
+            ) as stdlib:
+                self.assertRaises(ValueError, codec.loads, b"{status: OK")
+                stdlib.loads.assert_not_called()
+
+    def test_ujson_fallback(self):
+        fake = Mock()
+        with patch.object(codec_module, "ujson", fake):
+            codec = UjsonCodec()
+            fake.loads.side_effect = ValueError("Value is too big!")
+            self.assertEqual(
+                codec.loads('{"a": 1180591620717411303425}'), {"a": 2**70 + 1}
+            )
+            fake.loads.side_effect = ValueError("Expected object or value")
+            with patch.object(codec_module, "json") as stdlib:
+                self.assertRaises(ValueError, codec.loads, "{status: OK")
+                stdlib.loads.assert_not_called()
+
+    def test_codecs(self):
+        self.assertIsInstance(default_codec(), JSONCodec)
+        self.assertIs(default_codec(), default_codec())
+        self.assertEqual(get_codec("json").name, "json")
+        self.assertRaises(ValueError, get_codec, "simplejson")
+
+    def test_backends(self):
+        codec = JSONCodec()
+        self.assertIs(JSONRPCDaemon(json_codec=codec).codec, codec)
+        self.assertIs(JSONRPCWallet(json_codec=codec).codec, codec)
+        self.assertIs(JSONRPCDaemon().codec, default_codec())
+
+    def test_transaction_json(self):
+        class CountingCodec(JSONCodec):
+            calls = 0
+
+            def loads(self, data):
+                self.calls += 1
+                return super(CountingCodec, self).loads(data)
+
+        codec = CountingCodec()
+        tx = Transaction(json='{"version": 2, "rct_signatures": {}}', codec=codec)
+        self.assertEqual(codec.calls, 0)
+        self.assertEqual(tx.version, 2)
+        self.assertEqual(tx.json["version"], 2)
+        self.assertEqual(codec.calls, 1)
@@ -3,11 +3,15 @@ import json
 import logging
 import os
 import responses
+from unittest.mock import patch
 
+from monero import portable_storage
 from monero.const import NET_STAGE
 from monero.daemon import Daemon
 from monero.backends.jsonrpc import JSONRPCDaemon, RPCError
-from monero.exceptions import TransactionWithoutBlob, DaemonIsBusy
+from monero.backends.jsonrpc.cache import MemoryCache
+from monero.exceptions import BackendException, TransactionWithoutBlob, DaemonIsBusy
+from monero.numbers import from_atomic
 from monero.transaction import Transaction
 
 from .base import JSONTestCase
@@ -63,6 +67,34 @@ class JSONRPCDaemonTestCase(JSONTestCase):
         self.assertTrue(self.daemon.info())
         self.assertEqual(self.daemon.height(), 294993)
 
+    @responses.activate
+    def test_debug_log_formatting(self):
+        responses.add(
+            responses.POST,
+            self.jsonrpc_url,
+            json=self._read("test_basic_info-get_info.json"),
+            status=200,
+        )
+        responses.add(
+            responses.POST,
+            self.jsonrpc_url,
+            json=self._read("test_basic_info-get_info.json"),
+            status=200,
+        )
+        with patch("monero.backends.jsonrpc.payload.json") as mock_json:
+            self.daemon.info()
+            mock_json.dumps.assert_not_called()
+        self.backend.log_payload_limit = 100
+        log = logging.getLogger("monero.backends.jsonrpc.daemon")
+        with patch.object(log, "disabled", False), self.assertLogs(
+            log, "DEBUG"
+        ) as logs:
+            self.daemon.info()
+        result = logs.records[-1].getMessage()
+        self.assertTrue(result.startswith("Result:\n{"))
+        self.assertRegex(result, r"\.\.\. \[\d+ more characters\]$")
+        self.assertEqual(len(result.split("... [")[0]), len("Result:\n") + 100)
+
     @responses.activate
     def test_net(self):
         responses.add(
@@ -128,6 +160,31 @@ class JSONRPCDaemonTestCase(JSONTestCase):
         )
         self.assertEqual(blk.height, 451992)
         self.assertIsInstance(blk.reward, decimal.Decimal)
+        self.assertEqual(blk.compute_hash(), blk.hash)
+        # the transactions are fetched on access, starting with the miner one
+        self.assertEqual(len(blk.transactions), 5)
+        self.assertIn(
+            "24fb42f9f324082658524b29b4cf946a9f5fcfa82194070e2f17c1875e15d5d0", blk
+        )
+        self.assertEqual(len(responses.calls), 1)
+        self.assertEqual(blk.transactions[-1].height, 451992)
+        self.assertEqual(len(responses.calls), 2)
+        self.assertEqual(
+            json.loads(responses.calls[1].request.body)["txs_hashes"],
+            [tx.hash for tx in blk.transactions],
+        )
+        miner_tx = blk.transactions[0]
+        self.assertEqual(
+            miner_tx.hash,
+            "f2bd4cb3dafd5c096be7e1ec908f98bf34903f5a013faa65a0d0c8998154c583",
+        )
+        self.assertTrue(miner_tx.is_coinbase)
+        self.assertEqual(miner_tx.height, 451992)
+        # the outputs of the miner tx keep their global indices
+        self.assertIsNotNone(miner_tx.output_indices)
+        self.assertEqual(
+            [out.index for out in miner_tx.outputs()], miner_tx.output_indices
+        )
 
         self.assertIn(
             "24fb42f9f324082658524b29b4cf946a9f5fcfa82194070e2f17c1875e15d5d0", blk
@@ -146,6 +203,83 @@ class JSONRPCDaemonTestCase(JSONTestCase):
         with self.assertRaises(ValueError):
             self.daemon.block()
 
+    @responses.activate
+    def test_block_chunk_size(self):
+        responses.add(
+            responses.POST,
+            self.jsonrpc_url,
+            json=self._read(
+                "test_block-423cd4d170c53729cf25b4243ea576d1e901d86e26c06d6a7f79815f3fcb9a89.json"
+            ),
+        )
+        daemon = Daemon(JSONRPCDaemon(transactions_chunk_size=None))
+        blk = daemon.block(height=451992)
+        # whether the server is restricted is asked only once the transactions are read
+        self.assertEqual(len(blk.transactions), 5)
+        self.assertEqual(len(responses.calls), 1)
+
+    @responses.activate
+    def test_cache(self):
+        responses.add(
+            responses.POST,
+            self.jsonrpc_url,
+            json=self._read(
+                "test_block-423cd4d170c53729cf25b4243ea576d1e901d86e26c06d6a7f79815f3fcb9a89.json"
+            ),
+        )
+        responses.add(
+            responses.POST,
+            self.transactions_url,
+            json=self._read(
+                "test_block-423cd4d170c53729cf25b4243ea576d1e901d86e26c06d6a7f79815f3fcb9a89-txns.json"
+            ),
+        )
+        self.backend.cache = MemoryCache()
+        blk = self.daemon.block(height=451992)
+        txs = list(blk.transactions)
+        blk2 = self.daemon.block(
+            "423cd4d170c53729cf25b4243ea576d1e901d86e26c06d6a7f79815f3fcb9a89"
+        )
+        self.assertEqual(blk2, blk)
+        self.assertEqual([tx.hash for tx in blk2.transactions], [tx.hash for tx in txs])
+        self.assertEqual(self.daemon.block(height=451992), blk)
+        self.assertEqual(
+            self.backend.on_get_block_hash(451992),
+            "423cd4d170c53729cf25b4243ea576d1e901d86e26c06d6a7f79815f3fcb9a89",
+        )
+        self.assertEqual(len(responses.calls), 2)
+        self.assertEqual(self.backend.cache.stats()["hits"], 9)
+
+    @responses.activate
+    def test_cache_confirmations(self):
+        for i in range(2):
+            responses.add(
+                responses.POST,
+                self.jsonrpc_url,
+                json=self._read("test_headers_2279790_2279799.json"),
+            )
+        responses.add(
+            responses.POST,
+            self.jsonrpc_url,
+            json=self._read("test_on_get_block_hash_2000000.json"),
+        )
+        self.backend.cache = MemoryCache()
+        # the first header has 11 confirmations, the last one 2
+        self.assertEqual(len(self.daemon.headers(2279790, 2279799)), 10)
+        headers = self.daemon.headers(2279790, 2279791)
+        self.assertEqual(len(headers), 2)
+        self.assertEqual(len(responses.calls), 1)
+        # the cached headers are not shared with the caller
+        headers[0]["height"] = 0
+        self.assertEqual(self.daemon.headers(2279790, 2279790)[0]["height"], 2279790)
+        self.assertEqual(len(self.daemon.headers(2279790, 2279799)), 10)
+        self.assertEqual(len(responses.calls), 2)
+        self.backend.on_get_block_hash(2000000)
+        self.backend.on_get_block_hash(2000000)
+        self.assertEqual(len(responses.calls), 3)
+        self.assertIsNone(JSONRPCDaemon().cache)
+        self.assertIsInstance(JSONRPCDaemon(cache=True).cache, MemoryCache)
+
     @responses.activate
     def test_transactions(self):
         responses.add(
@@ -277,6 +411,265 @@ class JSONRPCDaemonTestCase(JSONTestCase):
         self.assertEqual(len(blk.transactions), 105)
         self.assertEqual(len(set(blk.transactions)), 105)
 
+    @responses.activate
+    def test_chunking_parallel(self):
+        chunks = [
+            self._read("test_chunking-20-get_transactions_1of2.json"),
+            self._read("test_chunking-20-get_transactions_2of2.json"),
+        ]
+
+        def get_transactions(request):
+            first = json.loads(request.body)["txs_hashes"][0]
+            for chunk in chunks:
+                if chunk["txs"][0]["tx_hash"] == first:
+                    return 200, {}, json.dumps(chunk)
+
+        responses.add(
+            responses.POST,
+            self.jsonrpc_url,
+            json=self._read("test_chunking-10-block-693324.json"),
+            status=200,
+        )
+        responses.add_callback(
+            responses.POST, self.transactions_url, callback=get_transactions
+        )
+        daemon = Daemon(JSONRPCDaemon(transactions_workers=4))
+        blk = daemon.block(height=693324)
+        self.assertEqual(len(blk.transactions), 105)
+        self.assertEqual(
+            [tx.hash for tx in blk.transactions],
+            [tx["tx_hash"] for chunk in chunks for tx in chunk["txs"]],
+        )
+        with self.assertRaises(ValueError):
+            JSONRPCDaemon(transactions_workers=0)
+
+    @responses.activate
+    def test_chunking_unrestricted(self):
+        chunks = [
+            self._read("test_chunking-20-get_transactions_1of2.json"),
+            self._read("test_chunking-20-get_transactions_2of2.json"),
+        ]
+        txs = chunks[0]
+        txs["txs"].extend(chunks[1]["txs"])
+        txs["txs_as_json"].extend(chunks[1]["txs_as_json"])
+        responses.add(
+            responses.POST,
+            self.jsonrpc_url,
+            json=self._read("test_chunking-10-block-693324.json"),
+            status=200,
+        )
+        responses.add(
+            responses.POST,
+            self.jsonrpc_url,
+            json=self._read("test_sync_info.json"),
+            status=200,
+        )
+        responses.add(responses.POST, self.transactions_url, json=txs, status=200)
+        daemon = Daemon(JSONRPCDaemon(transactions_chunk_size=None))
+        blk = daemon.block(height=693324)
+        self.assertEqual(len(list(blk.transactions)), 105)
+        self.assertEqual(len(responses.calls), 3)
+
+    @responses.activate
+    def test_batch(self):
+        header = self._read("test_get_block_header_by_height_2288495.json")
+        blkhash = self._read("test_on_get_block_hash_2000000.json")
+
+        def batch(request):
+            calls = json.loads(request.body)
+            self.assertEqual([c["id"] for c in calls], [0, 1, 2, 3])
+            rsps = [
+                dict(blkhash, id=calls[0]["id"]),
+                dict(header, id=calls[1]["id"]),
+                {
+                    "id": calls[2]["id"],
+                    "jsonrpc": "2.0",
+                    "error": {"code": -2, "message": "Too big height"},
+                },
+                {
+                    "id": calls[3]["id"],
+                    "jsonrpc": "2.0",
+                    "result": {"status": "OK", "untrusted": False},
+                },
+            ]
+            # the responses may come in any order
+            return 200, {}, json.dumps(rsps[::-1])
+
+        responses.add_callback(responses.POST, self.jsonrpc_url, callback=batch)
+        with self.backend.batch() as b:
+            h = b.on_get_block_hash(2000000)
+            hdr = b.get_block_header_by_height(2288495)
+            err = b.call("get_block_header_by_height", {"height": 10**9})
+            bans = b.get_bans()
+            self.assertEqual(len(b), 4)
+            with self.assertRaises(RuntimeError):
+                h.result
+            with self.assertRaises(ValueError):
+                b.get_block_header_by_height(-1)
+            with self.assertRaises(TypeError):
+                b.get_bans(1)
+            # errors of the argument validation are raised unchanged
+            with self.assertRaises(TypeError):
+                b.get_fee_estimate("1")
+            with self.assertRaises(ValueError):
+                b.get_height()
+            with self.assertRaises(ValueError):
+                b.block(height=1)
+            with self.assertRaises(AttributeError):
+                b.no_such_method()
+            self.assertEqual(len(b), 4)
+        self.assertEqual(len(responses.calls), 1)
+        self.assertEqual(
+            h.result, "dc2ef85b049311814742f543469e3ec1b8d589e68434d9f220ce41072c69c39e"
+        )
+        self.assertEqual(hdr.result["block_header"]["height"], 2288495)
+        self.assertIsNone(hdr.error)
+        self.assertIsInstance(err.error, RPCError)
+        with self.assertRaises(RPCError):
+            err.result
+        # the result is processed like get_bans() does
+        self.assertEqual(bans.result["bans"], [])
+
+    @responses.activate
+    def test_batch_not_supported(self):
+        responses.add(
+            responses.POST,
+            self.jsonrpc_url,
+            json={
+                "id": 0,
+                "jsonrpc": "2.0",
+                "error": {"code": -32600, "message": "Invalid Request"},
+            },
+            status=200,
+        )
+        with self.assertRaises(RPCError):
+            with self.backend.batch() as b:
+                b.on_get_block_hash(2000000)
+
+    @responses.activate
+    def test_get_blocks_by_height_bin(self):
+        responses.add(
+            responses.POST,
+            "http://127.0.0.1:18081/get_blocks_by_height.bin",
+            body=self._read_hex("test_get_blocks_by_height_bin_451992.hex"),
+            status=200,
+        )
+        res = self.backend.get_blocks_by_height_bin([451992])
+        self.assertEqual(
+            portable_storage.loads(responses.calls[0].request.body),
+            {"heights": [451992]},
+        )
+        self.assertEqual(res["status"], "OK")
+        self.assertEqual(len(res["blocks"]), 1)
+        blk = res["blocks"][0]
+        self.assertEqual(len(blk["block"]), 257)
+        self.assertEqual(len(blk["txs"]), 4)
+        self.assertEqual(len(blk["txs"][0]), 1769)
+        with self.assertRaises(ValueError):
+            self.backend.get_blocks_by_height_bin([-1])
+
+    @responses.activate
+    def test_blocks(self):
+        responses.add(
+            responses.POST,
+            "http://127.0.0.1:18081/get_blocks_by_height.bin",
+            body=self._read_hex("test_get_blocks_by_height_bin_451992.hex"),
+            status=200,
+        )
+        responses.add(
+            responses.POST,
+            "http://127.0.0.1:18081/get_blocks_by_height.bin",
+            body=portable_storage.dumps({"status": "OK"}),
+            status=200,
+        )
+        header = self._read(
+            "test_block-423cd4d170c53729cf25b4243ea576d1e901d86e26c06d6a7f79815f3fcb9a89.json"
+        )["result"]["block_header"]
+        txs = self._read(
+            "test_block-423cd4d170c53729cf25b4243ea576d1e901d86e26c06d6a7f79815f3fcb9a89-txns.json"
+        )["txs"]
+        blocks = self.daemon.blocks([451992])
+        self.assertEqual(len(blocks), 1)
+        blk = blocks[0]
+        self.assertEqual(blk.hash, header["hash"])
+        self.assertEqual(blk.height, 451992)
+        self.assertEqual(blk.prev_hash, header["prev_hash"])
+        self.assertEqual(blk.nonce, header["nonce"])
+        self.assertEqual(
+            blk.version, (header["major_version"], header["minor_version"])
+        )
+        self.assertEqual(blk.reward, from_atomic(header["reward"]))
+        self.assertEqual(
+            [tx.hash for tx in blk.transactions], [tx["tx_hash"] for tx in txs]
+        )
+        self.assertTrue(blk.transactions[0].is_coinbase)
+        for tx, txdata in zip(blk.transactions[1:], txs[1:]):
+            self.assertEqual(tx.blob.hex(), txdata["as_hex"])
+            self.assertEqual(tx.compute_hash(), tx.hash)
+            self.assertEqual(tx.height, 451992)
+        self.assertIsNone(blk.transactions[1].output_indices)
+        with self.assertRaises(BackendException):
+            self.daemon.blocks([451992])
+
+    @responses.activate
+    def test_get_hashes_bin(self):
+        responses.add(
+            responses.POST,
+            "http://127.0.0.1:18081/get_hashes.bin",
+            body=self._read_hex("test_get_hashes_bin_451991.hex"),
+            status=200,
+        )
+        res = self.backend.get_hashes_bin(
+            ["51f6816891b6a7adedd0f1ad57a846eada1baac476421aa9d32d0630ce3dce41"]
+        )
+        self.assertEqual(
+            portable_storage.loads(responses.calls[0].request.body)["block_ids"],
+            bytes.fromhex(
+                "51f6816891b6a7adedd0f1ad57a846eada1baac476421aa9d32d0630ce3dce41"
+            ),
+        )
+        self.assertEqual(res["start_height"], 451991)
+        self.assertEqual(
+            res["m_block_ids"],
+            [
+                "51f6816891b6a7adedd0f1ad57a846eada1baac476421aa9d32d0630ce3dce41",
+                "423cd4d170c53729cf25b4243ea576d1e901d86e26c06d6a7f79815f3fcb9a89",
+            ],
+        )
+        with self.assertRaises(ValueError):
+            self.backend.get_hashes_bin(["abcd"])
+
+    @responses.activate
+    def test_get_o_indexes_bin(self):
+        responses.add(
+            responses.POST,
+            "http://127.0.0.1:18081/get_o_indexes.bin",
+            body=self._read_hex("test_get_o_indexes_bin_7e5fea.hex"),
+            status=200,
+        )
+        responses.add(
+            responses.POST,
+            "http://127.0.0.1:18081/get_o_indexes.bin",
+            body=portable_storage.dumps({"status": "Failed"}),
+            status=200,
+        )
+        responses.add(
+            responses.POST,
+            "http://127.0.0.1:18081/get_o_indexes.bin",
+            body=b"not portable storage",
+            status=200,
+        )
+        txid = "7e5fea8470c5771315bab4b3c77493d2ff534f5201c7c6b2bab069cb7d21ce7b"
+        res = self.backend.get_o_indexes_bin(txid)
+        self.assertEqual(res["o_indexes"], [2100602, 2100603])
+        self.assertEqual(res["status"], "OK")
+        res = self.backend.get_o_indexes_bin(txid)
+        self.assertEqual(res, {"o_indexes": [], "status": "Failed"})
+        with self.assertRaises(RPCError):
+            self.backend.get_o_indexes_bin(txid)
+        with self.assertRaises(ValueError):
+            self.backend.get_o_indexes_bin("invalid")
+
     @responses.activate
     def test_headers(self):
         responses.add(
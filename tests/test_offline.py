@@ -1,5 +1,7 @@
+from binascii import unhexlify
 import unittest
 
+from monero.address import address
 from monero.backends.offline import OfflineWallet, WalletIsOffline
 from monero.wallet import Wallet
 from .base import JSONTestCase
@@ -62,6 +64,36 @@ class SubaddrTest(object):
                 minor += 1
             major += 1
 
+    def test_get_addresses(self):
+        subaddrs = self._read("{}-subaddrs.json".format(self.net))
+        for major, acc in enumerate(subaddrs):
+            addrs = self.wallet.get_addresses(major, range(len(acc)))
+            self.assertEqual(list(addrs), acc)
+        addrs = self.wallet.get_addresses(
+            1, range(len(subaddrs[1])), workers=2, chunk_size=2
+        )
+        self.assertEqual(list(addrs), subaddrs[1])
+        self.assertEqual(
+            list(self.wallet.get_addresses(0, [2, 0])), [subaddrs[0][2], subaddrs[0][0]]
+        )
+        self.assertRaises(ValueError, self.wallet.get_addresses, 0, [1, 2**32])
+        self.assertRaises(ValueError, self.wallet.get_addresses, -1, range(2))
+
+    def test_subaddress_table(self):
+        subaddrs = self._read("{}-subaddrs.json".format(self.net))
+        table = self.wallet.subaddress_table(
+            accounts=len(subaddrs), addresses=max(map(len, subaddrs))
+        )
+        self.assertEqual(len(table), sum(map(len, subaddrs)))
+        self.assertIs(table, self.wallet.subaddress_table(accounts=1, addresses=1))
+        for major, acc in enumerate(subaddrs):
+            for minor, subaddr in enumerate(acc):
+                psk = unhexlify(address(subaddr).spend_key())
+                self.assertIn(psk, table)
+                self.assertEqual(table.index(psk), (major, minor))
+                self.assertEqual(table.address(psk), subaddr)
+        self.assertIsNone(table.index(b"\0" * 32))
+
 
 class AddressTestCase(SubaddrTest, JSONTestCase):
     addr = "47ewoP19TN7JEEnFKUJHAYhGxkeTRH82sf36giEp9AcNfDBfkAtRLX7A6rZz18bbNHPNV7ex6WYbMN3aKisFRJZ8Ebsmgef"
@@ -1,6 +1,9 @@
 from decimal import Decimal
 import json
 import responses
+from unittest.mock import patch
+
+from monero import ed25519
 
 from monero.backends.jsonrpc import JSONRPCDaemon, JSONRPCWallet
 from monero.backends.offline import OfflineWallet
@@ -256,6 +259,103 @@ class OutputTestCase(OutputTestBase):
                 f"Output {n} contains a payment with incorrect ecdhInfo",
             )
 
+    @responses.activate
+    def test_shared_secret_per_tx_key(self):
+        responses.add(
+            responses.POST,
+            self.wallet_jsonrpc_url,
+            json=self._read("test_multiple_outputs-wallet-00-get_accounts.json"),
+            status=200,
+        )
+        responses.add(
+            responses.POST,
+            self.wallet_jsonrpc_url,
+            json=self._read("test_multiple_outputs-wallet-01-query_key.json"),
+            status=200,
+        )
+        responses.add(
+            responses.POST,
+            self.wallet_jsonrpc_url,
+            json=self._read("test_multiple_outputs-wallet-02-addresses-account-0.json"),
+            status=200,
+        )
+        responses.add(
+            responses.POST,
+            self.wallet_jsonrpc_url,
+            json=self._read("test_multiple_outputs-wallet-02-addresses-account-1.json"),
+            status=200,
+        )
+        wallet = Wallet(JSONRPCWallet(host="127.0.0.1", port=38083))
+        txdata = self._read("test_multiple_outputs-daemon-00-get_transactions.json")
+        tx = Transaction(
+            hash=txdata["txs"][0]["tx_hash"],
+            json=json.loads(txdata["txs"][0]["as_json"]),
+        )
+        with patch.object(
+            ed25519, "scalarmult", wraps=ed25519.scalarmult
+        ) as scalarmult, patch.object(
+            ed25519, "scalarmult_B", wraps=ed25519.scalarmult_B
+        ) as scalarmult_B:
+            outs = tx.outputs(wallet=wallet)
+        payments = [out.payment for out in outs if out.payment]
+        self.assertEqual(len(payments), 4)
+        # one derivation per tx key, then one amount commitment check per payment
+        self.assertEqual(scalarmult.call_count, len(tx.pubkeys) + len(payments))
+        # at most one Hs*G per output and tx key, then one commitment mask per payment
+        self.assertLessEqual(
+            scalarmult_B.call_count,
+            len(outs) * len(tx.pubkeys) + len(payments),
+        )
+
+    @responses.activate
+    def test_multiple_outputs_subaddress_table(self):
+        responses.add(
+            responses.POST,
+            self.daemon_transactions_url,
+            json=self._read("test_multiple_outputs-daemon-00-get_transactions.json"),
+            status=200,
+        )
+        daemon = Daemon(JSONRPCDaemon(host="127.0.0.1", port=38081))
+        tx = daemon.transactions(
+            "f79a10256859058b3961254a35a97a3d4d5d40e080c6275a3f9779acde73ca8d"
+        )[0]
+        wallet = Wallet(
+            OfflineWallet(
+                address="56eDKfprZtQGfB4y6gVLZx5naKVHw6KEKLDoq2WWtLng9ANuBvsw67wfqyhQECoLmjQN4cKAdvMp2WsC5fnw9seKLcCSfjj",
+                view_key="e507923516f52389eae889b6edc182ada82bb9354fb405abedbe0772a15aea0a",
+            )
+        )
+        table = wallet.subaddress_table(accounts=2, addresses=30)
+        outs = tx.outputs(subaddresses=table)
+        self.assertEqual(len(outs), 5)
+        self.assertIsNone(outs[1].payment)
+        self.assertEqual(outs[0].payment.amount, Decimal(4))
+        self.assertEqual(outs[2].payment.amount, Decimal(1))
+        self.assertEqual(outs[3].payment.amount, Decimal(2))
+        self.assertEqual(outs[4].payment.amount, Decimal(8))
+        self.assertEqual(
+            outs[0].payment.local_address,
+            "76Qt2xMZ3m7b2tagubEgkvG81pwf9P3JYdxR65H2BEv8c79A9pCBTacEFv87tfdcqXRemBsZLFVGHTWbqBpkoBJENBoJJS9",
+        )
+        self.assertEqual(
+            outs[4].payment.local_address,
+            "7BJxHKTa4p5USJ9Z5GY15ZARXL6Qe84qT3FnWkMbSJSoEj9ugGjnpQ1N9H1jqkjsTzLiN5VTbCP8f4MYYVPAcXhr36bHXzP",
+        )
+        # outputs to addresses outside of the table are not recognized
+        table = Wallet(
+            OfflineWallet(
+                address="56eDKfprZtQGfB4y6gVLZx5naKVHw6KEKLDoq2WWtLng9ANuBvsw67wfqyhQECoLmjQN4cKAdvMp2WsC5fnw9seKLcCSfjj",
+                view_key="e507923516f52389eae889b6edc182ada82bb9354fb405abedbe0772a15aea0a",
+            )
+        ).subaddress_table(accounts=1, addresses=23)
+        outs = tx.outputs(subaddresses=table)
+        self.assertIsNone(outs[0].payment)
+        self.assertIsNotNone(outs[2].payment)
+        self.assertIsNotNone(outs[3].payment)
+        self.assertIsNone(outs[4].payment)
+        with self.assertRaises(ValueError):
+            tx.outputs(wallet=wallet, subaddresses=table)
+
     def test_coinbase_no_own_output(self):
         txdata = self._read("test_coinbase_no_own_output-26dcb5.json")
         tx = Transaction(
@@ -455,6 +555,30 @@ class OutputTestCase(OutputTestBase):
         with self.assertRaises(ValueError):
             pdata = ep.parse()
 
+    def test_extra_large(self):
+        pubkey = bytes(range(32))
+        addkeys = [bytes([i % 256]) * 32 for i in range(300)]
+        nonce = b"\xff" * 255
+        extra = (
+            b"\x01"
+            + pubkey
+            + b"\x02\xff"
+            + nonce
+            + b"\x04\xac\x02"  # varint 300
+            + b"".join(addkeys)
+            + b"\x00" * 5
+        )
+        for data in (extra, extra.hex(), list(extra)):
+            pdata = ExtraParser(data).parse()
+            self.assertEqual(pdata["pubkeys"], [pubkey] + addkeys)
+            self.assertEqual(pdata["nonces"], [bytearray(nonce)])
+        with self.assertRaises(ValueError):
+            ExtraParser(extra[:-40]).parse()
+        with self.assertRaises(ValueError):
+            ExtraParser(b"\x02\x10" + nonce[:15]).parse()
+        with self.assertRaises(ValueError):
+            ExtraParser(b"\x04\xac").parse()
+
 
 class ViewtagsTestCase(OutputTestBase):
     @responses.activate
@@ -538,3 +662,58 @@ class ViewtagsTestCase(OutputTestBase):
             outputs[0].payment.local_address,
             "BgnjGyQMqyz8DTRxaAat7oVWBoncUG3PmY5rwf4VBLWY6giSVbEaZec6Ae8w6GK1ZhgfFZnCL4EfXMjL1T5mkRdKKEVqSfC",
         )
+
+    @responses.activate
+    def test_viewtags_from_blobs(self):
+        responses.add(
+            responses.POST,
+            self.wallet_jsonrpc_url,
+            json=self._read("test_viewtags-wallet-00-get_accounts.json"),
+            status=200,
+        )
+        responses.add(
+            responses.POST,
+            self.wallet_jsonrpc_url,
+            json=self._read("test_viewtags-wallet-20-query_key.json"),
+            status=200,
+        )
+        responses.add(
+            responses.POST,
+            self.wallet_jsonrpc_url,
+            json=self._read("test_viewtags-wallet-40-getaddress.json"),
+            status=200,
+        )
+        res = self._read("test_viewtags-daemon-00-get_transactions.json")
+        fees = [
+            Decimal(json.loads(tx["as_json"])["rct_signatures"]["txnFee"]) / 10**12
+            for tx in res["txs"]
+        ]
+        for tx in res["txs"]:
+            tx["as_json"] = ""
+        del res["txs_as_json"]
+        responses.add(
+            responses.POST,
+            self.daemon_transactions_url,
+            json=res,
+            status=200,
+        )
+        wallet = Wallet(JSONRPCWallet(host="127.0.0.1", port=38083))
+        daemon = Daemon(
+            JSONRPCDaemon(host="127.0.0.1", port=38081, decode_as_json=False)
+        )
+        txns = daemon.transactions([tx["tx_hash"] for tx in res["txs"]])
+        self.assertFalse(json.loads(responses.calls[-1].request.body)["decode_as_json"])
+        self.assertEqual([tx.fee for tx in txns], fees)
+        for tx in txns:
+            self.assertIsNone(tx.json)
+            self.assertIsNone(tx.blob)
+            self.assertFalse(tx.is_coinbase)
+        outputs = txns[0].outputs(wallet)
+        self.assertEqual(len(outputs), 2)
+        self.assertIsInstance(outputs[0].payment, Payment)
+        self.assertIsNone(outputs[1].payment)
+        self.assertEqual(outputs[0].payment.amount, Decimal("1.0"))
+        self.assertEqual(
+            outputs[0].payment.local_address,
+            "BgnjGyQMqyz8DTRxaAat7oVWBoncUG3PmY5rwf4VBLWY6giSVbEaZec6Ae8w6GK1ZhgfFZnCL4EfXMjL1T5mkRdKKEVqSfC",
+        )
@@ -0,0 +1,23 @@
+import unittest
+
+from monero.backends.jsonrpc.payload import LogPayload
+
+
+class LogPayloadTestCase(unittest.TestCase):
+    def test_pretty(self):
+        self.assertEqual(
+            str(LogPayload({"b": 1, "a": [2]})),
+            '{\n  "a": [\n    2\n  ],\n  "b": 1\n}',
+        )
+
+    def test_limit(self):
+        data = {"txs": ["ab" * 100]}
+        self.assertEqual(str(LogPayload(data, 1000)), str(LogPayload(data)))
+        text = str(LogPayload(data, 10))
+        self.assertEqual(text, '{\n  "txs":... [215 more characters]')
+
+    def test_formatter(self):
+        self.assertEqual(
+            str(LogPayload({"txid": b"\x00" * 4}, 10, repr)),
+            "{'txid': b... [19 more characters]",
+        )
@@ -0,0 +1,103 @@
+import unittest
+
+from monero import portable_storage
+
+
+class PortableStorageTestCase(unittest.TestCase):
+    # {"status": "OK", "height": 300, "heights": [1, 2], "ok": True}
+    data = bytes.fromhex(
+        "011101010101020101"
+        "10"
+        "06737461747573"
+        "0a"
+        "08"
+        "4f4b"
+        "06686569676874"
+        "05"
+        "2c01000000000000"
+        "076865696768747385"
+        "08"
+        "0100000000000000"
+        "0200000000000000"
+        "026f6b"
+        "0b"
+        "01"
+    )
+
+    def test_loads(self):
+        self.assertEqual(
+            portable_storage.loads(self.data),
+            {"status": b"OK", "height": 300, "heights": [1, 2], "ok": True},
+        )
+
+    def test_dumps(self):
+        self.assertEqual(
+            portable_storage.dumps(
+                {"status": "OK", "height": 300, "heights": [1, 2], "ok": True}
+            ),
+            self.data,
+        )
+
+    def test_roundtrip(self):
+        section = {
+            "blob": b"\x00" * 100000,
+            "negative": -5,
+            "ratio": 0.25,
+            "empty": b"",
+            "nested": {"objects": [{"a": 1}, {"a": 2, "b": [b"x", b"y"]}]},
+        }
+        self.assertEqual(
+            portable_storage.loads(portable_storage.dumps(section)), section
+        )
+        self.assertEqual(portable_storage.loads(portable_storage.dumps({})), {})
+
+    def test_typed_integers(self):
+        # int32 -1, uint16 array [1, 65535], int8 -2, uint8 255, uint32 7
+        data = bytes.fromhex(
+            "011101010101020101"
+            "14"
+            "0161"
+            "02"
+            "ffffffff"
+            "016287"
+            "08"
+            "0100"
+            "ffff"
+            "0163"
+            "04"
+            "fe"
+            "0164"
+            "08"
+            "ff"
+            "0165"
+            "06"
+            "07000000"
+        )
+        self.assertEqual(
+            portable_storage.loads(data),
+            {"a": -1, "b": [1, 65535], "c": -2, "d": 255, "e": 7},
+        )
+
+    def test_varints(self):
+        for size in (0, 63, 64, 16383, 16384, 70000):
+            blob = b"\xff" * size
+            data = portable_storage.dumps({"s": blob})
+            self.assertEqual(portable_storage.loads(data), {"s": blob})
+        # 2-byte length prefix for 64 bytes
+        self.assertEqual(
+            portable_storage.dumps({"s": b"\x00" * 64})[13:15], b"\x01\x01"
+        )
+
+    def test_invalid(self):
+        with self.assertRaises(ValueError):
+            portable_storage.loads(b"\x00" + self.data[1:])
+        with self.assertRaises(ValueError):
+            portable_storage.loads(self.data[:-1])
+        with self.assertRaises(ValueError):
+            portable_storage.loads(self.data + b"\x00")
+        with self.assertRaises(ValueError):
+            portable_storage.loads(self.data[:9] + b"\x04\x01a\x0f")
+        with self.assertRaises(TypeError):
+            portable_storage.dumps({"a": object()})
+        with self.assertRaises(TypeError):
+            portable_storage.dumps({"a": [1, b"x"]})
@@ -0,0 +1,248 @@
+from decimal import Decimal
+import json
+import os
+import shutil
+import tempfile
+
+from monero.address import address
+from monero.backends.offline import OfflineWallet
+from monero.block import Block
+from monero.exceptions import ReorganizationTooDeep
+from monero.scanner import BlockScanner, scan_transactions
+from monero.transaction import Transaction
+from monero.wallet import Wallet
+
+from .base import JSONTestCase
+
+
+class ScannerTestBase(JSONTestCase):
+    data_subdir = "test_outputs"
+    addr = "56eDKfprZtQGfB4y6gVLZx5naKVHw6KEKLDoq2WWtLng9ANuBvsw67wfqyhQECoLmjQN4cKAdvMp2WsC5fnw9seKLcCSfjj"
+    svk = "e507923516f52389eae889b6edc182ada82bb9354fb405abedbe0772a15aea0a"
+
+    def setUp(self):
+        self.txs = []
+        for name in (
+            "test_multiple_outputs-daemon-00-get_transactions.json",
+            "test_v2_single_output-daemon-00-get_transactions.json",
+        ):
+            for tx in self._read(name)["txs"]:
+                self.txs.append(
+                    Transaction(
+                        hash=tx["tx_hash"],
+                        height=tx["block_height"],
+                        output_indices=tx["output_indices"],
+                        json=json.loads(tx["as_json"]),
+                    )
+                )
+        self.txs.append(
+            Transaction(
+                hash="dc08610685b8a55dc7d64454ecbe12868e4e73c766e2d19ee092885a06fc092d",
+                height=518147,
+                json=self._read("test_coinbase_own_output-dc0861.json"),
+            )
+        )
+        self.wallet = Wallet(OfflineWallet(self.addr, view_key=self.svk))
+
+
+class ScanTransactionsTestCase(ScannerTestBase):
+    def _check(self, outs):
+        self.assertEqual(len(outs), 6)
+        self.assertEqual(
+            [out.transaction.hash[:6] for out in outs],
+            ["f79a10", "f79a10", "f79a10", "f79a10", "f5aff3", "dc0861"],
+        )
+        self.assertEqual(
+            [out.amount for out in outs],
+            [
+                Decimal(4),
+                Decimal(1),
+                Decimal(2),
+                Decimal(8),
+                Decimal("0.423265845130"),
+                Decimal("13.515927959357"),
+            ],
+        )
+        for out in outs:
+            self.assertEqual(out.amount, out.payment.amount)
+        self.assertEqual(
+            outs[0].payment.local_address,
+            "76Qt2xMZ3m7b2tagubEgkvG81pwf9P3JYdxR65H2BEv8c79A9pCBTacEFv87tfdcqXRemBsZLFVGHTWbqBpkoBJENBoJJS9",
+        )
+        self.assertEqual(outs[4].payment.local_address, self.addr)
+        self.assertEqual(outs[5].payment.local_address, self.addr)
+
+    def test_table_single_process(self):
+        table = self.wallet.subaddress_table(accounts=2, addresses=30)
+        self._check(scan_transactions(self.txs, self.svk, table, workers=1))
+
+    def test_table_process_pool(self):
+        table = self.wallet.subaddress_table(accounts=2, addresses=30)
+        self._check(
+            scan_transactions(self.txs, self.svk, table, workers=2, batch_size=1)
+        )
+
+    def test_addresses(self):
+        table = self.wallet.subaddress_table(accounts=2, addresses=30)
+        addresses = [table.address(psk) for psk in table]
+        self._check(scan_transactions(self.txs, self.svk, addresses, workers=1))
+
+    def test_hex_keys(self):
+        outs = scan_transactions(
+            self.txs, self.svk, [address(self.addr).spend_key()], workers=1
+        )
+        self.assertEqual(len(outs), 2)
+        self.assertEqual(outs[1].transaction.hash[:6], "dc0861")
+        self.assertIsNotNone(outs[1].payment)
+        self.assertIsNone(outs[1].payment.local_address)
+
+    def test_empty(self):
+        self.assertEqual(scan_transactions([], self.svk, [], workers=2), [])
+
+
+class FakeDaemon(object):
+    def __init__(self, blocks):
+        self.blocks = blocks
+        self.fetched = []
+
+    def height(self):
+        return self.blocks[-1].height + 1
+
+    def block(self, bhash=None, height=None):
+        self.fetched.append(height)
+        return self.blocks[height - self.blocks[0].height]
+
+    def headers(self, start_height, end_height=None):
+        return [
+            {"height": blk.height, "hash": blk.hash, "prev_hash": blk.prev_hash}
+            for blk in self.blocks
+            if start_height <= blk.height <= (end_height or start_height)
+        ]
+
+
+class BlockScannerTestCase(ScannerTestBase):
+    def _chain(self, start, length, txs, fork=None, prev_hash=None):
+        blocks = []
+        for height in range(start, start + length):
+            bhash = "{:064x}".format(
+                height if fork is None or height < fork else -height
+            )
+            blocks.append(
+                Block(
+                    hash=bhash,
+                    height=height,
+                    prev_hash=prev_hash or "{:064x}".format(0),
+                    transactions=txs.get(height, []),
+                )
+            )
+            prev_hash = bhash
+        return blocks
+
+    def setUp(self):
+        super(BlockScannerTestCase, self).setUp()
+        self.table = self.wallet.subaddress_table(accounts=2, addresses=30)
+        self.blocktxs = {102: self.txs[:1], 104: self.txs[2:]}
+        self.daemon = FakeDaemon(self._chain(100, 6, self.blocktxs))
+        self.tmpdir = tempfile.mkdtemp()
+        self.checkpoint = os.path.join(self.tmpdir, "checkpoint.json")
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def test_scan(self):
+        scanner = BlockScanner(
+            self.daemon,
+            self.svk,
+            self.table,
+            start_height=100,
+            checkpoint=self.checkpoint,
+            prefetch=2,
+        )
+        outs = list(scanner.scan())
+        self.assertEqual(len(outs), 5)
+        self.assertEqual(
+            [out.transaction.height for out in outs], [519608] * 4 + [518147]
+        )
+        self.assertEqual(outs[4].payment.local_address, self.addr)
+        self.assertEqual(scanner.height, 105)
+        self.assertEqual(self.daemon.fetched, [100, 101, 102, 103, 104, 105])
+        with open(self.checkpoint) as fh:
+            cp = json.load(fh)
+        self.assertEqual(cp["height"], 105)
+        self.assertEqual(cp["hash"], "{:064x}".format(105))
+        # resume from the checkpoint, continue with new blocks
+        self.daemon.blocks.extend(
+            self._chain(106, 2, {}, prev_hash=self.daemon.blocks[-1].hash)
+        )
+        scanner = BlockScanner(
+            self.daemon, self.svk, self.table, checkpoint=self.checkpoint
+        )
+        self.assertEqual(scanner.height, 105)
+        self.assertEqual(list(scanner.scan()), [])
+        self.assertEqual(self.daemon.fetched[6:], [106, 107])
+        self.assertEqual(scanner.height, 107)
+
+    def test_resume_within_batch(self):
+        scanner = BlockScanner(
+            self.daemon,
+            self.svk,
+            self.table,
+            start_height=100,
+            checkpoint=self.checkpoint,
+            prefetch=6,
+        )
+        outs = scanner.scan()
+        next(outs)
+        outs.close()
+        # the block 102 has 3 more outputs
+        self.assertEqual(scanner.height, 101)
+        scanner = BlockScanner(
+            self.daemon, self.svk, self.table, checkpoint=self.checkpoint
+        )
+        outs = scanner.scan()
+        # all outputs of the block 102 and the one of 104
+        for i in range(5):
+            next(outs)
+        outs.close()
+        self.assertEqual(scanner.height, 104)
+        scanner = BlockScanner(
+            self.daemon, self.svk, self.table, checkpoint=self.checkpoint
+        )
+        self.assertEqual(scanner.height, 104)
+        self.assertEqual(list(scanner.scan()), [])
+        self.assertEqual(scanner.height, 105)
+
+    def test_reorg(self):
+        reorgs = []
+        scanner = BlockScanner(
+            self.daemon,
+            self.svk,
+            self.table,
+            start_height=100,
+            prefetch=3,
+            on_reorg=reorgs.append,
+        )
+        self.assertEqual(len(list(scanner.scan())), 5)
+        # blocks from 103 on get replaced, the payment from 104 moves to 106
+        self.daemon.blocks = self._chain(
+            100, 10, {102: self.blocktxs[102], 106: self.blocktxs[104]}, fork=103
+        )
+        outs = list(scanner.scan())
+        self.assertEqual(reorgs, [103])
+        self.assertEqual(len(outs), 1)
+        self.assertEqual(outs[0].payment.local_address, self.addr)
+        self.assertEqual(scanner.height, 109)
+        self.assertEqual(scanner.hash, "{:064x}".format(-109))
+        # nothing is fetched past the orphaned batch
+        self.assertEqual(
+            self.daemon.fetched[6:], [106, 107, 108, 103, 104, 105, 106, 107, 108, 109]
+        )
+
+    def test_reorg_too_deep(self):
+        scanner = BlockScanner(
+            self.daemon, self.svk, self.table, start_height=100, reorg_depth=2
+        )
+        list(scanner.scan())
+        self.daemon.blocks = self._chain(100, 7, {}, fork=101)
+        with self.assertRaises(ReorganizationTooDeep):
+            list(scanner.scan())
@@ -1,8 +1,10 @@
+import subprocess
+import sys
 import unittest
 
 from monero.address import Address
 from monero.seed import Seed
-from monero.wordlists import list_wordlists
+from monero.wordlists import get_wordlist, list_wordlists
 
 
 class SeedTestCase(unittest.TestCase):
@@ -71,6 +73,40 @@ class SeedTestCase(unittest.TestCase):
             Seed("\\x008")
         self.assertEqual(ts.expected, ValueError)
 
+    def test_truncated_words(self):
+        phrase = "wedge going quick racetrack auburn physics lectures light waist axes whipped habitat square awkward together injury niece nugget guarded hive obnoxious waxing faked folding square"
+        truncated = " ".join(w[:3] for w in phrase.split(" "))
+        seed = Seed(truncated)
+        self.assertEqual(
+            seed.hex, "8ffa9f586b86d294d93731765d192765311bddc76a4fa60311f8af36bbf6fb06"
+        )
+        with self.assertRaises(ValueError):
+            Seed(" ".join(["zzz"] + truncated.split(" ")[1:]))
+
+    def test_word_index(self):
+        for name in list_wordlists():
+            wordlist = get_wordlist(name)
+            for i, word in enumerate(wordlist.word_list):
+                self.assertEqual(wordlist.word_index(word), i)
+                self.assertEqual(
+                    wordlist.word_index(word[: wordlist.unique_prefix_length]), i
+                )
+        self.assertRaises(ValueError, get_wordlist("English").word_index, "xyzzy")
+
+    def test_lazy_wordlists(self):
+        loaded = subprocess.check_output(
+            [
+                sys.executable,
+                "-c",
+                "import sys, monero.wallet; "
+                "print(sorted(m for m in sys.modules if 'wordlists.' in m))",
+            ]
+        )
+        self.assertEqual(loaded.strip(), b"['monero.wordlists.wordlist']")
+        self.assertIn("Lojban", list_wordlists())
+        self.assertEqual(get_wordlist("Lojban").english_language_name, "Lojban")
+        self.assertRaises(ValueError, get_wordlist, "Klingon")
+
     def test_keys(self):
         seed = Seed(
             "adjust mugged vaults atlas nasty mews damp toenail suddenly toxic possible "
@@ -1,5 +1,7 @@
+import binascii
 from datetime import datetime
 from decimal import Decimal
+import json
 from operator import attrgetter
 import random
 import unittest
@@ -164,6 +166,64 @@ class FiltersTestCase(unittest.TestCase):
             self.oto1 == self.oto2
 
 
+class LazyDecodingTestCase(unittest.TestCase):
+    def setUp(self):
+        self.json1 = {
+            "version": 2,
+            "unlock_time": 0,
+            "vin": [],
+            "vout": [],
+            "extra": [],
+            "rct_signatures": {"type": 5, "txnFee": 30950000},
+        }
+
+    def test_json_string(self):
+        tx = Transaction(hash="ab" * 32, json=json.dumps(self.json1))
+        self.assertIsInstance(tx._json, str)
+        self.assertEqual(tx.hash, "ab" * 32)
+        self.assertEqual(tx.fee, Decimal("0.00003095"))
+        self.assertEqual(tx.json, self.json1)
+        self.assertIsInstance(tx._json, dict)
+        self.assertEqual(tx.version, 2)
+
+    def test_blob_string(self):
+        # coinbase of version 1
+        blob = "013c01ff800101e80702" + "11" * 32 + "00"
+        tx = Transaction(blob=blob)
+        self.assertIsInstance(tx._blob, str)
+        self.assertEqual(tx.blob, binascii.unhexlify(blob))
+        self.assertEqual(tx.size, 43)
+        self.assertEqual(tx.version, 1)
+        self.assertIsNone(tx.fee)
+        self.assertTrue(tx.is_coinbase)
+        self.assertIsNone(Transaction(blob="").blob)
+
+    def test_given_fee(self):
+        tx = Transaction(fee=Decimal("1"), json=json.dumps(self.json1))
+        self.assertEqual(tx.fee, Decimal("1"))
+        self.assertIsInstance(tx._json, str)
+        self.assertIsNone(Transaction().fee)
+        self.assertIsNone(Transaction().version)
+        # an explicit None isn't replaced with the fee from the contents
+        self.assertIsNone(Transaction(fee=None, json=json.dumps(self.json1)).fee)
+
+    def test_set_version(self):
+        tx = Transaction(json=json.dumps(self.json1))
+        tx.version = 1
+        self.assertEqual(tx.version, 1)
+        tx.version = None
+        self.assertIsNone(tx.version)
+        tx = Transaction()
+        tx.version = 2
+        self.assertEqual(tx.version, 2)
+
+    def test_slots(self):
+        tx = Transaction()
+        with self.assertRaises(AttributeError):
+            tx.nonexistent = 1
+        self.assertFalse(hasattr(tx, "__dict__"))
+
+
 class SortingTestCase(unittest.TestCase):
     def test_sorting(self):
         pmts = [
@@ -0,0 +1,62 @@
+#!/usr/bin/python
+import argparse
+import os
+import time
+
+from monero.transaction.extra import ExtraParser
+
+
+def synthetic_extra(size):
+    """Builds extra of roughly `size` bytes: a tx key, nonces and additional keys."""
+    parts = [b"\x01" + os.urandom(32)]
+    length = 33
+    while length < size // 2:
+        parts.append(b"\x02\xff" + os.urandom(255))
+        length += 257
+    keycount = max(1, (size - length) // 32)
+    count = bytearray()
+    n = keycount
+    while n >= 0x80:
+        count.append((n & 0x7F) | 0x80)
+        n >>= 7
+    count.append(n)
+    parts.append(b"\x04" + bytes(count) + os.urandom(32 * keycount))
+    return b"".join(parts)
+
+
+argsparser = argparse.ArgumentParser(
+    description="Measure ExtraParser speed on large synthetic extra fields"
+)
+argsparser.add_argument(
+    "-s",
+    dest="sizes",
+    type=int,
+    nargs="+",
+    default=[1024, 16384, 65536, 262144, 1048576],
+    help="Sizes of extra fields in bytes",
+)
+argsparser.add_argument(
+    "-n", dest="rounds", type=int, default=5, help="Number of rounds to run"
+)
+args = argsparser.parse_args()
+
+print(
+    "{:>10s} {:>8s} {:>8s} {:>10s} {:>10s}".format(
+        "bytes", "keys", "nonces", "ms", "us/KB"
+    )
+)
+for size in args.sizes:
+    extra = synthetic_extra(size)
+    start = time.time()
+    for _ in range(args.rounds):
+        data = ExtraParser(extra).parse()
+    elapsed = (time.time() - start) / args.rounds
+    print(
+        "{:10d} {:8d} {:8d} {:10.2f} {:10.2f}".format(
+            len(extra),
+            len(data["pubkeys"]),
+            len(data.get("nonces", [])),
+            elapsed * 1000,
+            elapsed * 1e6 / (len(extra) / 1024.0),
+        )
+    )
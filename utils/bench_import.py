@@ -0,0 +1,60 @@
+#!/usr/bin/python
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+PROBE = """
+import sys, time
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+loaded = [
+    m for m in sys.modules
+    if m.startswith("monero.wordlists.") and m != "monero.wordlists.wordlist"
+]
+print(elapsed, len(loaded))
+"""
+
+argsparser = argparse.ArgumentParser(
+    description="Measure the time of importing a module in a fresh interpreter"
+)
+argsparser.add_argument(
+    "modules",
+    nargs="*",
+    default=["monero.wallet", "monero.seed"],
+    help="Modules to import",
+)
+argsparser.add_argument(
+    "-n", dest="rounds", type=int, default=20, help="Number of rounds to run"
+)
+args = argsparser.parse_args()
+
+env = dict(os.environ)
+env["PYTHONPATH"] = os.pathsep.join(
+    [os.path.join(os.path.dirname(__file__), "..")]
+    + ([env["PYTHONPATH"]] if env.get("PYTHONPATH") else [])
+)
+
+print(
+    "{:20s} {:>10s} {:>10s} {:>10s}".format(
+        "module", "median ms", "min ms", "languages"
+    )
+)
+for module in args.modules:
+    times = []
+    for _ in range(args.rounds):
+        out = subprocess.check_output(
+            [sys.executable, "-c", PROBE.format(module=module)], env=env
+        )
+        elapsed, loaded = out.split()
+        times.append(float(elapsed))
+    print(
+        "{:20s} {:10.2f} {:10.2f} {:10d}".format(
+            module,
+            statistics.median(times) * 1000,
+            min(times) * 1000,
+            int(loaded),
+        )
+    )
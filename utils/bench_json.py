@@ -0,0 +1,80 @@
+#!/usr/bin/python
+import argparse
+import glob
+import json
+import os
+import time
+
+from monero.backends.jsonrpc.codec import CODECS, get_codec
+
+
+def nested_documents(doc):
+    """Yields the transactions which the daemon sends as JSON strings inside responses"""
+    if isinstance(doc, dict):
+        for key, value in doc.items():
+            if key in ("as_json", "tx_json") and value:
+                yield value.encode()
+            else:
+                yield from nested_documents(value)
+    elif isinstance(doc, list):
+        for value in doc:
+            yield from nested_documents(value)
+
+
+argsparser = argparse.ArgumentParser(
+    description="Measure the time of JSON decoding per MB of the recorded daemon "
+    "responses with each codec installed"
+)
+argsparser.add_argument(
+    "-d",
+    dest="datadir",
+    type=str,
+    default=os.path.join(
+        os.path.dirname(__file__), "..", "tests", "data", "test_jsonrpcdaemon"
+    ),
+    help="Directory with recorded fixtures",
+)
+argsparser.add_argument(
+    "-n", dest="rounds", type=int, default=20, help="Number of rounds to run"
+)
+args = argsparser.parse_args()
+
+responses = []
+for path in sorted(glob.glob(os.path.join(args.datadir, "*.json"))):
+    with open(path, "rb") as fh:
+        responses.append(fh.read())
+nested = [d for rsp in responses for d in nested_documents(json.loads(rsp))]
+docsets = [("responses", responses), ("nested txs", nested)]
+
+print(
+    "{:10s} {:12s} {:>6s} {:>8s} {:>10s} {:>12s}".format(
+        "codec", "documents", "count", "MB", "ms/MB", "dumps ms/MB"
+    )
+)
+for name in CODECS:
+    try:
+        codec = get_codec(name)
+    except ImportError:
+        print("{:10s} not installed".format(name))
+        continue
+    for label, docs in docsets:
+        size = sum(len(d) for d in docs) / 1e6
+        start = time.perf_counter()
+        for _ in range(args.rounds):
+            decoded = [codec.loads(d) for d in docs]
+        loads = (time.perf_counter() - start) / args.rounds
+        start = time.perf_counter()
+        for _ in range(args.rounds):
+            for d in decoded:
+                codec.dumps(d)
+        dumps = (time.perf_counter() - start) / args.rounds
+        print(
+            "{:10s} {:12s} {:6d} {:8.2f} {:10.2f} {:12.2f}".format(
+                name,
+                label,
+                len(docs),
+                size,
+                loads * 1000 / size,
+                dumps * 1000 / size,
+            )
+        )
@@ -0,0 +1,122 @@
+#!/usr/bin/python
+import argparse
+import glob
+import json
+import os
+import time
+
+from monero import ed25519
+from monero.address import address
+from monero.transaction import Transaction
+
+
+class CountingCall(object):
+    def __init__(self, func):
+        self.func = func
+        self.count = 0
+
+    def __call__(self, *args):
+        self.count += 1
+        return self.func(*args)
+
+
+class FixtureAccount(object):
+    def __init__(self, addresses):
+        self._addresses = addresses
+
+    def addresses(self):
+        return self._addresses
+
+
+class FixtureWallet(object):
+    """A wallet made of recorded RPC responses, just enough for Transaction.outputs()"""
+
+    def __init__(self, view_key, accounts):
+        self._view_key = view_key
+        self.accounts = accounts
+
+    def view_key(self):
+        return self._view_key
+
+
+def read(path):
+    with open(path, "r") as fh:
+        return json.loads(fh.read())
+
+
+def load_fixtures(datadir):
+    for txfile in sorted(glob.glob(os.path.join(datadir, "*-daemon-00-*.json"))):
+        name = os.path.basename(txfile).split("-daemon-")[0]
+        keyfile = glob.glob(os.path.join(datadir, name + "-wallet-*query_key.json"))[0]
+        accounts = []
+        for addrfile in sorted(
+            glob.glob(os.path.join(datadir, name + "-wallet-*address*.json"))
+        ):
+            accounts.append(
+                FixtureAccount(
+                    [
+                        address(a["address"])
+                        for a in read(addrfile)["result"]["addresses"]
+                    ]
+                )
+            )
+        wallet = FixtureWallet(read(keyfile)["result"]["key"], accounts)
+        txs = [
+            Transaction(hash=tx["tx_hash"], json=json.loads(tx["as_json"]))
+            for tx in read(txfile)["txs"]
+        ]
+        yield name, wallet, txs
+
+
+argsparser = argparse.ArgumentParser(
+    description="Measure curve operations and time of output recognition "
+    "on the recorded test fixtures"
+)
+argsparser.add_argument(
+    "-d",
+    dest="datadir",
+    type=str,
+    default=os.path.join(
+        os.path.dirname(__file__), "..", "tests", "data", "test_outputs"
+    ),
+    help="Directory with recorded fixtures",
+)
+argsparser.add_argument(
+    "-n", dest="rounds", type=int, default=10, help="Number of rounds to run"
+)
+args = argsparser.parse_args()
+
+counters = {}
+for fname in ("scalarmult", "scalarmult_B"):
+    counters[fname] = CountingCall(getattr(ed25519, fname))
+    setattr(ed25519, fname, counters[fname])
+
+print(
+    "{:50s} {:>4s} {:>5s} {:>6s} {:>11s} {:>11s} {:>10s}".format(
+        "fixture", "outs", "addrs", "txkeys", "scalarmult", "naive", "ms/round"
+    )
+)
+for name, wallet, txs in load_fixtures(args.datadir):
+    naddrs = sum(len(acc.addresses()) for acc in wallet.accounts)
+    for counter in counters.values():
+        counter.count = 0
+    start = time.time()
+    for _ in range(args.rounds):
+        for tx in txs:
+            tx.outputs(wallet=wallet)
+    elapsed = (time.time() - start) / args.rounds
+    nouts = sum(len(tx.json["vout"]) for tx in txs)
+    ntxkeys = sum(len(tx.pubkeys) for tx in txs)
+    # the former scanner derived the shared secret for each output, address and tx key
+    naive = sum(len(tx.json["vout"]) * naddrs * len(tx.pubkeys) for tx in txs)
+    print(
+        "{:50s} {:4d} {:5d} {:6d} {:11d} {:11d} {:10.2f}".format(
+            name,
+            nouts,
+            naddrs,
+            ntxkeys,
+            counters["scalarmult"].count // args.rounds,
+            naive,
+            elapsed * 1000,
+        )
+    )
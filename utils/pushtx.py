@@ -67,6 +67,12 @@ d = Daemon(
 for name, blob in blobs:
     logging.debug("Sending {}".format(name))
     tx = Transaction(blob=blob)
+    try:
+        tx.hash = tx.compute_hash()
+        name = "{} ({})".format(name, tx.hash)
+    except ValueError as e:
+        print("{} is not a valid transaction: {}".format(name, e))
+        continue
     try:
         res = d.send_transaction(tx, relay=args.relay)
     except exceptions.TransactionBroadcastError as e: